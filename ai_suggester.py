@@ -1,10 +1,15 @@
 import os
-import requests
+import threading
 from dotenv import load_dotenv
+import metrics
 from matcher import calculate_match_score
+from llm_cache import LLMCache
+from groq_client import GroqAPIError, GroqClient
+from jd_analyzer import STOPWORDS, extract_jd_keywords
+from concurrent.futures import ThreadPoolExecutor
 import json
 from copy import deepcopy
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional
 import re
 
 load_dotenv()
@@ -13,14 +18,104 @@ API_KEY = os.getenv("GROQ_API_KEY")
 MODEL_NAME = "openai/gpt-oss-120b"
 BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
 
+# Identical (model, messages, temperature, response_format) requests are
+# answered from here. Set LLM_CACHE_PATH to add a shared on-disk tier.
+LLM_CACHE = LLMCache(
+    max_entries=int(os.getenv("LLM_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("LLM_CACHE_TTL", "3600")),
+    db_path=os.getenv("LLM_CACHE_PATH") or None,
+)
+
+# Total seconds per completion call, retries and backoff included.
+REQUEST_DEADLINE = float(os.getenv("GROQ_REQUEST_DEADLINE", "60"))
+
+# optimize_resume_for_role progress observer: one dict per round.
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+_client = None
+_client_lock = threading.Lock()
+
 # ------------------- AI Suggestions ------------------- #
+@metrics.timed("llm_suggestions")
 def get_suggestions(resume_text, job_description):
     """Get AI feedback on resume vs job description."""
     try:
         if not API_KEY:
             return "❌ Error: GROQ_API_KEY not found in environment."
 
-        prompt = f"""
+        payload = _suggestions_payload(resume_text, job_description)
+        resp = _post_json(payload, operation="suggestions")
+
+        if "error" in resp:
+            return f"❌ API Error: {resp['error'].get('message', 'Unknown error')}"
+
+        if "choices" not in resp or not resp["choices"]:
+            return "❌ No response from AI model."
+
+        return resp["choices"][0]["message"]["content"].strip()
+
+    except Exception as e:
+        return f"❌ AI Suggestion Failed: {str(e)}"
+
+def stream_suggestions(resume_text, job_description) -> Iterator[str]:
+    """
+    Streaming variant of get_suggestions: yields content deltas as the model
+    produces them. Errors are yielded as a single "❌ ..." message, and a
+    cached completion is yielded in one piece.
+    """
+    if not API_KEY:
+        yield "❌ Error: GROQ_API_KEY not found in environment."
+        return
+
+    payload = _suggestions_payload(resume_text, job_description)
+    cached = LLM_CACHE.get(payload)
+    if cached is not None:
+        metrics.inc("llm_requests_total", operation="suggestions_stream", cache="hit")
+        yield cached["choices"][0]["message"]["content"].strip()
+        return
+
+    parts: List[str] = []
+    metrics.inc("llm_requests_total", operation="suggestions_stream", cache="miss")
+    try:
+        stream = get_client().stream_chat(payload, deadline=REQUEST_DEADLINE)
+        with metrics.timer("llm_stream", operation="suggestions"):
+            for delta in stream:
+                parts.append(delta)
+                yield delta
+    except GeneratorExit:
+        stream.close()  # the consumer went away: cancel the request; not an error
+        raise
+    except GroqAPIError as e:
+        yield f"❌ API Error: {e}"
+        return
+    except Exception as e:
+        yield f"❌ AI Suggestion Failed: {str(e)}"
+        return
+
+    content = "".join(parts)
+    if content.strip():
+        LLM_CACHE.set(payload, {"choices": [{"message": {"role": "assistant", "content": content}}]})
+
+def parse_scores(feedback: str) -> Dict[str, Any]:
+    """
+    Pull the ATS score (out of 100) and match score (out of 10) from the
+    feedback text produced by get_suggestions / stream_suggestions.
+    """
+    scores: Dict[str, Any] = {}
+    for line in (feedback or "").splitlines():
+        # drop "(out of 10)"-style hints so their numbers aren't read as scores
+        clean = re.sub(r"\([^)]*\)", " ", line)
+        low = clean.lower()
+        for key, label in (("ats_score", "ats score"), ("match_score", "match score")):
+            if key in scores or label not in low:
+                continue
+            m = re.search(r"\d+(?:\.\d+)?", clean[low.index(label):])
+            if m:
+                scores[key] = m.group(0)
+    return scores
+
+def _suggestions_payload(resume_text, job_description) -> Dict[str, Any]:
+    prompt = f"""
 You are a helpful AI assistant reviewing a resume for a job application.
 Evaluate the resume against the job description and provide actionable suggestions.
 You should also provide the ATS score of the uploaded resume.
@@ -44,37 +139,35 @@ Give your feedback in the following format:
 Your 2-3 line summary
 """
 
-        payload = {
-            "model": MODEL_NAME,
-            "messages": [
-                {"role": "system", "content": "You are a helpful resume evaluator."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0
-        }
-
-        resp = requests.post(BASE_URL, headers={
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json"
-        }, json=payload).json()
-
-        if "error" in resp:
-            return f"❌ API Error: {resp['error'].get('message', 'Unknown error')}"
-
-        if "choices" not in resp or not resp["choices"]:
-            return "❌ No response from AI model."
-
-        return resp["choices"][0]["message"]["content"].strip()
-
-    except Exception as e:
-        return f"❌ AI Suggestion Failed: {str(e)}"
+    return {
+        "model": MODEL_NAME,
+        "messages": [
+            {"role": "system", "content": "You are a helpful resume evaluator."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0
+    }
 
 # ------------------- Resume Optimization ------------------- #
+@metrics.timed("optimize_resume")
 def optimize_resume_for_role(parsed_resume: Dict[str, Any], job_desc: str,
-                              target_score: int = 90, max_rounds: int = 2) -> Dict[str, Any]:
+                              target_score: int = 90, max_rounds: int = 2,
+                              incremental: bool = False,
+                              progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Rewrite the resume toward `job_desc`. The default mode sends the whole
+    resume each round; `incremental=True` only rewrites the sections the
+    missing keywords belong to (see _optimize_incremental).
+
+    `progress`, if given, is called with {"round", "max_rounds", "score",
+    "missing"} after the initial scoring (round 0) and after every round.
+    """
     if not API_KEY:
         return _coerce_resume_dict(parsed_resume)
 
+    if incremental:
+        return _optimize_incremental(parsed_resume, job_desc, target_score, max_rounds, progress)
+
     # Extract degree & university directly from resume (NO guessing!)
     education_field = parsed_resume.get("education")
     degree_full_form, university_name = detect_degree_and_university(education_field)
@@ -82,8 +175,9 @@ def optimize_resume_for_role(parsed_resume: Dict[str, Any], job_desc: str,
     current_text = _dict_to_plain_text(parsed_resume)
     _, missing_kw, score = calculate_match_score(current_text, job_desc)
     working = deepcopy(parsed_resume)
+    _report_progress(progress, 0, max_rounds, score, missing_kw)
 
-    for _ in range(max_rounds):
+    for round_no in range(1, max_rounds + 1):
         json_schema = _json_schema_prompt(
             missing_kw, target_score, job_desc,
             working, current_text,
@@ -103,32 +197,234 @@ def optimize_resume_for_role(parsed_resume: Dict[str, Any], job_desc: str,
             "response_format": {"type": "json_object"}
         }
 
-        try:
-            resp = _post_json(payload)
-            if "choices" not in resp:
-                break
+        with metrics.timer("optimize_round", mode="full"):
+            try:
+                resp = _post_json(payload, operation="optimize_round")
+                if "choices" not in resp:
+                    break
 
-            raw = resp["choices"][0]["message"]["content"]
-            model_out = _safe_json_loads(_extract_json(raw))
+                raw = resp["choices"][0]["message"]["content"]
+                model_out = _safe_json_loads(_extract_json(raw))
 
-            if not isinstance(model_out, dict):
-                break
+                if not isinstance(model_out, dict):
+                    break
+
+                optimized = _normalize_model_output(model_out, fallback=working)
+                new_text = _dict_to_plain_text(optimized)
+                _, missing_kw, score = calculate_match_score(new_text, job_desc)
+                working = optimized
+                current_text = new_text
+                _report_progress(progress, round_no, max_rounds, score, missing_kw)
 
-            optimized = _normalize_model_output(model_out, fallback=working)
-            new_text = _dict_to_plain_text(optimized)
-            _, missing_kw, score = calculate_match_score(new_text, job_desc)
-            working = optimized
-            current_text = new_text
+                if score >= target_score:
+                    break
 
-            if score >= target_score:
+            except Exception:
                 break
 
-        except Exception:
+    return _coerce_resume_dict(working)
+
+
+# Missing keywords included in a progress report.
+MAX_PROGRESS_KEYWORDS = 20
+
+
+def _report_progress(progress: Optional[ProgressCallback], round_no: int, max_rounds: int,
+                     score: int, missing_kw: List[str]) -> None:
+    if progress is None:
+        return
+    try:
+        progress({"round": round_no, "max_rounds": max_rounds, "score": score,
+                  "missing": sorted(missing_kw)[:MAX_PROGRESS_KEYWORDS]})
+    except Exception:
+        pass  # a broken observer must not abort the optimization
+
+
+# ===== INCREMENTAL OPTIMIZATION =====
+# Parallel section rewrites per round (each is one small completion).
+SECTION_WORKERS = int(os.getenv("OPTIMIZE_SECTION_WORKERS", "4"))
+# Cap on JD lines quoted as context for a single section rewrite.
+MAX_CONTEXT_LINES = 6
+# Shared JD-context terms needed to route a keyword to an experience/project entry.
+MIN_CONTEXT_OVERLAP = 2
+
+_TERM_STRIP = ".,;:!?()[]{}\"'"
+
+
+def _optimize_incremental(parsed_resume: Dict[str, Any], job_desc: str,
+                          target_score: int, max_rounds: int,
+                          progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Route each missing JD keyword to the section it belongs in (skills,
+    one experience entry, one project, else the summary), then send only
+    those sections - with just the JD lines that mention their keywords -
+    as parallel requests and merge the rewrites back into `working`.
+    """
+    degree_full_form, university_name = detect_degree_and_university(parsed_resume.get("education"))
+    working = _coerce_resume_dict(parsed_resume)
+    _, missing_kw, score = calculate_match_score(_dict_to_plain_text(working), job_desc)
+    jd_lines = _jd_lines(job_desc)
+    skill_terms = _jd_skill_terms(job_desc)
+    _report_progress(progress, 0, max_rounds, score, missing_kw)
+
+    for round_no in range(1, max_rounds + 1):
+        if score >= target_score:
+            break
+        plan = _plan_section_rewrites(working, missing_kw, jd_lines, skill_terms)
+        if not plan:
             break
 
+        def rewrite(item):
+            section, keywords = item
+            try:
+                return _rewrite_section(working, section, keywords, jd_lines,
+                                        degree_full_form, university_name)
+            except Exception:
+                return None
+
+        with metrics.timer("optimize_round", mode="incremental"), \
+                ThreadPoolExecutor(max_workers=max(1, min(len(plan), SECTION_WORKERS))) as pool:
+            results = list(pool.map(rewrite, plan.items()))
+
+        changed = False
+        for section, out in zip(plan, results):
+            if isinstance(out, dict):
+                _merge_section(working, section, out)
+                changed = True
+        if not changed:
+            break
+        _, missing_kw, score = calculate_match_score(_dict_to_plain_text(working), job_desc)
+        _report_progress(progress, round_no, max_rounds, score, missing_kw)
+
     return _coerce_resume_dict(working)
 
 
+def _plan_section_rewrites(working: Dict[str, Any], missing_kw: List[str],
+                           jd_lines: List[str], skill_terms: set) -> Dict[tuple, List[str]]:
+    """Map section keys ("skills",) / ("experience", i) / ... to their keywords."""
+    units = [(("experience", i), _term_set(_dict_to_plain_text({"experience": [e]})))
+             for i, e in enumerate(working.get("experience", []))]
+    units += [(("projects", i), _term_set(_dict_to_plain_text({"projects": [p]})))
+              for i, p in enumerate(working.get("projects", []))]
+
+    plan: Dict[tuple, List[str]] = {}
+    for raw in missing_kw:
+        kw = raw.strip(_TERM_STRIP)
+        if not kw or kw in STOPWORDS or not any(c.isalnum() for c in kw):
+            continue
+        # an entry whose text shares JD context with the keyword wins; other
+        # skill-like terms go to skills and the rest to the summary
+        context = _term_set(" ".join(_lines_mentioning(jd_lines, [kw]))) - {kw}
+        target, overlap = None, MIN_CONTEXT_OVERLAP - 1
+        for key, terms in units:
+            n = len(terms & context)
+            if n > overlap:
+                target, overlap = key, n
+        if target is None:
+            target = ("skills",) if kw in skill_terms else ("summary",)
+        plan.setdefault(target, []).append(kw)
+    return plan
+
+
+def _rewrite_section(working: Dict[str, Any], section: tuple, keywords: List[str],
+                     jd_lines: List[str], degree_full_form: str,
+                     university_name: str) -> Any:
+    kind = section[0]
+    if kind == "summary":
+        current: Any = {"summary": working.get("summary", "")}
+        rules = (f'- Summary MUST be EXACTLY 2 sentences in this fixed format:\n'
+                 f'  "Enthusiastic and highly motivated professional with a {degree_full_form} from {university_name}. '
+                 f'Possess strong foundational knowledge in [only two key skills which are mentioned strongly in resume and jd]."')
+        schema = '{"summary": "string"}'
+    elif kind == "skills":
+        current = {"skills": working.get("skills", [])}
+        rules = ("- Return the full skills list: keep the relevant existing skills and add the missing "
+                 "keywords that are skills the candidate plausibly has.")
+        schema = '{"skills": ["string"]}'
+    elif kind == "experience":
+        current = working["experience"][section[1]]
+        rules = "- Keep role, company and duration unchanged; rewrite only the bullet points."
+        schema = '{"details": ["string"]}'
+    else:
+        current = working["projects"][section[1]]
+        rules = ("- Do not change the project name.\n"
+                 "- The project must have exactly 3 bullet points: Objective, Tech Stack, Features.")
+        schema = '{"tech": "string", "details": ["string"]}'
+
+    context = "\n".join(_lines_mentioning(jd_lines, keywords)[:MAX_CONTEXT_LINES])
+    prompt = f"""
+You will rewrite ONE section of a resume for a job description and return STRICT JSON ONLY.
+
+RULES:
+- Keep truthful, no fake experience.
+- Insert these missing keywords naturally where they honestly apply: {", ".join(keywords)}
+{rules}
+- Return ONLY the JSON.
+
+Relevant job description lines:
+{context}
+
+Current section:
+{json.dumps(current, ensure_ascii=False)}
+
+OUTPUT SCHEMA:
+{schema}
+"""
+    payload = {
+        "model": MODEL_NAME,
+        "messages": [
+            {"role": "system",
+             "content": "You are an expert ATS resume writer. Return ONLY valid JSON matching schema."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"}
+    }
+    resp = _post_json(payload, operation="optimize_section")
+    if "choices" not in resp:
+        return None
+    return _safe_json_loads(_extract_json(resp["choices"][0]["message"]["content"]))
+
+
+def _merge_section(working: Dict[str, Any], section: tuple, out: Dict[str, Any]) -> None:
+    kind = section[0]
+    if kind == "summary":
+        working["summary"] = _coerce_string(out.get("summary"), working.get("summary", ""))
+    elif kind == "skills":
+        working["skills"] = _ensure_list(out.get("skills")) or working.get("skills", [])
+    elif kind == "experience":
+        entry = working["experience"][section[1]]
+        details = [_clean_bullet_text(d) for d in _ensure_list(out.get("details"))]
+        entry["details"] = details or entry["details"]
+    else:
+        entry = working["projects"][section[1]]
+        entry["tech"] = _coerce_string(out.get("tech"), entry["tech"])
+        entry["details"] = _ensure_list(out.get("details")) or entry["details"]
+
+
+def _jd_lines(job_desc: str) -> List[str]:
+    parts = re.split(r"[\n.;•\u2022]+", job_desc)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _lines_mentioning(lines: List[str], keywords: List[str]) -> List[str]:
+    out = []
+    for ln in lines:
+        terms = _term_set(ln)
+        if any(k in terms for k in keywords):
+            out.append(ln)
+    return out
+
+
+def _term_set(text: str) -> set:
+    return {t.strip(_TERM_STRIP) for t in text.lower().split()} - STOPWORDS
+
+
+def _jd_skill_terms(job_desc: str) -> set:
+    """Single tokens of the JD's extracted keyword phrases (skill-like terms)."""
+    return {t for kw in extract_jd_keywords(job_desc, top_n=15) for t in _term_set(kw)}
+
+
 # ===== PROMPT BUILDER =====
 def _json_schema_prompt(missing_kw: List[str], target_score: int, job_desc: str,
                         working_dict: Dict[str, Any], current_text: str,
@@ -218,13 +514,34 @@ def detect_degree_and_university(education_field: Any) -> (str, str):
     return degree_name, university_name
 
 
-def _post_json(payload: Dict[str, Any]) -> Dict[str, Any]:
-    headers = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
-    r = requests.post(BASE_URL, headers=headers, json=payload, timeout=60)
-    try:
-        return r.json()
-    except Exception:
-        return {"error": {"message": f"Non-JSON response (status {r.status_code})"}}
+def _post_json(payload: Dict[str, Any], operation: str = "chat") -> Dict[str, Any]:
+    cached = LLM_CACHE.get(payload)
+    if cached is not None:
+        metrics.inc("llm_requests_total", operation=operation, cache="hit")
+        return cached
+
+    metrics.inc("llm_requests_total", operation=operation, cache="miss")
+    with metrics.timer("llm_request", operation=operation):
+        resp = get_client().post_json(payload, deadline=REQUEST_DEADLINE)
+    metrics.record_llm_usage(resp, operation)
+
+    # only successful completions are worth replaying
+    if isinstance(resp, dict) and resp.get("choices") and "error" not in resp:
+        LLM_CACHE.set(payload, resp)
+    return resp
+
+def get_client() -> GroqClient:
+    """Process-wide pooled Groq client, created on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = GroqClient(
+                    API_KEY, BASE_URL,
+                    max_concurrency=int(os.getenv("GROQ_MAX_CONCURRENCY", "8")),
+                    max_retries=int(os.getenv("GROQ_MAX_RETRIES", "4")),
+                )
+    return _client
 
 def _extract_json(s: str) -> str:
     first, last = s.find("{"), s.rfind("}")
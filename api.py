@@ -0,0 +1,251 @@
+# api.py
+"""
+Headless HTTP API for parsing, scoring and AI rewriting (no Streamlit, no Firebase).
+
+Every endpoint accepts either a JSON object or a multipart form. A resume
+can be sent as an uploaded file (multipart "file" field, or JSON
+"file_base64" + "filename"), as text ("resume_text") or, for /optimize, as
+an already parsed dict ("resume"). Handlers are async; the blocking work
+runs in the threadpool so the event loop keeps accepting requests, and the
+NLP pipeline, parse cache and Groq client are created once at startup and
+shared by every request.
+
+Endpoints:
+- GET  /health
+- POST /parse        -> {"filename", "text", "resume"} ("layout": true reads PDFs with pdf_layout)
+- POST /score        -> {"score", "matched", "missing"}
+- POST /keywords     -> {"keywords"}
+- POST /suggestions  -> {"suggestions", "scores"}
+- POST /optimize     -> {"resume"} (or a .docx/.pdf file with "format")
+- POST /jobs/optimize -> {"job_id"} (runs in the background, see jobs.py)
+- GET  /jobs/{job_id} -> job record with per-round progress
+- GET  /metrics      -> Prometheus text (METRICS_ENABLED=1, see metrics.py)
+
+Run:
+    uvicorn api:app --host 0.0.0.0 --port 8000 --workers 4
+"""
+
+import base64
+import binascii
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+import metrics
+from ai_suggester import API_KEY, get_client, get_suggestions, optimize_resume_for_role, parse_scores
+from ingest import ingest_resume
+from jd_analyzer import extract_jd_keywords
+from jobs import JobQueueFull, get_job_queue
+from matcher import calculate_match_score
+from nlp_pipeline import get_nlp, get_tokenizer
+from parse_cache import ParseCache
+from pdf_renderer import build_pdf_resume
+from resume_paser import parse_resume_text
+from template_filler import build_template_resume
+
+# Parsed uploads are reused across requests (and processes) when set.
+PARSE_CACHE = ParseCache(os.getenv("PARSE_CACHE_PATH")) if os.getenv("PARSE_CACHE_PATH") else None
+
+# format -> (renderer, media type, extension) for /optimize file output
+DOCUMENT_FORMATS = {
+    "docx": (build_template_resume,
+             "application/vnd.openxmlformats-officedocument.wordprocessingml.document", ".docx"),
+    "pdf": (build_pdf_resume, "application/pdf", ".pdf"),
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # warm the shared state before the first request instead of during it
+    await run_in_threadpool(get_nlp)
+    try:
+        await run_in_threadpool(get_tokenizer)
+    except ImportError:
+        pass  # spaCy not installed: the API endpoints do not need it
+    if API_KEY:
+        get_client()
+    metrics.start_exporters_from_env()
+    yield
+
+
+app = FastAPI(title="Resume Ranker API", lifespan=lifespan)
+
+
+@app.get("/health")
+async def health() -> Dict[str, Any]:
+    return {"status": "ok", "nlp_model": get_nlp() is not None, "llm": bool(API_KEY)}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint() -> str:
+    return metrics.prometheus_text()
+
+
+@app.post("/parse")
+async def parse(request: Request) -> Dict[str, Any]:
+    fields, upload = await _read_input(request)
+    if upload is None:
+        raise HTTPException(400, "Send the resume as 'file' (multipart) or 'file_base64' + 'filename'")
+    filename, file_bytes = upload
+    doc = await run_in_threadpool(ingest_resume, file_bytes, filename, PARSE_CACHE,
+                                  layout=_bool_field(fields, "layout"))
+    return {"filename": doc.filename, "text": doc.text, "resume": doc.parsed}
+
+
+@app.post("/score")
+async def score(request: Request) -> Dict[str, Any]:
+    fields, upload = await _read_input(request)
+    resume_text = await _resume_text(fields, upload)
+    job_description = _required(fields, "job_description")
+    matched, missing, value = calculate_match_score(resume_text, job_description)
+    return {"score": value, "matched": sorted(matched), "missing": sorted(missing)}
+
+
+@app.post("/keywords")
+async def keywords(request: Request) -> Dict[str, Any]:
+    fields, _ = await _read_input(request)
+    job_description = _required(fields, "job_description")
+    top_n = _int_field(fields, "top_n", 25)
+    return {"keywords": await run_in_threadpool(extract_jd_keywords, job_description, top_n)}
+
+
+@app.post("/suggestions")
+async def suggestions(request: Request) -> Dict[str, Any]:
+    fields, upload = await _read_input(request)
+    resume_text = await _resume_text(fields, upload)
+    job_description = _required(fields, "job_description")
+    feedback = await run_in_threadpool(get_suggestions, resume_text, job_description)
+    if feedback.startswith("❌"):
+        raise HTTPException(502, feedback.lstrip("❌ "))
+    return {"suggestions": feedback, "scores": parse_scores(feedback)}
+
+
+@app.post("/optimize")
+async def optimize(request: Request):
+    fields, upload = await _read_input(request)
+    job_description = _required(fields, "job_description")
+    fmt = str(fields.get("format") or "json").lower()
+    if fmt != "json" and fmt not in DOCUMENT_FORMATS:
+        raise HTTPException(400, f"Unknown format '{fmt}'. Choose from: json, {', '.join(DOCUMENT_FORMATS)}")
+
+    resume = await _resume_dict(fields, upload)
+    optimized = await run_in_threadpool(
+        optimize_resume_for_role, resume, job_description,
+        _int_field(fields, "target_score", 90),
+        _int_field(fields, "max_rounds", 2),
+        _bool_field(fields, "incremental"),
+    )
+    if fmt == "json":
+        return {"resume": optimized}
+
+    render, media_type, extension = DOCUMENT_FORMATS[fmt]
+    buffer = await run_in_threadpool(render, optimized)
+    return Response(buffer.getvalue(), media_type=media_type,
+                    headers={"Content-Disposition": f'attachment; filename="optimized_resume{extension}"'})
+
+
+@app.post("/jobs/optimize", status_code=202)
+async def submit_optimize_job(request: Request) -> Dict[str, Any]:
+    fields, upload = await _read_input(request)
+    job_description = _required(fields, "job_description")
+    resume = await _resume_dict(fields, upload)
+    try:
+        # the submit persists the job to SQLite; keep that off the event loop
+        job_id = await run_in_threadpool(
+            get_job_queue().submit_optimization, resume, job_description,
+            target_score=_int_field(fields, "target_score", 90),
+            max_rounds=_int_field(fields, "max_rounds", 2),
+            incremental=_bool_field(fields, "incremental"),
+        )
+    except JobQueueFull as e:
+        raise HTTPException(503, str(e))
+    return {"job_id": job_id}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> Dict[str, Any]:
+    job = await run_in_threadpool(get_job_queue().get, job_id)
+    if job is None:
+        raise HTTPException(404, "Unknown job")
+    return job
+
+
+# ------------------- Request helpers ------------------- #
+async def _read_input(request: Request) -> Tuple[Dict[str, Any], Optional[Tuple[str, bytes]]]:
+    """(fields, (filename, bytes) or None) from a JSON body or a form."""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith(("multipart/form-data", "application/x-www-form-urlencoded")):
+        form = await request.form()
+        fields: Dict[str, Any] = {}
+        upload = None
+        for key, value in form.multi_items():
+            if hasattr(value, "read"):
+                upload = (value.filename or key, await value.read())
+            else:
+                fields[key] = value
+        return fields, upload
+
+    try:
+        fields = await request.json()
+    except ValueError:
+        raise HTTPException(400, "Expected a JSON object or a multipart form")
+    if not isinstance(fields, dict):
+        raise HTTPException(400, "Expected a JSON object")
+    if fields.get("file_base64"):
+        try:
+            file_bytes = base64.b64decode(fields["file_base64"], validate=True)
+        except (binascii.Error, TypeError):
+            raise HTTPException(400, "'file_base64' is not valid base64")
+        return fields, (str(fields.get("filename") or ""), file_bytes)
+    return fields, None
+
+
+async def _resume_text(fields: Dict[str, Any], upload: Optional[Tuple[str, bytes]]) -> str:
+    if upload is not None:
+        doc = await run_in_threadpool(ingest_resume, upload[1], upload[0], PARSE_CACHE)
+        return doc.text
+    return _required(fields, "resume_text")
+
+
+async def _resume_dict(fields: Dict[str, Any], upload: Optional[Tuple[str, bytes]]) -> Dict[str, Any]:
+    resume = fields.get("resume")
+    if isinstance(resume, dict):
+        return resume
+    if upload is not None:
+        doc = await run_in_threadpool(ingest_resume, upload[1], upload[0], PARSE_CACHE)
+        return doc.parsed
+    return await run_in_threadpool(parse_resume_text, await _resume_text(fields, None))
+
+
+def _required(fields: Dict[str, Any], name: str) -> str:
+    value = fields.get(name)
+    if not isinstance(value, str) or not value.strip():
+        raise HTTPException(400, f"'{name}' is required")
+    return value
+
+
+def _int_field(fields: Dict[str, Any], name: str, default: int) -> int:
+    value = fields.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HTTPException(400, f"'{name}' must be an integer")
+
+
+def _bool_field(fields: Dict[str, Any], name: str) -> bool:
+    value = fields.get(name)
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("api:app", host=os.getenv("API_HOST", "0.0.0.0"), port=int(os.getenv("API_PORT", "8000")))
@@ -1,16 +1,21 @@
 import streamlit as st
-from ai_suggester import get_suggestions, optimize_resume_for_role
+from ai_suggester import API_KEY, get_client, stream_suggestions, parse_scores
 from matcher import calculate_match_score
 import fitz  # PyMuPDF
 from dotenv import load_dotenv
 import firebase_admin
 from firebase_admin import credentials, auth as admin_auth, firestore
-from resume_paser import parse_resume_auto
+from ingest import ingest_resume
+from jobs import JobQueueFull, get_job_queue
+import metrics
+from profiling import profile_request
+from parse_cache import ParseCache, content_key
 from jd_analyzer import extract_jd_keywords, format_keyword_prompt
 import os
+import time
 from io import BytesIO
-from cleaner import extract_text_from_pdf
 from template_filler import build_template_resume
+from pdf_renderer import build_pdf_resume
 
 # ---------------- CONFIG ---------------- #
 st.set_page_config(page_title="Resume Ranker", layout="centered", page_icon="📄")
@@ -58,10 +63,14 @@ st.markdown("""
 # ---------------- FIREBASE AUTH + DB ---------------- #
 FIREBASE_JSON_PATH = "resume-ranker-auth-firebase-adminsdk-fbsvc-16ac3f1d73.json"
 
-if not firebase_admin._apps:
-    cred = credentials.Certificate(FIREBASE_JSON_PATH)
-    firebase_admin.initialize_app(cred)
-db = firestore.client()
+@st.cache_resource(show_spinner=False)
+def get_firestore_client():
+    if not firebase_admin._apps:
+        cred = credentials.Certificate(FIREBASE_JSON_PATH)
+        firebase_admin.initialize_app(cred)
+    return firestore.client()
+
+db = get_firestore_client()
 
 def verify_token(id_token):
     try:
@@ -91,6 +100,42 @@ if st.sidebar.button("Logout"):
 
 # ---------------- MAIN ---------------- #
 load_dotenv()
+
+# ---------------- CACHED RESOURCES / WORK ---------------- #
+# Streamlit reruns this script on every interaction: shared clients are
+# created once per process, and parsing / optimization are memoized on the
+# upload's content hash (+ the job description) across reruns and users.
+@st.cache_resource(show_spinner=False)
+def get_parse_cache():
+    # Optional persistent parse cache: set PARSE_CACHE_PATH to a SQLite file.
+    return ParseCache(os.environ["PARSE_CACHE_PATH"]) if os.getenv("PARSE_CACHE_PATH") else None
+
+@st.cache_resource(show_spinner=False)
+def start_metrics_exporters():
+    # METRICS_ENABLED=1 plus METRICS_PORT and/or METRICS_JSONL_PATH
+    metrics.start_exporters_from_env()
+    return True
+
+@st.cache_resource(show_spinner=False)
+def get_groq_client():
+    return get_client() if API_KEY else None
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def parse_upload(file_key, filename, _file_bytes):
+    # keyed on file_key only: the bytes themselves are not hashed per rerun
+    with profile_request("parse_upload", file_bytes=_file_bytes, filename=filename):
+        resume_doc = ingest_resume(_file_bytes, filename, cache=get_parse_cache())
+    return resume_doc.text, resume_doc.parsed
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def render_documents(job_id, _optimized_data):
+    return build_template_resume(_optimized_data).getvalue(), build_pdf_resume(_optimized_data).getvalue()
+
+# Seconds between reruns while an optimization job is in progress.
+JOB_POLL_INTERVAL = 1.0
+
+get_groq_client()
+start_metrics_exporters()
 st.markdown("<div class='glass-card'>", unsafe_allow_html=True)
 st.title("📄 Resume Ranker")
 st.markdown("Upload your resume and paste the job description to get instant ATS score & AI suggestions.")
@@ -99,55 +144,48 @@ resume_file = st.file_uploader("📄 Upload Your Resume (PDF)", type=["pdf"])
 job_desc_input = st.text_area("🧾 Paste Job Description", height=200)
 
 if resume_file and job_desc_input.strip():
-    raw_bytes = resume_file.read()
-    resume_text = extract_text_from_pdf(raw_bytes)
-    parsed_resume = parse_resume_auto(raw_bytes, getattr(resume_file, "name", "resume.pdf"))
-    st.session_state.resume_text = resume_text
-    st.session_state.parsed_resume = parsed_resume
+    # parse once per unique upload; later reruns reuse the session copy
+    if st.session_state.get("upload_id") != resume_file.file_id:
+        raw_bytes = resume_file.getvalue()
+        filename = getattr(resume_file, "name", "resume.pdf")
+        file_key = content_key(raw_bytes, filename)
+        st.session_state.resume_text, st.session_state.parsed_resume = parse_upload(file_key, filename, raw_bytes)
+        st.session_state.file_key = file_key
+        st.session_state.upload_id = resume_file.file_id
+        # suggestions and the optimization job belonged to the previous upload
+        st.session_state.pop("show_transform_button", None)
+        st.session_state.pop("optimize_job_id", None)
+    if st.session_state.get("job_desc") != job_desc_input:
+        st.session_state.pop("show_transform_button", None)
+        st.session_state.pop("optimize_job_id", None)
     st.session_state.job_desc = job_desc_input
     st.success("✅ Resume and Job Description uploaded successfully!")
 
 # --- AI Suggestions ---
 if "resume_text" in st.session_state and st.button("🔍 Get AI Suggestions"):
-    result = get_suggestions(
-        st.session_state.resume_text,
-        st.session_state.job_desc
-    )
-
-    if isinstance(result, str):  # if AI returned plain text (error or raw response)
-        st.session_state.suggestions = {"overall": result}
-    else:
-        st.session_state.ats_score = result.get("ats_score", "N/A")
-        st.session_state.match_score = result.get("match_score", "N/A")
-        st.session_state.suggestions = result.get("suggestions", {})
+    # Render deltas as they arrive; scores are parsed once the stream ends.
+    st.markdown("### 📢 AI Suggestions")
+    with profile_request("suggestions", job_desc=st.session_state.job_desc,
+                         file_key=st.session_state.get("file_key")):
+        result = st.write_stream(stream_suggestions(
+            st.session_state.resume_text,
+            st.session_state.job_desc
+        ))
+    if not isinstance(result, str):
+        result = "".join(map(str, result or []))
+
+    scores = parse_scores(result)
+    st.session_state.ats_score = scores.get("ats_score", "N/A")
+    st.session_state.match_score = scores.get("match_score", "N/A")
+    st.session_state.suggestions = {"overall": result}
 
     st.session_state.show_transform_button = True
 
-    if "ats_score" in st.session_state:
+    if scores:
         st.markdown("### 📊 Analysis Results")
         st.write(f"**ATS Score:** {st.session_state.ats_score}")
         st.write(f"**Match Score:** {st.session_state.match_score}")
 
-    if "suggestions" in st.session_state:
-        st.markdown("### 📢 AI Suggestions")
-
-    if isinstance(st.session_state.suggestions, dict):
-        if "strengths" in st.session_state.suggestions:
-            st.subheader("✅ Strengths")
-            for s in st.session_state.suggestions["strengths"]:
-                st.write(f"- {s}")
-
-        if "improvements" in st.session_state.suggestions:
-            st.subheader("🛠️ Areas to Improve")
-            for s in st.session_state.suggestions["improvements"]:
-                st.write(f"- {s}")
-
-        if "overall" in st.session_state.suggestions:
-            
-            st.write(st.session_state.suggestions["overall"])
-    else:
-        st.write(st.session_state.suggestions)
-
 
     
 
@@ -159,11 +197,37 @@ if "resume_text" in st.session_state and st.button("🔍 Get AI Suggestions"):
 if st.session_state.get("show_transform_button"):
     st.markdown("### 🚀 Do you want to transform your resume into an ATS-optimized template?")
     if st.button("✅ Yes, Transform My Resume"):
-        with st.spinner("Optimizing your resume for the given job role..."):
-            optimized_data = optimize_resume_for_role(
-                st.session_state.parsed_resume, st.session_state.job_desc
-            )
-            buffer = build_template_resume(optimized_data)
+        # one background job per (upload, job description) in this session
+        job_key = (st.session_state.file_key, st.session_state.job_desc)
+        optimize_jobs = st.session_state.setdefault("optimize_jobs", {})
+        job = get_job_queue().get(optimize_jobs[job_key]) if job_key in optimize_jobs else None
+        if job is None or job["status"] == "failed":
+            try:
+                optimize_jobs[job_key] = get_job_queue().submit_optimization(
+                    st.session_state.parsed_resume, st.session_state.job_desc,
+                    file_key=st.session_state.file_key
+                )
+            except JobQueueFull:
+                st.error("⏳ The optimizer is busy right now. Please try again in a minute.")
+        if job_key in optimize_jobs:
+            st.session_state.optimize_job_id = optimize_jobs[job_key]
+
+    job = get_job_queue().get(st.session_state.optimize_job_id) if "optimize_job_id" in st.session_state else None
+    if job is not None and job["status"] in ("queued", "running"):
+        last = job["progress"][-1] if job["progress"] else None
+        if last is None:
+            st.progress(0, text="Optimizing your resume for the given job role...")
+        else:
+            st.progress(min(last["round"] / max(last["max_rounds"], 1), 1.0),
+                        text=f"Round {last['round']} of {last['max_rounds']} · match score {last['score']}%")
+            if last["missing"]:
+                st.caption("Still missing: " + ", ".join(last["missing"]))
+        time.sleep(JOB_POLL_INTERVAL)
+        st.rerun()
+    elif job is not None and job["status"] == "failed":
+        st.error(f"❌ Resume optimization failed: {job['error']}")
+    elif job is not None:
+        buffer, pdf_buffer = render_documents(job["id"], job["result"])
         if buffer:
             st.success("Resume transformed successfully!")
             st.download_button(
@@ -172,6 +236,12 @@ if st.session_state.get("show_transform_button"):
                 file_name="updated_resume.docx",
                 mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
             )
+            st.download_button(
+                label="📥 Download Updated Resume (.pdf)",
+                data=pdf_buffer,
+                file_name="updated_resume.pdf",
+                mime="application/pdf"
+            )
 
 st.markdown("</div>", unsafe_allow_html=True)
 
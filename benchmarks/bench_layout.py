@@ -0,0 +1,133 @@
+# benchmarks/bench_layout.py
+"""
+Text mode vs layout mode (pdf_layout) PDF extraction: speed and section recall.
+
+Renders the synthetic corpus (corpus.py) twice - the single-column layout
+of pdf_renderer and the two-column sidebar layout of build_two_column_pdf -
+and runs both modes on every PDF:
+
+    text    resume_paser.extract_pdf_text + the per-line
+            heading pass (_split_into_sections)
+    layout  pdf_layout.extract_pdf_layout (get_text("dict") per page)
+
+Reports p50/p99 latency of sectioning alone and of the full parse
+(parse_resume_auto vs parse_resume_layout), and per-section token recall /
+precision of the section lines against the source resume dicts: recall is
+the share of a section's words that landed in that section, precision the
+share of the section's extracted words that belong there (words from other
+columns or sections leaking in lower it).
+
+Usage:
+    python benchmarks/bench_layout.py [--resumes 30] [--repeat 3] [--seed 7] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_pipeline import time_stage  # noqa: E402
+from corpus import build_corpus, build_two_column_pdf  # noqa: E402
+from pdf_layout import extract_pdf_layout, parse_resume_layout  # noqa: E402
+from pdf_renderer import build_pdf_resume  # noqa: E402
+from resume_paser import (SECTION_NAMES, _split_into_sections, extract_pdf_text,  # noqa: E402
+                          parse_resume_auto, split_lines)
+from template_filler import format_projects  # noqa: E402
+
+LAYOUTS = {"single_column": build_pdf_resume, "two_column": build_two_column_pdf}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def words(parts) -> Counter:
+    return Counter(_WORD_RE.findall(" ".join(str(p) for p in parts).lower()))
+
+
+def expected_sections(data: Dict[str, Any]) -> Dict[str, Counter]:
+    """Words each section of the rendered resume holds."""
+    return {
+        "summary": words([data["summary"]]),
+        "skills": words(data["skills"]),
+        "experience": words([v for e in data["experience"]
+                             for v in (e["role"], e["company"], e["duration"], *e["details"])]),
+        "projects": words([v for p in format_projects(data["projects"]) for v in (p["name"], *p["details"])]),
+        "education": words([v for e in data["education"]
+                            for v in (e["degree"], e["university"], e["start_year"], e["end_year"])]),
+        "certifications": words(data["certifications"]),
+    }
+
+
+def text_sections(pdf: bytes) -> Dict[str, List[str]]:
+    return _split_into_sections(split_lines(extract_pdf_text(pdf)))
+
+
+def layout_sections(pdf: bytes) -> Dict[str, List[str]]:
+    return extract_pdf_layout(pdf).sections
+
+
+def section_scores(docs, sectioner) -> Dict[str, Dict[str, float]]:
+    """Micro-averaged word recall / precision per section over all docs."""
+    hit, want, got = Counter(), Counter(), Counter()
+    for data, pdf in docs:
+        found = sectioner(pdf)
+        for key, expected in expected_sections(data).items():
+            extracted = words(found.get(key, []))
+            hit[key] += sum((expected & extracted).values())
+            want[key] += sum(expected.values())
+            got[key] += sum(extracted.values())
+    scores = {}
+    for key in list(SECTION_NAMES) + ["all"]:
+        h = sum(hit.values()) if key == "all" else hit[key]
+        w = sum(want.values()) if key == "all" else want[key]
+        g = sum(got.values()) if key == "all" else got[key]
+        if w:
+            scores[key] = {"recall": round(h / w, 4), "precision": round(h / g, 4) if g else 0.0}
+    return scores
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--resumes", type=int, default=30)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", help="write results JSON here")
+    args = ap.parse_args()
+
+    resumes, _ = build_corpus(args.resumes, 0, args.seed)
+    results: Dict[str, Any] = {}
+    for layout, render in LAYOUTS.items():
+        docs = [(data, render(data).getvalue()) for _, data in resumes]
+        pdfs = [pdf for _, pdf in docs]
+        timings = {
+            "text_sections": time_stage([lambda b=b: text_sections(b) for b in pdfs], args.repeat),
+            "layout_sections": time_stage([lambda b=b: layout_sections(b) for b in pdfs], args.repeat),
+            "parse_resume_auto": time_stage([lambda b=b: parse_resume_auto(b, "resume.pdf") for b in pdfs],
+                                            args.repeat),
+            "parse_resume_layout": time_stage([lambda b=b: parse_resume_layout(b) for b in pdfs], args.repeat),
+        }
+        scores = {"text": section_scores(docs, text_sections), "layout": section_scores(docs, layout_sections)}
+        results[layout] = {"timings": timings, "sections": scores}
+
+        print(f"\n== {layout} ({len(pdfs)} PDFs) ==")
+        print(f"{'stage':<22}{'p50 ms':>10}{'p99 ms':>10}{'ops/s':>10}")
+        for name, stats in timings.items():
+            print(f"{name:<22}{stats['p50_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['throughput_per_s']:>10.1f}")
+        print(f"\n{'section':<16}{'text R':>9}{'text P':>9}{'layout R':>10}{'layout P':>10}")
+        for key in scores["layout"]:
+            t, l = scores["text"].get(key, {}), scores["layout"][key]
+            print(f"{key:<16}{t.get('recall', 0):>9.3f}{t.get('precision', 0):>9.3f}"
+                  f"{l['recall']:>10.3f}{l['precision']:>10.3f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nsaved results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
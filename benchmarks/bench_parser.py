@@ -0,0 +1,109 @@
+# benchmarks/bench_parser.py
+"""
+Microbenchmark for the resume_paser text -> structure engine.
+
+Generates a deterministic batch of synthetic resume texts and times
+parse_resume_text over the whole batch (extraction is excluded so only the
+section/field engine is measured). Pass --baseline with the path of
+another resume_paser.py (e.g. one checked out from an older commit) to
+time it on the same batch, check both produce identical output and
+report the per-resume speedup.
+
+Usage:
+    python benchmarks/bench_parser.py [--resumes 2000] [--repeat 3] [--baseline OLD.py]
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resume_paser  # noqa: E402
+
+SKILLS = ["Python", "SQL", "Docker", "Kubernetes", "React", "Node.js", "AWS", "PyTorch",
+          "Pandas", "Java", "Spring Boot", "Git", "Linux", "TensorFlow", "FastAPI", "Redis"]
+DEGREES = ["B.Tech in Computer Science", "MCA", "Bachelor of Technology", "MBA", "B.Sc Physics",
+           "Master of Computer Applications", "BCA", "M.Tech"]
+SCHOOLS = ["Delhi University", "IIT Bombay Institute", "St. Xavier's College", "City School"]
+ROLES = ["Software Engineer", "Data Analyst", "Backend Developer", "ML Intern"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs"]
+WORDS = ("built designed implemented scalable services pipeline reduced latency improved "
+         "throughput automated deployment dashboards analytics customers features api").split()
+
+
+def synthetic_resume_text(rng: random.Random) -> str:
+    lines = [f"{rng.choice(['Asha', 'Ravi', 'Maya', 'John'])} {rng.choice(['Sharma', 'Rao', 'Smith'])}",
+             f"+91 98{rng.randint(10000000, 99999999)} | user{rng.randint(1, 9999)}@mail.com",
+             "PROFESSIONAL SUMMARY",
+             " ".join(rng.choices(WORDS, k=25)),
+             "TECHNICAL SKILLS",
+             ", ".join(rng.sample(SKILLS, 8)),
+             "WORK EXPERIENCE"]
+    for _ in range(rng.randint(1, 4)):
+        lines.append(f"{rng.choice(ROLES)} – {rng.choice(COMPANIES)} (20{rng.randint(15, 23)} - Present)")
+        for _ in range(rng.randint(2, 5)):
+            lines.append("• " + " ".join(rng.choices(WORDS, k=12)))
+    lines.append("PROJECTS")
+    for i in range(rng.randint(1, 4)):
+        lines.append(f"Project {i} {rng.choice(WORDS).title()}")
+        for _ in range(3):
+            lines.append("- " + " ".join(rng.choices(WORDS, k=10)))
+    lines.append("EDUCATION")
+    for _ in range(2):
+        lines.append(f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}, 20{rng.randint(10, 23)}")
+    lines.append("CERTIFICATIONS")
+    lines.append("AWS Certified Developer; Google Data Analytics")
+    return "\n".join(lines)
+
+
+def load_module(path: str):
+    spec = importlib.util.spec_from_file_location("baseline_resume_paser", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def time_parser(parse, texts, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for t in texts:
+            parse(t)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def baseline_parse(module):
+    if hasattr(module, "parse_resume_text"):
+        return module.parse_resume_text
+    return lambda text: module._normalize_resume_dict(module._extract_structured(text))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--resumes", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--baseline", help="path to another resume_paser.py to compare against")
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    texts = [synthetic_resume_text(rng) for _ in range(args.resumes)]
+
+    current = time_parser(resume_paser.parse_resume_text, texts, args.repeat)
+    print(f"current : {current:.3f}s total, {current / len(texts) * 1e6:.1f} us/resume")
+
+    if args.baseline:
+        parse = baseline_parse(load_module(args.baseline))
+        mismatches = sum(parse(t) != resume_paser.parse_resume_text(t) for t in texts)
+        base = time_parser(parse, texts, args.repeat)
+        print(f"baseline: {base:.3f}s total, {base / len(texts) * 1e6:.1f} us/resume")
+        print(f"speedup : {base / current:.2f}x  (output mismatches: {mismatches})")
+
+
+if __name__ == "__main__":
+    main()
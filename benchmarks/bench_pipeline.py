@@ -0,0 +1,209 @@
+# benchmarks/bench_pipeline.py
+"""
+Stage-by-stage benchmark of the resume pipeline on a synthetic corpus.
+
+Generates the deterministic corpus from corpus.py (PDF + DOCX resumes of
+three sizes and JDs of three sizes), then times every stage on its own:
+
+    extract_text_from_pdf        cleaner.extract_text_from_pdf (PyMuPDF)
+    extract_docx                 DOCX text extraction (extract_text_auto)
+    parse_resume_auto            extraction + parsing, PDF and DOCX
+    extract_jd_keywords          per JD
+    calculate_match_score        every resume text x every JD
+    build_template_resume        DOCX rendering per resume dict
+    build_pdf_resume             PDF rendering per resume dict
+    llm_get_suggestions          against the local LLM stub (llm_stub.py)
+    llm_optimize                 optimize_resume_for_role against the stub
+
+Each stage reports ops, throughput, p50/p99/mean latency and the process
+peak RSS after it ran. LLM stages use the stub with the response cache
+disabled, so they measure client, prompt and post-processing overhead
+plus the configured stub latency.
+
+--save writes the results as JSON; --compare loads such a file, prints
+per-stage deltas and exits with status 1 when a stage's p50 is slower than
+the baseline by more than --threshold.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--resumes 30] [--jds 9] [--repeat 3]
+        [--llm-calls 10] [--stub-latency 0.05] [--stages a,b] [--corpus-dir DIR]
+        [--save baseline.json] [--compare baseline.json] [--threshold 0.10]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import ai_suggester  # noqa: E402
+from cleaner import extract_text_from_pdf  # noqa: E402
+from corpus import build_corpus, write_corpus  # noqa: E402
+from jd_analyzer import extract_jd_keywords  # noqa: E402
+from llm_cache import LLMCache  # noqa: E402
+from llm_stub import start_stub  # noqa: E402
+from matcher import calculate_match_score  # noqa: E402
+from pdf_renderer import build_pdf_resume  # noqa: E402
+from resume_paser import extract_text_auto, parse_resume_auto  # noqa: E402
+from template_filler import build_template_resume  # noqa: E402
+
+STAGES = ("extract_text_from_pdf", "extract_docx", "parse_resume_auto", "extract_jd_keywords",
+          "calculate_match_score", "build_template_resume", "build_pdf_resume",
+          "llm_get_suggestions", "llm_optimize")
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # bytes vs KB
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def time_stage(calls: List[Callable[[], Any]], repeat: int) -> Dict[str, Any]:
+    calls[0]()  # warm-up: model loads, template caches, connections
+    samples = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for call in calls:
+            t = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+    samples.sort()
+    return {
+        "ops": len(samples),
+        "total_s": round(total, 4),
+        "throughput_per_s": round(len(samples) / total, 2) if total else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def build_stage_calls(corpus_dir: str, args) -> Dict[str, List[Callable[[], Any]]]:
+    resumes, jds = build_corpus(args.resumes, args.jds, args.seed)
+    paths = write_corpus(corpus_dir, resumes, jds)
+    files = []
+    for path in paths:
+        with open(path, "rb") as f:
+            files.append((os.path.basename(path), f.read()))
+    pdfs = [f for f in files if f[0].endswith(".pdf")]
+    docxs = [f for f in files if f[0].endswith(".docx")]
+    texts = [extract_text_auto(data, name) for name, data in pdfs]
+    dicts = [d for _, d in resumes]
+    jd_texts = [t for _, t in jds]
+    pairs = [(r, j) for r in texts for j in jd_texts]
+    llm_pairs = pairs[:args.llm_calls]
+
+    return {
+        "extract_text_from_pdf": [lambda f=f: extract_text_from_pdf(f[1]) for f in pdfs],
+        "extract_docx": [lambda f=f: extract_text_auto(f[1], f[0]) for f in docxs],
+        "parse_resume_auto": [lambda f=f: parse_resume_auto(f[1], f[0]) for f in files],
+        "extract_jd_keywords": [lambda j=j: extract_jd_keywords(j) for j in jd_texts],
+        "calculate_match_score": [lambda p=p: calculate_match_score(*p) for p in pairs],
+        "build_template_resume": [lambda d=d: build_template_resume(d) for d in dicts],
+        "build_pdf_resume": [lambda d=d: build_pdf_resume(d) for d in dicts],
+        "llm_get_suggestions": [lambda p=p: ai_suggester.get_suggestions(*p) for p in llm_pairs],
+        "llm_optimize": [lambda i=i, p=p: ai_suggester.optimize_resume_for_role(dicts[i % len(dicts)], p[1])
+                         for i, p in enumerate(llm_pairs)],
+    }
+
+
+def use_llm_stub(latency: float):
+    """Point ai_suggester at a local stub with the response cache disabled."""
+    server = start_stub(latency=latency)
+    ai_suggester.API_KEY = "stub"
+    ai_suggester.BASE_URL = f"http://127.0.0.1:{server.server_port}/"
+    ai_suggester.LLM_CACHE = LLMCache(max_entries=0)
+    return server
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> bool:
+    """Print per-stage deltas; True if any stage's p50 regressed past threshold."""
+    regressed = False
+    print(f"\n{'stage':<24}{'p50 base':>10}{'p50 now':>10}{'change':>9}")
+    for name, now in results["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base or not base["p50_ms"]:
+            continue
+        change = now["p50_ms"] / base["p50_ms"] - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        regressed = regressed or bool(flag)
+        print(f"{name:<24}{base['p50_ms']:>10.2f}{now['p50_ms']:>10.2f}{change:>+9.1%}{flag}")
+    return regressed
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--resumes", type=int, default=30)
+    ap.add_argument("--jds", type=int, default=9)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--llm-calls", type=int, default=10, help="LLM calls per LLM stage (0 skips them)")
+    ap.add_argument("--stub-latency", type=float, default=0.05, help="seconds per stub completion")
+    ap.add_argument("--stages", help=f"comma-separated subset of: {', '.join(STAGES)}")
+    ap.add_argument("--corpus-dir", help="keep the generated corpus here (default: temp dir)")
+    ap.add_argument("--save", help="write results JSON here (e.g. a new baseline)")
+    ap.add_argument("--compare", help="baseline JSON to compare against")
+    ap.add_argument("--threshold", type=float, default=0.10, help="allowed p50 slowdown (fraction)")
+    args = ap.parse_args()
+
+    selected = args.stages.split(",") if args.stages else list(STAGES)
+    unknown = set(selected) - set(STAGES)
+    if unknown:
+        ap.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    if args.llm_calls <= 0:
+        selected = [s for s in selected if not s.startswith("llm_")]
+    if any(s.startswith("llm_") for s in selected):
+        use_llm_stub(args.stub_latency)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = build_stage_calls(args.corpus_dir or tmp, args)
+        results: Dict[str, Any] = {
+            "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                     "resumes": args.resumes, "jds": args.jds, "seed": args.seed,
+                     "repeat": args.repeat, "llm_calls": args.llm_calls,
+                     "stub_latency": args.stub_latency, "created": time.strftime("%Y-%m-%dT%H:%M:%S")},
+            "stages": {},
+        }
+        print(f"{'stage':<24}{'ops':>6}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>9}")
+        for name in selected:
+            if not calls[name]:
+                continue
+            stats = time_stage(calls[name], args.repeat if not name.startswith("llm_") else 1)
+            results["stages"][name] = stats
+            print(f"{name:<24}{stats['ops']:>6}{stats['throughput_per_s']:>10.1f}"
+                  f"{stats['p50_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['peak_rss_mb']:>9.1f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nsaved results to {args.save}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
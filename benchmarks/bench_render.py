@@ -0,0 +1,79 @@
+# benchmarks/bench_render.py
+"""
+Benchmark resume rendering: DOCX (template_filler) vs native PDF (pdf_renderer).
+
+Builds a deterministic batch of normalized resume dicts (synthetic texts from
+bench_parser run through parse_resume_text, i.e. the same shape
+optimize_resume_for_role returns) and times each renderer on the whole
+batch, reporting per-document latency and average output size. With
+--workers the batch is also exported through bulk_export to show
+parallel throughput.
+
+Usage:
+    python benchmarks/bench_render.py [--resumes 200] [--repeat 3] [--workers 4]
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser import synthetic_resume_text  # noqa: E402
+from bulk_export import RENDERERS, export_resumes_zip  # noqa: E402
+from resume_paser import parse_resume_text  # noqa: E402
+
+FORMATS = ("template", "pdf")
+
+
+def synthetic_resumes(n: int, seed: int):
+    rng = random.Random(seed)
+    return [parse_resume_text(synthetic_resume_text(rng)) for _ in range(n)]
+
+
+def time_renderer(render, resumes, repeat: int):
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        size = 0
+        start = time.perf_counter()
+        for data in resumes:
+            size += len(render(data).getvalue())
+        best = min(best, time.perf_counter() - start)
+    return best, size / len(resumes)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--resumes", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--workers", type=int, default=0, help="also time a parallel bulk_export run")
+    args = ap.parse_args()
+
+    resumes = synthetic_resumes(args.resumes, args.seed)
+    # warm-up: template loading, style/font caches
+    for fmt in FORMATS:
+        RENDERERS[fmt][0](resumes[0])
+
+    results = {}
+    for fmt in FORMATS:
+        render, ext = RENDERERS[fmt]
+        total, avg_size = time_renderer(render, resumes, args.repeat)
+        results[fmt] = total
+        print(f"{ext[1:]:<5}: {total / len(resumes) * 1000:.2f} ms/doc, {avg_size / 1024:.1f} KB/doc")
+    print(f"pdf vs docx: {results['template'] / results['pdf']:.2f}x")
+
+    if args.workers:
+        for fmt in FORMATS:
+            start = time.perf_counter()
+            summary = export_resumes_zip(((f"r{i}", d) for i, d in enumerate(resumes)), io.BytesIO(),
+                                         renderer=fmt, workers=args.workers)
+            elapsed = time.perf_counter() - start
+            print(f"bulk {fmt:<8}: {summary['files'] / elapsed:.1f} docs/s with {args.workers} workers")
+
+
+if __name__ == "__main__":
+    main()
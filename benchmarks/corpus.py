@@ -0,0 +1,207 @@
+# benchmarks/corpus.py
+"""
+Deterministic synthetic corpus for the pipeline benchmarks.
+
+Resumes are generated as normalized resume dicts in three sizes and written
+out as real PDF (reportlab, via pdf_renderer) and DOCX (python-docx, via
+template_filler) files; job descriptions are generated in three sizes from
+the same skill vocabulary so keyword extraction and matching have
+realistic overlap. The same seed always yields byte-for-byte the same
+texts and dicts.
+
+build_two_column_pdf(data) renders a resume as a sidebar layout (skills,
+education and certifications on the left; summary, experience and
+projects on the right) whose content stream is written row by row across
+both columns, the way many HTML-to-PDF converters emit text - plain text
+extraction then interleaves the two columns line by line.
+
+Usage:
+    python benchmarks/corpus.py OUT_DIR [--resumes 30] [--jds 9] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+from io import BytesIO
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib.pagesizes import A4  # noqa: E402
+from reportlab.lib.utils import simpleSplit  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+from pdf_renderer import build_pdf_resume  # noqa: E402
+from template_filler import build_template_resume, format_projects  # noqa: E402
+
+SKILLS = ["Python", "SQL", "Docker", "Kubernetes", "React", "Node.js", "AWS", "PyTorch", "Pandas",
+          "Java", "Spring Boot", "Git", "Linux", "TensorFlow", "FastAPI", "Redis", "Kafka",
+          "PostgreSQL", "MongoDB", "GraphQL", "Terraform", "Airflow", "Spark", "TypeScript"]
+ROLES = ["Software Engineer", "Data Analyst", "Backend Developer", "ML Engineer", "DevOps Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries"]
+DEGREES = ["Bachelor of Technology", "Master of Computer Applications", "Bachelor of Science",
+           "Master of Business Administration"]
+SCHOOLS = ["Delhi University", "IIT Bombay", "Anna University", "Pune University"]
+VERBS = ["Built", "Designed", "Implemented", "Optimized", "Automated", "Migrated", "Led", "Reduced"]
+WORDS = ("scalable services pipeline latency throughput deployment dashboards analytics customers "
+         "features api reliability monitoring testing integration data models reporting cost "
+         "performance infrastructure workflows stakeholders requirements").split()
+JD_SENTENCES = ["You will work closely with product and design teams.",
+                "Experience with {a} and {b} is required.",
+                "Familiarity with {a} is a plus.",
+                "Own the design and delivery of {a}-based services.",
+                "Strong communication skills and ownership mindset.",
+                "Build and maintain data pipelines using {a} and {b}.",
+                "Write clean, tested code and review pull requests.",
+                "Collaborate on cloud infrastructure built on {a}."]
+
+# size -> (experience entries, bullets per entry, projects)
+RESUME_SIZES = {"small": (1, 2, 1), "medium": (3, 4, 2), "large": (6, 6, 4)}
+# size -> sentences
+JD_SIZES = {"small": 4, "medium": 12, "large": 40}
+
+
+def _sentence(rng: random.Random, k: int) -> str:
+    return f"{rng.choice(VERBS)} " + " ".join(rng.choices(WORDS, k=k))
+
+
+def synthetic_resume(rng: random.Random, size: str = "medium") -> Dict[str, Any]:
+    n_exp, n_bullets, n_proj = RESUME_SIZES[size]
+    return {
+        "name": f"{rng.choice(['Asha', 'Ravi', 'Maya', 'John', 'Priya'])} {rng.choice(['Sharma', 'Rao', 'Smith', 'Iyer'])}",
+        "contact": f"+91 98{rng.randint(10000000, 99999999)} | user{rng.randint(1, 9999)}@mail.com",
+        "summary": _sentence(rng, 20) + ".",
+        "skills": rng.sample(SKILLS, min(len(SKILLS), 4 + 2 * n_exp)),
+        "experience": [{"role": rng.choice(ROLES), "company": rng.choice(COMPANIES),
+                        "duration": f"20{rng.randint(12, 20)} - 20{rng.randint(21, 24)}",
+                        "details": [_sentence(rng, 12) for _ in range(n_bullets)]}
+                       for _ in range(n_exp)],
+        "projects": [{"name": f"{rng.choice(WORDS).title()} {rng.choice(['Tracker', 'Engine', 'Portal'])}",
+                      "details": [_sentence(rng, 10) for _ in range(3)]}
+                     for _ in range(n_proj)],
+        "education": [{"degree": rng.choice(DEGREES), "university": rng.choice(SCHOOLS),
+                       "start_year": "2016", "end_year": "2020"}],
+        "certifications": ["AWS Certified Developer", "Google Data Analytics"][:rng.randint(0, 2)],
+    }
+
+
+def synthetic_jd(rng: random.Random, size: str = "medium") -> str:
+    lines = [f"We are hiring a {rng.choice(ROLES)} at {rng.choice(COMPANIES)}."]
+    for _ in range(JD_SIZES[size]):
+        a, b = rng.sample(SKILLS, 2)
+        lines.append(rng.choice(JD_SENTENCES).format(a=a, b=b))
+    return "\n".join(lines)
+
+
+def build_corpus(n_resumes: int = 30, n_jds: int = 9, seed: int = 7):
+    """
+    ([(size, resume_dict)], [(size, jd_text)]), sizes cycling small/medium/large.
+    """
+    rng = random.Random(seed)
+    sizes = list(RESUME_SIZES)
+    resumes = [(sizes[i % 3], synthetic_resume(rng, sizes[i % 3])) for i in range(n_resumes)]
+    jds = [(sizes[i % 3], synthetic_jd(rng, sizes[i % 3])) for i in range(n_jds)]
+    return resumes, jds
+
+
+def write_corpus(out_dir: str, resumes: List[Tuple[str, Dict[str, Any]]],
+                 jds: List[Tuple[str, str]]) -> List[str]:
+    """Write resume_NNN_<size>.pdf/.docx and jd_NNN_<size>.txt; returns resume paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for i, (size, data) in enumerate(resumes):
+        for ext, render in ((".pdf", build_pdf_resume), (".docx", build_template_resume)):
+            path = os.path.join(out_dir, f"resume_{i:03d}_{size}{ext}")
+            with open(path, "wb") as f:
+                f.write(render(data).getvalue())
+            paths.append(path)
+    for i, (size, text) in enumerate(jds):
+        with open(os.path.join(out_dir, f"jd_{i:03d}_{size}.txt"), "w", encoding="utf-8") as f:
+            f.write(text)
+    return paths
+
+
+# two-column page geometry (points): sidebar x / width, main column x / width
+_SIDE, _MAIN = (40, 160), (225, 330)
+_TOP, _BOTTOM = 730, 50
+
+
+def _column_ops(blocks, x: float, width: float) -> List[Tuple[int, float, float, str, float, str]]:
+    """Lay (kind, text) blocks out top-down; returns (page, y, x, font, size, text) ops."""
+    ops, page, y = [], 0, _TOP
+    for kind, text in blocks:
+        font, size, indent = {"heading": ("Helvetica-Bold", 12, 0), "entry": ("Helvetica-Bold", 10.5, 0),
+                              "bullet": ("Helvetica", 10.5, 10)}.get(kind, ("Helvetica", 10.5, 0))
+        if kind == "heading":
+            y -= 8
+        for j, part in enumerate(simpleSplit(text, font, size, width - indent)):
+            if y < _BOTTOM:
+                page, y = page + 1, _TOP + 60
+            if kind == "bullet" and j == 0:
+                ops.append((page, y, x, "Helvetica", 8, "•"))
+            ops.append((page, y, x + indent, font, size, part))
+            y -= size + 3
+    return ops
+
+
+def build_two_column_pdf(data: Dict[str, Any]) -> BytesIO:
+    side, main = [], []
+    if data.get("skills"):
+        side += [("heading", "SKILLS"), ("text", ", ".join(data["skills"]))]
+    if data.get("education"):
+        side.append(("heading", "EDUCATION"))
+        for e in data["education"]:
+            side += [("text", f"{e['degree']} — {e['university']}"),
+                     ("text", f"{e['start_year']} – {e['end_year']}")]
+    if data.get("certifications"):
+        side += [("heading", "CERTIFICATIONS")] + [("bullet", c) for c in data["certifications"]]
+    if data.get("summary"):
+        main += [("heading", "SUMMARY"), ("text", data["summary"])]
+    if data.get("experience"):
+        main.append(("heading", "EXPERIENCE"))
+        for exp in data["experience"]:
+            main.append(("entry", f"{exp['role']} – {exp['company']} ({exp['duration']})"))
+            main += [("bullet", d) for d in exp["details"]]
+    if data.get("projects"):
+        main.append(("heading", "PROJECTS"))
+        for proj in format_projects(data["projects"]):
+            main.append(("entry", proj["name"].upper()))
+            main += [("bullet", d) for d in proj["details"]]
+
+    ops = _column_ops(side, *_SIDE) + _column_ops(main, *_MAIN)
+    ops.sort(key=lambda op: (op[0], -op[1], op[2]))  # row by row across both columns
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    c.setFont("Helvetica-Bold", 16)
+    c.drawCentredString(A4[0] / 2, 790, data["name"])
+    c.setFont("Helvetica", 10.5)
+    c.drawCentredString(A4[0] / 2, 772, data["contact"])
+    page = 0
+    for op_page, y, x, font, size, text in ops:
+        while page < op_page:
+            c.showPage()
+            page += 1
+        c.setFont(font, size)
+        c.drawString(x, y, text)
+    c.save()
+    buffer.seek(0)
+    return buffer
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("out_dir")
+    ap.add_argument("--resumes", type=int, default=30)
+    ap.add_argument("--jds", type=int, default=9)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    resumes, jds = build_corpus(args.resumes, args.jds, args.seed)
+    paths = write_corpus(args.out_dir, resumes, jds)
+    print(f"wrote {len(paths)} resume files and {len(jds)} job descriptions to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# benchmarks/llm_stub.py
+"""
+Local stand-in for the Groq chat-completions endpoint.
+
+Answers every POST after a fixed latency with a canned completion shaped
+like the real one: JSON-mode requests (response_format json_object) get a
+resume dict, others get suggestion text with "ATS Score" / "Match Score"
+lines, and "stream": true requests are answered as SSE chunks. Used by
+bench_pipeline.py so LLM stages measure the client, prompt building and
+post-processing without network variance or token cost.
+
+`failures` scripts error replies served before the canned ones, e.g.
+[(429, {"retry-after": "0.2"}), (503, {})]; the server's `requests`
+attribute counts the POSTs received. tests/test_groq_client.py uses both.
+
+Usage:
+    python benchmarks/llm_stub.py [--port 8899] [--latency 0.05]
+    GROQ_API_KEY=stub ... with ai_suggester.BASE_URL pointed at it
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+SUGGESTIONS = ("ATS Score: 72\nMatch Score: 64\n\nStrengths:\n- Clear experience section\n"
+               "Improvements:\n- Add missing keywords from the job description\n"
+               "- Quantify achievements in each role\n")
+OPTIMIZED = {
+    "name": "Stub Candidate",
+    "contact": "stub@example.com",
+    "summary": "Enthusiastic and highly motivated professional. Possess strong knowledge in Python and SQL.",
+    "skills": ["Python", "SQL", "Docker", "Kubernetes", "AWS", "FastAPI"],
+    "experience": [{"role": "Software Engineer", "company": "Acme Corp", "duration": "2021 - 2024",
+                    "details": ["Built Python services on AWS", "Deployed with Docker and Kubernetes"]}],
+    "projects": [{"name": "Resume Ranker", "details": ["Ranked resumes with FastAPI and SQL"]}],
+    "education": [{"degree": "Bachelor of Technology", "university": "Delhi University"}],
+    "certifications": [],
+}
+
+
+def _handler(latency: float, failures: List[Tuple[int, Dict[str, str]]]):
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # headers and body go out as separate writes: without this, Nagle +
+        # delayed ACK adds ~40 ms to every keep-alive response
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+            with lock:
+                self.server.requests += 1
+                failure = failures.pop(0) if failures else None
+            time.sleep(latency)
+            if failure:
+                self._fail(*failure)
+                return
+            json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+            content = json.dumps(OPTIMIZED) if json_mode else SUGGESTIONS
+            usage = {"prompt_tokens": sum(len(m.get("content", "")) // 4 for m in body.get("messages", [])),
+                     "completion_tokens": len(content) // 4}
+            if body.get("stream"):
+                self._stream(content)
+                return
+            out = json.dumps({"choices": [{"message": {"role": "assistant", "content": content}}],
+                              "usage": usage}).encode()
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(out)))
+            self.end_headers()
+            self.wfile.write(out)
+
+        def _fail(self, status: int, headers: Dict[str, str]):
+            out = json.dumps({"error": {"message": f"stub error {status}"}}).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(out)))
+            self.end_headers()
+            self.wfile.write(out)
+
+        def _stream(self, content: str):
+            self.send_response(200)
+            self.send_header("content-type", "text/event-stream")
+            self.send_header("connection", "close")
+            self.end_headers()
+            for i in range(0, len(content), 16):
+                chunk = {"choices": [{"delta": {"content": content[i:i + 16]}}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.close_connection = True
+
+    return Handler
+
+
+def start_stub(port: int = 0, latency: float = 0.05,
+               failures: Optional[List[Tuple[int, Dict[str, str]]]] = None) -> ThreadingHTTPServer:
+    """Serve in a daemon thread; the URL is http://127.0.0.1:<server.server_port>/."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler(latency, list(failures or ())))
+    server.daemon_threads = True
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, name="llm-stub", daemon=True).start()
+    return server
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--port", type=int, default=8899)
+    ap.add_argument("--latency", type=float, default=0.05, help="seconds per completion")
+    args = ap.parse_args()
+    server = start_stub(args.port, args.latency)
+    print(f"LLM stub listening on http://127.0.0.1:{server.server_port}/ (latency {args.latency}s)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# bulk_export.py
+"""
+Bulk resume export into a streamed ZIP archive.
+
+Resumes are rendered in parallel worker processes and each finished file is
+appended to the archive as soon as it (and every earlier one, to keep
+input order) is ready. Only `max_in_flight` rendered buffers exist at any
+time, and the archive goes straight to its destination - a path, any
+writable file object (seekable or not), or a generator of chunks for a
+streaming HTTP response - instead of being assembled in memory.
+
+Inputs are (filename_stem, data) pairs, where data is a resume dict for
+the "template" (DOCX) and "pdf" renderers or plain text for the "text"
+renderer. Failures are listed in an "errors.txt" entry rather than
+aborting the export.
+
+Functions:
+- export_resumes_zip(resumes, out, renderer="template", ...) -> Dict
+- iter_resumes_zip(resumes, renderer="template", ...) -> Iterator[bytes]
+"""
+
+import os
+import re
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from formatter import generate_docx_from_text
+from pdf_renderer import build_pdf_resume
+from profiling import profile_request
+from template_filler import build_template_resume
+
+# renderer name -> (callable returning a BytesIO, file extension)
+RENDERERS = {
+    "template": (build_template_resume, ".docx"),
+    "text": (generate_docx_from_text, ".docx"),
+    "pdf": (build_pdf_resume, ".pdf"),
+}
+
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._ \-]+")
+
+
+def export_resumes_zip(resumes: Iterable[Tuple[str, Any]], out, renderer: str = "template",
+                       workers: Optional[int] = None,
+                       max_in_flight: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Render every resume and write them into a ZIP at `out` (path or binary
+    file object). Returns {"files": count, "errors": [(name, message), ...]}.
+    """
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, "wb") as f:
+            return _write_zip(resumes, f, renderer, workers, max_in_flight)
+    return _write_zip(resumes, out, renderer, workers, max_in_flight)
+
+
+def iter_resumes_zip(resumes: Iterable[Tuple[str, Any]], renderer: str = "template",
+                     workers: Optional[int] = None,
+                     max_in_flight: Optional[int] = None) -> Iterator[bytes]:
+    """Same archive as export_resumes_zip, yielded as byte chunks."""
+    sink = _ChunkSink()
+    for _ in _write_zip_iter(resumes, sink, renderer, workers, max_in_flight):
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
+
+
+# ------------------- Internals ------------------- #
+def _write_zip(resumes, fileobj, renderer, workers, max_in_flight) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {}
+    for summary in _write_zip_iter(resumes, fileobj, renderer, workers, max_in_flight):
+        pass
+    return summary
+
+
+def _write_zip_iter(resumes, fileobj, renderer, workers, max_in_flight) -> Iterator[Dict[str, Any]]:
+    """Writes the archive, yielding a running summary after each entry."""
+    if renderer not in RENDERERS:
+        raise ValueError(f"Unknown renderer '{renderer}'. Choose from: {', '.join(RENDERERS)}")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    extension = RENDERERS[renderer][1]
+
+    used_names: set = set()
+    errors: List[Tuple[str, str]] = []
+    files = 0
+    items = iter(resumes)
+    pending: "deque" = deque()
+
+    # docx/pdf payloads are already compressed: store them as-is
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_STORED) as zf, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while len(pending) < max_in_flight:
+                item = next(items, None)
+                if item is None:
+                    break
+                name, data = item
+                pending.append((str(name), pool.submit(_render, renderer, data, str(name))))
+            if not pending:
+                break
+
+            name, future = pending.popleft()
+            try:
+                content = future.result()
+            except Exception as e:
+                errors.append((name, f"{type(e).__name__}: {e}"))
+                yield {"files": files, "errors": errors}
+                continue
+            zf.writestr(_unique_name(name, extension, used_names), content)
+            files += 1
+            yield {"files": files, "errors": errors}
+
+        if errors:
+            zf.writestr("errors.txt", "\n".join(f"{n}: {msg}" for n, msg in errors) + "\n")
+    yield {"files": files, "errors": errors}
+
+
+def _render(renderer: str, data: Any, name: str = "") -> bytes:
+    # runs in the worker: only the finished bytes travel back
+    func, _ = RENDERERS[renderer]
+    with profile_request("bulk_render", renderer=renderer, entry=name):
+        return func(data).getvalue()
+
+
+def _unique_name(stem: str, extension: str, used: set) -> str:
+    base = _UNSAFE_NAME_RE.sub("_", stem).strip(" .") or "resume"
+    name = f"{base}{extension}"
+    n = 2
+    while name in used:
+        name = f"{base}_{n}{extension}"
+        n += 1
+    used.add(name)
+    return name
+
+
+class _ChunkSink:
+    """Unseekable write-only file object collecting bytes between drains."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._written = 0
+
+    def write(self, b) -> int:
+        self._parts.append(bytes(b))
+        self._written += len(b)
+        return len(b)
+
+    def tell(self) -> int:
+        return self._written
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
@@ -0,0 +1,175 @@
+# bulk_parser.py
+"""
+Parallel bulk resume parsing on a process pool.
+
+parse_resumes_bulk() accepts a directory, a list of file paths, or an
+iterator of (id, bytes[, filename]) items, fans parse_resume_auto out over
+worker processes and yields one record per input as a generator:
+
+    {"id": ..., "filename": ..., "parsed": {...}}                 # success
+    {"id": ..., "filename": ..., "parsed": None, "error": "..."}  # failure
+
+Results come back in input order (ordered=True) or as they complete. At
+most `max_in_flight` inputs are submitted at once, so memory stays bounded
+no matter how long the input iterator is. A file that raises - or even
+crashes its worker process - becomes an error record; the batch goes on.
+With `cache_path`, workers share a parse_cache.ParseCache, so files parsed
+in an earlier run are not parsed again; each worker process opens the
+cache once and reuses it for every file. PDFs given by path (without a
+cache) are read from disk page by page, so very large files are never
+loaded whole. `early_stop` is applied the same way on every path (see
+resume_paser.extract_text_auto); it is off by default.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import fitz  # PyMuPDF
+
+from ingest import ingest_resume
+from parse_cache import ParseCache
+from profiling import profile_request
+from resume_paser import extract_pdf_text, parse_resume_auto, parse_resume_text
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+
+def parse_resumes_bulk(source: Union[str, os.PathLike, Iterable], workers: Optional[int] = None,
+                       ordered: bool = True, max_in_flight: Optional[int] = None,
+                       cache_path: Optional[str] = None,
+                       early_stop: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Parse many resumes in parallel; see module docstring for inputs/outputs.
+    `workers` defaults to the CPU count, `max_in_flight` to 4 x workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    items = iter(_iter_items(source, cache_path, early_stop))
+    if cache_path:
+        ParseCache(cache_path)  # create the table once, before workers race for it
+
+    pool = _new_pool(workers, cache_path)
+    pending: "deque" = deque()   # (item, future) in submission order
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                item = next(items, None)
+                if item is None:
+                    break
+                pending.append((item, pool.submit(_parse_one, item)))
+            if not pending:
+                return
+
+            if ordered:
+                done_entry = pending.popleft()
+                wait([done_entry[1]])
+            else:
+                done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                done_entry = next(e for e in pending if e[1] in done)
+                pending.remove(done_entry)
+
+            item, future = done_entry
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                # a worker died (e.g. native crash on a malformed file) and took
+                # the unfinished jobs with it: resubmit those on a fresh pool and
+                # retry this item alone so the crash is pinned on the right file
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = _new_pool(workers, cache_path)
+                pending = deque((it, f if _finished(f) else pool.submit(_parse_one, it))
+                                for it, f in pending)
+                yield _parse_isolated(item)
+            except Exception as e:
+                yield _error_record(item, f"{type(e).__name__}: {e}")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _finished(future) -> bool:
+    """True if `future` completed before its pool broke (its outcome is kept)."""
+    return (future.done() and not future.cancelled()
+            and not isinstance(future.exception(), BrokenProcessPool))
+
+
+# ------------------- Worker processes ------------------- #
+_worker_caches: Dict[str, ParseCache] = {}  # per process: cache_path -> open ParseCache
+
+
+def _new_pool(workers: int, cache_path: Optional[str]) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache_path,))
+
+
+def _init_worker(cache_path: Optional[str]) -> None:
+    if cache_path:
+        _worker_cache(cache_path)
+
+
+def _worker_cache(cache_path: str) -> ParseCache:
+    cache = _worker_caches.get(cache_path)
+    if cache is None:
+        cache = _worker_caches[cache_path] = ParseCache(cache_path)
+    return cache
+
+
+# ------------------- Input handling ------------------- #
+def _iter_items(source, cache_path: Optional[str] = None, early_stop: bool = False) -> Iterator[Tuple]:
+    """Normalize inputs to (id, filename, bytes or None, path or None, cache_path, early_stop)."""
+    if isinstance(source, (str, os.PathLike)):
+        root = os.fspath(source)
+        for name in sorted(os.listdir(root)):
+            path = os.path.join(root, name)
+            if os.path.isfile(path) and name.lower().endswith(RESUME_EXTENSIONS):
+                yield (path, name, None, path, cache_path, early_stop)
+        return
+
+    for entry in source:
+        if isinstance(entry, (str, os.PathLike)):
+            path = os.fspath(entry)
+            yield (path, os.path.basename(path), None, path, cache_path, early_stop)
+        else:
+            rid, data = entry[0], entry[1]
+            filename = entry[2] if len(entry) > 2 else str(rid)
+            yield (rid, filename, data, None, cache_path, early_stop)
+
+
+def _parse_one(item) -> Dict[str, Any]:
+    # runs in the worker: files are read here so bytes never cross the pipe twice
+    rid, filename, data, path, cache_path, early_stop = item
+    try:
+        if data is None and not cache_path and filename.lower().endswith(".pdf"):
+            # read straight from disk, page by page: big PDFs are never loaded whole
+            try:
+                with profile_request("bulk_parse", filename=filename, id=str(rid)):
+                    parsed = parse_resume_text(extract_pdf_text(path, early_stop=early_stop))
+                return {"id": rid, "filename": filename, "parsed": parsed}
+            except fitz.FileDataError:
+                pass  # not a readable PDF: fall back to the bytes path below
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        with profile_request("bulk_parse", file_bytes=data, filename=filename, id=str(rid)):
+            if cache_path:
+                parsed = ingest_resume(data, filename, cache=_worker_cache(cache_path),
+                                       early_stop=early_stop).parsed
+            else:
+                parsed = parse_resume_auto(data, filename, early_stop=early_stop)
+    except Exception as e:
+        return _error_record(item, f"{type(e).__name__}: {e}")
+    return {"id": rid, "filename": filename, "parsed": parsed}
+
+
+def _parse_isolated(item) -> Dict[str, Any]:
+    with _new_pool(1, item[4]) as solo:
+        try:
+            return solo.submit(_parse_one, item).result()
+        except BrokenProcessPool:
+            return _error_record(item, "Worker process crashed while parsing")
+
+
+def _error_record(item, message: str) -> Dict[str, Any]:
+    rid, filename = item[0], item[1]
+    return {"id": rid, "filename": filename, "parsed": None, "error": message}
@@ -1,20 +1,37 @@
-import fitz  # PyMuPDF
 from textblob import TextBlob
 import re
+from spell import correct_text
+from resume_paser import extract_pdf_text
+import metrics
 
+@metrics.timed("extract_text_from_pdf")
 def extract_text_from_pdf(pdf_bytes):
-    """Extract text from PDF bytes."""
-    pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    text = ""
-    for page in pdf_doc:
-        text += page.get_text()
-    return text
+    """
+    Extract text from PDF bytes (or a file path / mmap), page by page and
+    within resume_paser's PDF_MAX_PAGES / PDF_MAX_CHARS bounds.
+    """
+    return extract_pdf_text(pdf_bytes)
 
-def clean_resume_text(text):
-    """Clean and correct grammar in the resume text."""
+@metrics.timed("clean_text")
+def clean_resume_text(text, correction="textblob"):
+    """
+    Clean and correct grammar in the resume text.
+
+    correction:
+      "textblob" - TextBlob.correct() over the whole text (slow, default)
+      "fast"     - spell.py symmetric-delete corrector: only out-of-vocabulary
+                   lower-case words, tech terms protected, cached per token
+                   (the first call builds the index, ~1.5-2 s)
+      None       - whitespace cleanup only
+    """
     # Remove extra spaces and line breaks
     text = re.sub(r'\s+', ' ', text).strip()
 
+    if not correction:
+        return text
+    if correction == "fast":
+        return correct_text(text)
+
     # Grammar correction using TextBlob (no Java required)
     blob = TextBlob(text)
     corrected_text = str(blob.correct())
@@ -0,0 +1,161 @@
+# docx_template.py
+"""
+Reusable DOCX base template with prebuilt named styles.
+
+The base document is prepared once per process - either loaded from a
+preconfigured .docx (RESUME_TEMPLATE_PATH) or built here - and kept as
+bytes. Every resume then starts from a clone of it, and paragraphs are
+formatted by style name instead of per-run font settings and hand-built
+border XML.
+
+Styles (all paragraph styles):
+- "Resume Name", "Resume Contact", "Resume Heading" (bold, bottom border),
+  "Resume Body", "Resume Entry" (bold title lines), "Resume Education",
+  "Resume Small", plus the built-in "List Bullet"
+
+Functions:
+- new_resume_document() -> docx.Document
+- base_template_bytes() -> bytes
+- save_base_template(path)
+"""
+
+import os
+import threading
+from io import BytesIO
+from typing import Optional
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Pt
+
+NAME_STYLE = "Resume Name"
+CONTACT_STYLE = "Resume Contact"
+HEADING_STYLE = "Resume Heading"
+BODY_STYLE = "Resume Body"
+ENTRY_STYLE = "Resume Entry"
+EDUCATION_STYLE = "Resume Education"
+SMALL_STYLE = "Resume Small"
+BULLET_STYLE = "List Bullet"
+
+REQUIRED_STYLES = (NAME_STYLE, CONTACT_STYLE, HEADING_STYLE, BODY_STYLE,
+                   ENTRY_STYLE, EDUCATION_STYLE, SMALL_STYLE, BULLET_STYLE)
+
+_base_bytes: Optional[bytes] = None
+_lock = threading.Lock()
+
+
+def new_resume_document():
+    """A fresh Document cloned from the cached base template."""
+    return Document(BytesIO(base_template_bytes()))
+
+
+def base_template_bytes() -> bytes:
+    global _base_bytes
+    if _base_bytes is None:
+        with _lock:
+            if _base_bytes is None:
+                _base_bytes = _load_base_template()
+    return _base_bytes
+
+
+def save_base_template(path: str) -> None:
+    """Write the built-in base template, e.g. as a starting point for restyling."""
+    with open(path, "wb") as f:
+        f.write(_build_base_template())
+
+
+def _load_base_template() -> bytes:
+    path = os.getenv("RESUME_TEMPLATE_PATH")
+    if path:
+        with open(path, "rb") as f:
+            data = f.read()
+        styles = Document(BytesIO(data)).styles
+        missing = [name for name in REQUIRED_STYLES if name not in styles]
+        if missing:
+            raise ValueError(f"Resume template {path} is missing styles: {', '.join(missing)}")
+        return data
+    return _build_base_template()
+
+
+def _build_base_template() -> bytes:
+    doc = Document()
+    styles = doc.styles
+    normal = styles["Normal"]
+
+    def add(name, size=None, bold=None, align=None, before=None, after=None):
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = normal
+        style.quick_style = True
+        if size is not None:
+            style.font.size = Pt(size)
+        if bold is not None:
+            style.font.bold = bold
+        if align is not None:
+            style.paragraph_format.alignment = align
+        if before is not None:
+            style.paragraph_format.space_before = Pt(before)
+        if after is not None:
+            style.paragraph_format.space_after = Pt(after)
+        return style
+
+    add(NAME_STYLE, size=16, bold=True, align=WD_ALIGN_PARAGRAPH.CENTER)
+    add(CONTACT_STYLE, align=WD_ALIGN_PARAGRAPH.CENTER)
+    heading = add(HEADING_STYLE, size=12, bold=True, align=WD_ALIGN_PARAGRAPH.LEFT,
+                  before=4, after=2)
+    add(BODY_STYLE)
+    add(ENTRY_STYLE, bold=True)
+    add(EDUCATION_STYLE, size=11)
+    add(SMALL_STYLE, size=10)
+
+    # bottom rule under section headings, defined once on the style
+    p_pr = heading.element.get_or_add_pPr()
+    p_borders = OxmlElement("w:pBdr")
+    bottom = OxmlElement("w:bottom")
+    bottom.set(qn("w:val"), "single")
+    bottom.set(qn("w:sz"), "6")
+    bottom.set(qn("w:space"), "1")
+    bottom.set(qn("w:color"), "000000")
+    p_borders.append(bottom)
+    p_pr.append(p_borders)
+
+    _prune_template(doc)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _prune_template(doc) -> None:
+    """
+    Drop what every clone would otherwise parse and re-save for nothing: the
+    ~160 unused built-in styles and latent-style table (styles.xml is
+    ~350 KB), the Word 2010 stylesWithEffects copy (~440 KB) and the
+    thumbnail. Styles reachable from REQUIRED_STYLES or marked default stay.
+    """
+    styles_el = doc.styles.element
+    by_id = {el.get(qn("w:styleId")): el for el in styles_el.findall(qn("w:style"))}
+    stack = [doc.styles[name].style_id for name in REQUIRED_STYLES]
+    stack += [sid for sid, el in by_id.items() if el.get(qn("w:default")) in ("1", "true")]
+    keep = set()
+    while stack:
+        sid = stack.pop()
+        if sid in keep or sid not in by_id:
+            continue
+        keep.add(sid)
+        for tag in ("w:basedOn", "w:next", "w:link"):
+            ref = by_id[sid].find(qn(tag))
+            if ref is not None:
+                stack.append(ref.get(qn("w:val")))
+    for sid, el in by_id.items():
+        if sid not in keep:
+            styles_el.remove(el)
+    latent = styles_el.find(qn("w:latentStyles"))
+    if latent is not None:
+        styles_el.remove(latent)
+
+    for rels in (doc.part.rels, doc.part.package.rels):
+        for rId, rel in list(rels.items()):
+            if rel.reltype.endswith(("/stylesWithEffects", "/thumbnail")):
+                rels.pop(rId)
@@ -0,0 +1,266 @@
+# groq_client.py
+"""
+Pooled, retrying client for the Groq chat-completions endpoint.
+
+AsyncGroqClient keeps one httpx.AsyncClient (persistent keep-alive
+connections, so no TLS handshake per call), bounds in-flight requests with
+a semaphore, retries 429/5xx and transport errors with exponential backoff
+that honours `retry-after` / `x-ratelimit-reset-*` headers, and enforces a
+per-call deadline across all attempts.
+
+GroqClient is the sync wrapper for existing callers: it runs one
+AsyncGroqClient on a private event-loop thread so the connection pool
+survives between calls.
+
+post_json returns the decoded JSON body, or {"error": {"message": ...}} on
+failure, mirroring the shape of an API error response. stream_chat yields
+content deltas as they arrive and raises GroqAPIError on failure.
+"""
+
+import asyncio
+import json
+import queue
+import random
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+import httpx
+
+DEFAULT_BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
+RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class GroqAPIError(Exception):
+    """Raised by the streaming API when a completion cannot be produced."""
+
+
+def parse_retry_delay(headers) -> Optional[float]:
+    """
+    Seconds the server asks us to wait, from `retry-after` (seconds) or
+    Groq's `x-ratelimit-reset-requests` / `-tokens` ("1m2.5s", "750ms").
+    """
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    delays = []
+    for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        value = headers.get(name)
+        if value:
+            parts = _DURATION_RE.findall(value)
+            if parts:
+                delays.append(sum(float(n) * _DURATION_UNITS[u] for n, u in parts))
+    return max(delays) if delays else None
+
+
+class AsyncGroqClient:
+    def __init__(self, api_key: str, base_url: str = DEFAULT_BASE_URL,
+                 max_concurrency: int = 8, max_retries: int = 4,
+                 timeout: float = 60.0, backoff_base: float = 0.5,
+                 backoff_max: float = 30.0, max_connections: int = 20):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._max_concurrency = max_concurrency
+        self._max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    async def post_json(self, payload: Dict[str, Any],
+                        deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        POST `payload`; `deadline` is the total seconds allowed for this call
+        including retries and backoff (defaults to `timeout`).
+        """
+        budget = self.timeout if deadline is None else deadline
+        stop_at = time.monotonic() + budget
+        client = self._ensure_client()
+        last_error = "Unknown error"
+
+        for attempt in range(self.max_retries + 1):
+            remaining = stop_at - time.monotonic()
+            if remaining <= 0:
+                break
+            retry_delay = None
+            try:
+                async with self._sem:
+                    r = await client.post(self.base_url, json=payload,
+                                          timeout=min(self.timeout, remaining))
+                if r.status_code not in RETRY_STATUSES:
+                    try:
+                        return r.json()
+                    except Exception:
+                        return {"error": {"message": f"Non-JSON response (status {r.status_code})"}}
+                last_error = f"HTTP {r.status_code}"
+                retry_delay = parse_retry_delay(r.headers)
+            except httpx.TransportError as e:
+                last_error = f"{type(e).__name__}: {e}"
+
+            if attempt == self.max_retries:
+                break
+            delay = self._backoff(attempt, retry_delay)
+            if time.monotonic() + delay >= stop_at:
+                break
+            await asyncio.sleep(delay)
+
+        return {"error": {"message": f"Request failed after retries ({last_error})"}}
+
+    async def stream_chat(self, payload: Dict[str, Any],
+                          deadline: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Stream a completion (`"stream": true`), yielding content deltas.
+        Retries only happen before the first delta has been yielded.
+        """
+        body = dict(payload, stream=True)
+        started = False
+        budget = self.timeout if deadline is None else deadline
+        stop_at = time.monotonic() + budget
+        client = self._ensure_client()
+        last_error = "Unknown error"
+
+        for attempt in range(self.max_retries + 1):
+            remaining = stop_at - time.monotonic()
+            if remaining <= 0:
+                break
+            retry_delay = None
+            try:
+                async with self._sem:
+                    async with client.stream("POST", self.base_url, json=body,
+                                             timeout=min(self.timeout, remaining)) as r:
+                        if r.status_code in RETRY_STATUSES:
+                            last_error = f"HTTP {r.status_code}"
+                            retry_delay = parse_retry_delay(r.headers)
+                        elif r.status_code >= 400:
+                            await r.aread()
+                            raise GroqAPIError(_error_message(r))
+                        else:
+                            async for line in r.aiter_lines():
+                                if time.monotonic() > stop_at:
+                                    raise GroqAPIError("Deadline exceeded while streaming")
+                                delta = _parse_sse_line(line)
+                                if delta is None:
+                                    return
+                                if delta:
+                                    started = True
+                                    yield delta
+                            return
+            except httpx.TransportError as e:
+                if started:
+                    raise GroqAPIError(f"Stream interrupted ({type(e).__name__}: {e})")
+                last_error = f"{type(e).__name__}: {e}"
+
+            if attempt == self.max_retries:
+                break
+            delay = self._backoff(attempt, retry_delay)
+            if time.monotonic() + delay >= stop_at:
+                break
+            await asyncio.sleep(delay)
+
+        raise GroqAPIError(f"Request failed after retries ({last_error})")
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        # created lazily so the client binds to the loop that uses it
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"Authorization": f"Bearer {self.api_key}",
+                         "Content-Type": "application/json"},
+                limits=httpx.Limits(max_connections=self._max_connections,
+                                    max_keepalive_connections=self._max_connections),
+                timeout=self.timeout,
+            )
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+        return self._client
+
+    def _backoff(self, attempt: int, retry_delay: Optional[float]) -> float:
+        if retry_delay is not None:
+            return min(retry_delay, self.backoff_max)
+        delay = self.backoff_base * (2 ** attempt)
+        return min(delay * (0.5 + random.random() / 2), self.backoff_max)
+
+
+class GroqClient:
+    """Blocking facade over AsyncGroqClient for non-async callers."""
+
+    def __init__(self, *args, **kwargs):
+        self._async = AsyncGroqClient(*args, **kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="groq-client", daemon=True)
+        self._thread.start()
+
+    def post_json(self, payload: Dict[str, Any],
+                  deadline: Optional[float] = None) -> Dict[str, Any]:
+        future = asyncio.run_coroutine_threadsafe(
+            self._async.post_json(payload, deadline=deadline), self._loop)
+        return future.result()
+
+    def stream_chat(self, payload: Dict[str, Any],
+                    deadline: Optional[float] = None) -> Iterator[str]:
+        """Blocking generator over AsyncGroqClient.stream_chat deltas."""
+        q: "queue.Queue" = queue.Queue()
+
+        async def pump():
+            try:
+                async for delta in self._async.stream_chat(payload, deadline=deadline):
+                    q.put(("delta", delta))
+            except BaseException as e:
+                q.put(("error", e))
+            finally:
+                q.put(("done", None))
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self._loop)
+        try:
+            while True:
+                kind, value = q.get()
+                if kind == "delta":
+                    yield value
+                elif kind == "error":
+                    raise value
+                else:
+                    break
+        finally:
+            future.cancel()
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._async.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def _parse_sse_line(line: str) -> Optional[str]:
+    """
+    Content delta carried by one server-sent-events line: "" for lines with
+    no content, None at the end-of-stream marker.
+    """
+    if not line.startswith("data:"):
+        return ""
+    data = line[5:].strip()
+    if data == "[DONE]":
+        return None
+    chunk = json.loads(data)
+    if "error" in chunk:
+        raise GroqAPIError(chunk["error"].get("message", "Unknown error"))
+    choices = chunk.get("choices") or [{}]
+    return (choices[0].get("delta") or {}).get("content") or ""
+
+
+def _error_message(r: httpx.Response) -> str:
+    try:
+        return r.json()["error"]["message"]
+    except Exception:
+        return f"HTTP {r.status_code}"
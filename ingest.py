@@ -0,0 +1,58 @@
+# ingest.py
+"""
+Single-pass document ingestion.
+
+An upload is opened and text-extracted exactly once; the resulting
+ResumeDocument carries the raw text (for scoring / AI suggestions), the
+cleaned line list and the parsed structure (for optimize_resume_for_role).
+
+Functions:
+- ingest_resume(file_bytes, filename, cache=None, early_stop=False, layout=False) -> ResumeDocument
+
+Pass a parse_cache.ParseCache to skip extraction and parsing for files
+that were seen before. `early_stop` is passed to extract_text_auto; parses
+cut short by it are served from the cache but never stored in it. With
+`layout`, PDFs are read by pdf_layout.extract_pdf_layout (font-based
+headings, two-column reading order) and cached under their own key.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from parse_cache import content_key
+from pdf_layout import extract_pdf_layout
+from resume_paser import extract_text_auto, parse_resume_text, split_lines
+
+
+@dataclass
+class ResumeDocument:
+    filename: str
+    text: str
+    lines: List[str] = field(default_factory=list)
+    parsed: Dict[str, Any] = field(default_factory=dict)
+
+
+def ingest_resume(file_bytes: bytes, filename: str, cache=None, early_stop: bool = False,
+                  layout: bool = False) -> ResumeDocument:
+    """
+    Open a PDF/DOCX upload once and return its text, lines and parsed dict.
+    """
+    layout = layout and (filename or "").lower().endswith(".pdf")
+    if cache is not None:
+        key = ("layout:" if layout else "") + content_key(file_bytes, filename)
+        hit = cache.get_by_key(key)
+        if hit is not None:
+            text, parsed = hit
+            return ResumeDocument(filename=filename, text=text, lines=split_lines(text), parsed=parsed)
+
+    if layout:
+        pdf = extract_pdf_layout(file_bytes)
+        text, lines = pdf.text, pdf.lines
+        parsed = parse_resume_text(text, lines, pdf.sections)
+    else:
+        text = extract_text_auto(file_bytes, filename, early_stop=early_stop)
+        lines = split_lines(text)
+        parsed = parse_resume_text(text, lines)
+    if cache is not None and (layout or not early_stop):
+        cache.put_by_key(key, text, parsed)
+    return ResumeDocument(filename=filename, text=text, lines=lines, parsed=parsed)
@@ -4,12 +4,17 @@ Job description analyzer: extracts prioritized keywords/phrases.
 
 Functions:
 - extract_jd_keywords(text, top_n=25) -> List[str]
+- extract_jd_keywords_bulk(texts, top_n=25, batch_size=64, n_process=1) -> List[List[str]]
 - format_keyword_prompt(keywords) -> str
 """
 
-from typing import List
+from typing import Iterable, List
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import metrics
+from nlp_pipeline import get_nlp
 
 # small english stopword set (keeps file lightweight)
 STOPWORDS = set("""
@@ -23,8 +28,13 @@ we'd we'll we're we've were weren't what what's when when's where where's which
 wouldn't you you'd you'll you're you've your yours yourself yourselves
 """.split())
 
+_NON_TOKEN_RE = re.compile(r'[^A-Za-z0-9\s\-\/\+\#\&]')
+
+# overly generic words dropped from the final keyword list
+GENERIC_WORDS = {"app", "experience", "role", "team", "work"}
+
 def _tokenize(text: str) -> List[str]:
-    text = re.sub(r'[^A-Za-z0-9\s\-\/\+\#\&]', ' ', text)  # keep slashes + hashtags
+    text = _NON_TOKEN_RE.sub(' ', text)  # keep slashes + hashtags
     tokens = [t.lower().strip() for t in text.split() if t.strip()]
     return tokens
 
@@ -36,6 +46,7 @@ def _bigrams(tokens: List[str]) -> List[str]:
             out.append(f"{a} {b}")
     return out
 
+@metrics.timed("jd_keywords")
 def extract_jd_keywords(text: str, top_n: int = 25) -> List[str]:
     """
     Extract keyword candidates from a job description text.
@@ -44,34 +55,76 @@ def extract_jd_keywords(text: str, top_n: int = 25) -> List[str]:
     if not text or not text.strip():
         return []
 
-    # Try to use spaCy if available (better noun phrase extraction)
+    # Try to use spaCy if available (better noun phrase extraction).
+    # Noun chunks need tagger + parser and entities need ner, so the shared
+    # pipeline runs as loaded (lemmatizer already excluded).
     try:
-        import spacy
-        try:
-            nlp = spacy.load("en_core_web_sm")
-        except Exception:
-            # attempt to download? skip and fallback
-            nlp = None
+        nlp = get_nlp()
         if nlp:
-            doc = nlp(text)
-            # noun chunks and entities
-            phrases = []
-            for chunk in doc.noun_chunks:
-                ph = chunk.text.strip()
-                if len(ph) > 1 and any(c.isalpha() for c in ph):
-                    phrases.append(ph.lower())
-            # also entities (ORG, PRODUCT, SKILL-like)
-            for ent in doc.ents:
-                phrases.append(ent.text.lower())
-            # score by frequency
-            c = Counter([p for p in phrases if p not in STOPWORDS])
-            keywords = [k for k, _ in c.most_common(top_n)]
+            keywords = _keywords_from_doc(nlp(text), top_n)
             if keywords:
                 return keywords
     except Exception:
-        # spaCy not available — fallback
+        # spaCy not usable — fallback
+        pass
+
+    return _fallback_keywords(text, top_n)
+
+def extract_jd_keywords_bulk(texts: Iterable[str], top_n: int = 25,
+                             batch_size: int = 64, n_process: int = 1) -> List[List[str]]:
+    """
+    Batch variant of extract_jd_keywords for feeds of many job descriptions.
+    Streams texts through nlp.pipe (batch_size / n_process are passed on) and
+    returns one keyword list per input, in input order. Texts spaCy yields
+    nothing for, or all texts when spaCy is unavailable, go through the
+    regex/bigram extractor in bulk, using n_process worker processes.
+    """
+    texts = list(texts)
+    results: List[List[str]] = [[] for _ in texts]
+    pending = [i for i, t in enumerate(texts) if t and t.strip()]
+
+    try:
+        nlp = get_nlp()
+        if nlp and pending:
+            docs = nlp.pipe((texts[i] for i in pending),
+                            batch_size=batch_size, n_process=n_process)
+            for i, doc in zip(pending, docs):
+                results[i] = _keywords_from_doc(doc, top_n)
+    except Exception:
+        # spaCy not usable — whatever is still empty falls back below
         pass
+    pending = [i for i in pending if not results[i]]
+
+    if not pending:
+        return results
+
+    fallback_texts = [texts[i] for i in pending]
+    if n_process > 1 and len(fallback_texts) > batch_size:
+        with ProcessPoolExecutor(max_workers=n_process) as pool:
+            fallback = pool.map(_fallback_keywords, fallback_texts,
+                                [top_n] * len(fallback_texts), chunksize=batch_size)
+            for i, kws in zip(pending, fallback):
+                results[i] = kws
+    else:
+        for i, t in zip(pending, fallback_texts):
+            results[i] = _fallback_keywords(t, top_n)
+    return results
+
+def _keywords_from_doc(doc, top_n: int) -> List[str]:
+    # noun chunks and entities
+    phrases = []
+    for chunk in doc.noun_chunks:
+        ph = chunk.text.strip()
+        if len(ph) > 1 and any(c.isalpha() for c in ph):
+            phrases.append(ph.lower())
+    # also entities (ORG, PRODUCT, SKILL-like)
+    for ent in doc.ents:
+        phrases.append(ent.text.lower())
+    # score by frequency
+    c = Counter([p for p in phrases if p not in STOPWORDS])
+    return [k for k, _ in c.most_common(top_n)]
 
+def _fallback_keywords(text: str, top_n: int) -> List[str]:
     # Fallback lightweight extractor:
     tokens = _tokenize(text)
     # filter tokens
@@ -92,7 +145,7 @@ def extract_jd_keywords(text: str, top_n: int = 25) -> List[str]:
         if len(keywords) >= top_n:
             break
     # post-clean: remove overly generic words
-    keywords = [k for k in keywords if k not in {"app", "experience", "role", "team", "work"}][:top_n]
+    keywords = [k for k in keywords if k not in GENERIC_WORDS][:top_n]
     return keywords
 
 def format_keyword_prompt(keywords: List[str], max_display: int = 20) -> str:
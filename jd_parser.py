@@ -1,8 +1,9 @@
 import re
-import spacy
-nlp=spacy.load("en_core_web_sm")
+from nlp_pipeline import get_tokenizer
+
 
 def parse_jd(jd_text):
-    doc=nlp(jd_text.lower())
+    # is_alpha / is_stop are lexical attributes: the tokenizer alone is enough
+    doc=get_tokenizer().make_doc(jd_text.lower())
     keywords=[token.text for token in doc if token.is_alpha and not token.is_stop]
     return list(set(keywords))
\ No newline at end of file
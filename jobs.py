@@ -0,0 +1,318 @@
+# jobs.py
+"""
+Background job queue for long-running work (resume optimization).
+
+Submitting a job returns its id immediately; a fixed pool of worker
+threads runs jobs from a bounded queue, and callers poll get(job_id) (or
+block in wait()) for the status, the per-round progress reports and the
+result. Workers spend their time waiting on the LLM, so threads are
+enough and a UI / HTTP thread is never held for the duration of a job.
+
+Job record: {"id", "kind", "status" (queued|running|done|failed),
+"progress": [{"round", "max_rounds", "score", "missing"}, ...],
+"result", "error", "created", "updated"}
+
+With `db_path` every state change is also written to SQLite, so other
+processes (e.g. `uvicorn --workers N` sharing JOB_DB_PATH) can read job
+status from it. Each row carries a lease - the owning queue's id and a
+heartbeat timestamp the owner refreshes every `lease_seconds / 3`. A
+background thread in every queue claims rows whose lease expired (their
+owner died while they were queued or running) and runs them again, never
+more than its queue has room for; jobs of live processes are left alone.
+
+Classes:
+- JobQueue(workers=2, max_pending=64, db_path=None, lease_seconds=60)
+- JobQueueFull
+
+Functions:
+- get_job_queue() -> JobQueue (process-wide, configured from the environment)
+"""
+
+import json
+import os
+import socket
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from ai_suggester import optimize_resume_for_role
+from profiling import profile_request
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+FINISHED = (DONE, FAILED)
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by submit() when `max_pending` jobs are already waiting."""
+
+
+def _run_optimize(params: Dict[str, Any], report: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+    with profile_request("optimize_job", job_desc=params["job_desc"],
+                         file_key=params.get("file_key"), incremental=params.get("incremental", False)):
+        return optimize_resume_for_role(
+            params["parsed_resume"], params["job_desc"],
+            target_score=params.get("target_score", 90),
+            max_rounds=params.get("max_rounds", 2),
+            incremental=params.get("incremental", False),
+            progress=report,
+        )
+
+
+# job kind -> handler(params, report) returning a JSON-serializable result
+JOB_HANDLERS: Dict[str, Callable[[Dict[str, Any], Callable], Any]] = {
+    "optimize": _run_optimize,
+}
+
+
+class JobQueue:
+    def __init__(self, workers: int = 2, max_pending: int = 64,
+                 db_path: Optional[str] = None, max_finished: int = 1000,
+                 lease_seconds: float = 60.0):
+        self.db_path = db_path
+        self.max_finished = max_finished
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._finished: "deque[str]" = deque()
+        self._cond = threading.Condition()
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_pending)
+        self._threads = [threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+                         for i in range(max(1, workers))]
+        if db_path:
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS jobs ("
+                    "id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, "
+                    "params TEXT NOT NULL, progress TEXT NOT NULL, result TEXT, error TEXT, "
+                    "created REAL NOT NULL, updated REAL NOT NULL, owner TEXT, heartbeat REAL)"
+                )
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+                for column, kind in (("owner", "TEXT"), ("heartbeat", "REAL")):
+                    if column not in columns:  # table from before leases
+                        conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+            self._threads.append(threading.Thread(target=self._lease_loop, name="job-lease", daemon=True))
+        for t in self._threads:
+            t.start()
+
+    # ------------------- Public API ------------------- #
+    def submit(self, kind: str, params: Dict[str, Any]) -> str:
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind '{kind}'. Choose from: {', '.join(JOB_HANDLERS)}")
+        now = time.time()
+        job = {"id": uuid.uuid4().hex, "kind": kind, "status": QUEUED, "params": params,
+               "progress": [], "result": None, "error": None, "created": now, "updated": now}
+        with self._cond:
+            self._jobs[job["id"]] = job
+        # the row exists before a worker can see the job, so its updates always land
+        self._persist(job, insert=True)
+        try:
+            self._queue.put_nowait(job["id"])
+        except queue.Full:
+            with self._cond:
+                del self._jobs[job["id"]]
+            if self.db_path:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM jobs WHERE id = ?", (job["id"],))
+            raise JobQueueFull(f"{self._queue.maxsize} jobs already pending")
+        return job["id"]
+
+    def submit_optimization(self, parsed_resume: Dict[str, Any], job_desc: str,
+                            target_score: int = 90, max_rounds: int = 2,
+                            incremental: bool = False, file_key: Optional[str] = None) -> str:
+        """`file_key` (the upload's content hash) only labels profiles."""
+        return self.submit("optimize", {"parsed_resume": parsed_resume, "job_desc": job_desc,
+                                        "target_score": target_score, "max_rounds": max_rounds,
+                                        "incremental": incremental, "file_key": file_key})
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot of the job record (without params), or None if unknown."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return self._public(job)
+        return self._load(job_id) if self.db_path else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until the job finishes (or `timeout` passes); returns get(job_id)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                job = self._jobs.get(job_id)
+                if job is None or job["status"] in FINISHED:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        return self.get(job_id)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers after the jobs already queued."""
+        self._stop.set()
+        for t in self._threads:
+            if t.name != "job-lease":
+                self._queue.put(None)
+        if wait:
+            for t in self._threads:
+                t.join()
+
+    # ------------------- Internals ------------------- #
+    def _worker(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            with self._cond:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                job["status"], job["updated"] = RUNNING, time.time()
+            self._persist(job)
+
+            def report(update: Dict[str, Any]) -> None:
+                self._update(job, progress=job["progress"] + [dict(update)])
+
+            try:
+                result = JOB_HANDLERS[job["kind"]](job["params"], report)
+            except Exception as e:
+                self._update(job, status=FAILED, error=f"{type(e).__name__}: {e}")
+            else:
+                self._update(job, status=DONE, result=result)
+
+    def _update(self, job: Dict[str, Any], **changes) -> None:
+        with self._cond:
+            job.update(changes, updated=time.time())
+            if job["status"] in FINISHED:
+                job["params"] = None  # inputs are no longer needed
+                self._finished.append(job["id"])
+                while len(self._finished) > self.max_finished:
+                    self._jobs.pop(self._finished.popleft(), None)
+            self._cond.notify_all()
+        self._persist(job)
+
+    @staticmethod
+    def _public(job: Dict[str, Any]) -> Dict[str, Any]:
+        out = {k: v for k, v in job.items() if k != "params"}
+        out["progress"] = list(job["progress"])
+        return out
+
+    # ---- SQLite mirror ---- #
+    def _persist(self, job: Dict[str, Any], insert: bool = False) -> None:
+        if not self.db_path:
+            return
+        with self._cond:
+            row = (job["status"], json.dumps(job["progress"]),
+                   None if job["result"] is None else json.dumps(job["result"], ensure_ascii=False),
+                   job["error"], job["updated"], job["id"])
+            params = json.dumps(job["params"], ensure_ascii=False) if insert else None
+        with self._connect() as conn:
+            if insert:
+                conn.execute(
+                    "INSERT INTO jobs (status, progress, result, error, updated, id, kind, params, "
+                    "created, owner, heartbeat) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row + (job["kind"], params, job["created"], self.owner, time.time()),
+                )
+            else:
+                conn.execute("UPDATE jobs SET status = ?, progress = ?, result = ?, error = ?, "
+                             "updated = ?, heartbeat = ? WHERE id = ? AND owner = ?",
+                             row[:5] + (time.time(), row[5], self.owner))
+
+    def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT id, kind, status, progress, result, error, created, updated "
+                               "FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return {"id": row[0], "kind": row[1], "status": row[2], "progress": json.loads(row[3]),
+                "result": None if row[4] is None else json.loads(row[4]), "error": row[5],
+                "created": row[6], "updated": row[7]}
+
+    def _lease_loop(self) -> None:
+        """Claim expired jobs, then keep this queue's leases fresh."""
+        while True:
+            try:
+                self._recover()
+                with self._connect() as conn:
+                    conn.execute("UPDATE jobs SET heartbeat = ? WHERE owner = ? AND status IN (?, ?)",
+                                 (time.time(), self.owner, QUEUED, RUNNING))
+            except sqlite3.Error:
+                pass  # locked / unavailable: retry on the next beat
+            if self._stop.wait(self.lease_seconds / 3):
+                return
+
+    def _recover(self) -> None:
+        """Take over queued / running jobs whose owner stopped renewing its lease."""
+        free = self._queue.maxsize - self._queue.qsize()
+        if free <= 0:
+            return
+        now = time.time()
+        expired = now - self.lease_seconds
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, kind, params, created FROM jobs WHERE status IN (?, ?) AND owner IS NOT ? "
+                "AND (heartbeat IS NULL OR heartbeat < ?) ORDER BY created LIMIT ?",
+                (QUEUED, RUNNING, self.owner, expired, free)).fetchall()
+            claimed = []
+            for row in rows:
+                # conditional update: only one process wins a given job
+                cur = conn.execute(
+                    "UPDATE jobs SET owner = ?, heartbeat = ?, status = ?, progress = '[]', updated = ? "
+                    "WHERE id = ? AND status IN (?, ?) AND (heartbeat IS NULL OR heartbeat < ?)",
+                    (self.owner, now, QUEUED, now, row[0], QUEUED, RUNNING, expired))
+                if cur.rowcount == 1:
+                    claimed.append(row)
+        for job_id, kind, params, created in claimed:
+            job = {"id": job_id, "kind": kind, "status": QUEUED, "params": json.loads(params),
+                   "progress": [], "result": None, "error": None, "created": created,
+                   "updated": now}
+            with self._cond:
+                self._jobs[job_id] = job
+            if kind not in JOB_HANDLERS:
+                self._update(job, status=FAILED, error=f"Unknown job kind '{kind}'")
+                continue
+            try:
+                self._queue.put_nowait(job_id)
+            except queue.Full:  # a submit() took the slot; hand the lease back
+                with self._cond:
+                    del self._jobs[job_id]
+                with self._connect() as conn:
+                    conn.execute("UPDATE jobs SET heartbeat = NULL WHERE id = ? AND owner = ?",
+                                 (job_id, self.owner))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:  # commit / rollback
+                yield conn
+        finally:
+            conn.close()
+
+
+_job_queue: Optional[JobQueue] = None
+_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Shared queue; JOB_WORKERS, JOB_QUEUE_SIZE, JOB_DB_PATH and JOB_LEASE_SECONDS configure it."""
+    global _job_queue
+    if _job_queue is None:
+        with _lock:
+            if _job_queue is None:
+                _job_queue = JobQueue(
+                    workers=int(os.getenv("JOB_WORKERS", "2")),
+                    max_pending=int(os.getenv("JOB_QUEUE_SIZE", "64")),
+                    db_path=os.getenv("JOB_DB_PATH") or None,
+                    lease_seconds=float(os.getenv("JOB_LEASE_SECONDS", "60")),
+                )
+    return _job_queue
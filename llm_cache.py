@@ -0,0 +1,143 @@
+# llm_cache.py
+"""
+Content-addressed cache for chat-completion responses.
+
+Responses are keyed on a SHA-256 of (model, messages, temperature,
+response_format), so resubmitting the same resume + JD is served locally
+without spending tokens. Entries expire after `ttl` seconds; the in-memory
+tier evicts least-recently-used entries beyond `max_entries`. An optional
+SQLite file adds a second tier that survives restarts and is shared by all
+worker processes pointing at it. Callers get (and hand over) copies, so
+editing a returned response never changes the cached one.
+
+Classes:
+- LLMCache(max_entries=512, ttl=3600, db_path=None)
+"""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """Stable hash of the request fields that determine the completion."""
+    material = {
+        "model": payload.get("model"),
+        "messages": payload.get("messages"),
+        "temperature": payload.get("temperature"),
+        "response_format": payload.get("response_format"),
+    }
+    blob = json.dumps(material, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    def __init__(self, max_entries: int = 512, ttl: float = 3600,
+                 db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._mem: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        if db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+                )
+
+    # ------------------- Public API ------------------- #
+    def get(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = cache_key(payload)
+        now = time.time()
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                created, value = entry
+                if now - created <= self.ttl:
+                    self._mem.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                del self._mem[key]
+
+        hit = self._disk_get(key, now)
+        with self._lock:
+            if hit is None:
+                self.misses += 1
+                return None
+            created, value = hit
+            self.hits += 1
+            self._mem_put(key, value, created)  # TTL still counts from the original store
+        return copy.deepcopy(value)
+
+    def set(self, payload: Dict[str, Any], response: Dict[str, Any]) -> None:
+        key = cache_key(payload)
+        now = time.time()
+        with self._lock:
+            self._mem_put(key, copy.deepcopy(response), now)
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created) VALUES (?, ?, ?)",
+                    (key, json.dumps(response, ensure_ascii=False), now),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+            self.hits = self.misses = 0
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "entries": len(self._mem),
+            }
+
+    # ------------------- Internals ------------------- #
+    def _mem_put(self, key: str, value: Dict[str, Any], created: float) -> None:
+        self._mem[key] = (created, value)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """(created, value) of a live SQLite entry, or None."""
+        if not self.db_path:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+        try:
+            return row[1], json.loads(row[0])
+        except Exception:
+            return None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:  # commit / rollback
+                yield conn
+        finally:
+            conn.close()
@@ -1,12 +1,74 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
 
 def calculate_match_score(resume_text,job_description):
     resume_words = set(resume_text.lower().split())
     jd_words = set(job_description.lower().split())
 
-    matched = list(jd_words & resume_words)
-    missing = list(jd_words - resume_words)
+    matched = sorted(jd_words & resume_words)
+    missing = sorted(jd_words - resume_words)
 
     total = len(jd_words)
     score = round((len(matched) / total) * 100) if total > 0 else 0
 
     return matched, missing, score
+
+
+# ------------------- Batch ranking ------------------- #
+def rank_resumes(job_description: str,
+                 resumes: Union[Dict[Any, str], Iterable[str], Iterable[Tuple[Any, str]]],
+                 top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Score many resumes against one job description and return them best-first.
+
+    `resumes` may be a dict {id: text}, a list of texts (ids are list positions)
+    or an iterable of (id, text) pairs. Scores use the same token rules as
+    calculate_match_score. Each result is {id, score, matched, missing}, with
+    both term lists in alphabetical order, as calculate_match_score returns them.
+    """
+    # JD is tokenized once; its term set is the whole vocabulary.
+    vocab = {term: col for col, term in enumerate(sorted(set(job_description.lower().split())))}
+    terms = list(vocab)
+    total = len(terms)
+
+    ids, indptr, indices = _build_term_matrix(resumes, vocab)
+
+    # One pass over the CSR rows: a row's nnz is its matched-term count.
+    counts = [indptr[i + 1] - indptr[i] for i in range(len(ids))]
+    order = sorted(range(len(ids)), key=lambda i: -counts[i])
+    if top_k is not None:
+        order = order[:top_k]
+
+    results = []
+    for i in order:
+        cols = indices[indptr[i]:indptr[i + 1]]
+        hit = set(cols)
+        results.append({
+            "id": ids[i],
+            "score": round((counts[i] / total) * 100) if total > 0 else 0,
+            "matched": [terms[c] for c in cols],
+            "missing": [terms[c] for c in range(total) if c not in hit],
+        })
+    return results
+
+
+def _build_term_matrix(resumes, vocab: Dict[str, int]) -> Tuple[List[Any], List[int], List[int]]:
+    """
+    Build a sparse resume-by-term matrix in CSR form (ids, indptr, indices),
+    restricted to the JD vocabulary. Values are implicit 1s (term present).
+    """
+    if isinstance(resumes, dict):
+        items = resumes.items()
+    else:
+        items = (r if isinstance(r, tuple) else (n, r) for n, r in enumerate(resumes))
+
+    ids: List[Any] = []
+    indptr: List[int] = [0]
+    indices: List[int] = []
+    vocab_keys = vocab.keys()
+    for rid, text in items:
+        present = vocab_keys & set((text or "").lower().split())
+        indices.extend(sorted(vocab[t] for t in present))  # columns are alphabetical
+        indptr.append(len(indices))
+        ids.append(rid)
+    return ids, indptr, indices
@@ -0,0 +1,252 @@
+# metrics.py
+"""
+Lightweight in-process metrics: timers, counters and histograms.
+
+Disabled by default. While disabled, `timed` wrappers cost one global flag
+check per call and `timer()` returns a shared no-op context, so the
+instrumented request path runs as before. Enable with METRICS_ENABLED=1
+or enable().
+
+Stage latencies go into one histogram, "stage_duration_seconds", labelled
+by stage (extract_text, parse_resume, jd_keywords, llm_request,
+optimize_round, render_docx, ...), with a matching "stage_errors_total"
+counter, so a slow request can be attributed to PyMuPDF, spaCy, TextBlob,
+Groq or DOCX/PDF generation.
+
+Export:
+- prometheus_text(): text exposition format (api.py serves it at
+  /metrics; start_http_server(port) serves it from any other process,
+  see METRICS_PORT)
+- JSONL: start_jsonl_exporter(path, interval) appends a snapshot line
+  every `interval` seconds (see METRICS_JSONL_PATH)
+
+Functions:
+- timer(stage), timed(stage), inc(name, value, **labels),
+  observe(name, value, **labels), snapshot(), reset()
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Tuple
+
+STAGE_HISTOGRAM = "stage_duration_seconds"
+STAGE_ERRORS = "stage_errors_total"
+
+# seconds; spans regex parsing (sub-ms) to multi-round LLM optimization
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_enabled = os.getenv("METRICS_ENABLED", "").strip().lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_counters: Dict[Tuple[str, Tuple], float] = {}
+_histograms: Dict[Tuple[str, Tuple], list] = {}  # key -> [bucket counts..., +Inf count, sum]
+
+
+def enable(on: bool = True) -> None:
+    global _enabled
+    _enabled = on
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+# ------------------- Recording ------------------- #
+def inc(name: str, value: float = 1, **labels) -> None:
+    if not _enabled:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, value: float, **labels) -> None:
+    if not _enabled:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    i = bisect_left(DEFAULT_BUCKETS, value)
+    with _lock:
+        h = _histograms.get(key)
+        if h is None:
+            h = _histograms[key] = [0] * (len(DEFAULT_BUCKETS) + 2)
+        h[i] += 1  # per-bucket (non-cumulative) count; index len(buckets) is +Inf
+        h[-1] += value
+
+
+class _Timer:
+    __slots__ = ("stage", "labels", "start")
+
+    def __init__(self, stage: str, labels: Dict[str, Any]):
+        self.stage = stage
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe(STAGE_HISTOGRAM, time.perf_counter() - self.start, stage=self.stage, **self.labels)
+        # a generator closed by its consumer (abandoned stream) is not a failure
+        if exc_type is not None and not issubclass(exc_type, GeneratorExit):
+            inc(STAGE_ERRORS, stage=self.stage, **self.labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(stage: str, **labels):
+    """Context manager recording the block's duration under `stage`."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(stage, labels)
+
+
+def timed(stage: str) -> Callable:
+    """Decorator form of timer()."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Timer(stage, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def record_llm_usage(resp: Any, operation: str) -> None:
+    """Count prompt/completion tokens from a chat-completion `usage` field."""
+    if not _enabled or not isinstance(resp, dict):
+        return
+    usage = resp.get("usage") or {}
+    for kind in ("prompt_tokens", "completion_tokens"):
+        if isinstance(usage.get(kind), (int, float)):
+            inc("llm_tokens_total", usage[kind], operation=operation, kind=kind[:-len("_tokens")])
+
+
+# ------------------- Export ------------------- #
+def snapshot() -> Dict[str, Any]:
+    """{"counters": [...], "histograms": [...]} with cumulative bucket counts."""
+    with _lock:
+        counters = [{"name": n, "labels": dict(l), "value": v} for (n, l), v in _counters.items()]
+        hists = [(n, dict(l), list(h)) for (n, l), h in _histograms.items()]
+    histograms = []
+    for name, labels, h in hists:
+        cumulative, running = {}, 0
+        for bound, count in zip(DEFAULT_BUCKETS, h):
+            running += count
+            cumulative[str(bound)] = running
+        count = running + h[len(DEFAULT_BUCKETS)]
+        cumulative["+Inf"] = count
+        histograms.append({"name": name, "labels": labels, "count": count,
+                           "sum": h[-1], "buckets": cumulative})
+    return {"time": time.time(), "counters": counters, "histograms": histograms}
+
+
+def prometheus_text() -> str:
+    snap = snapshot()
+    lines = []
+    typed = set()
+    for c in sorted(snap["counters"], key=lambda c: c["name"]):
+        if c["name"] not in typed:
+            lines.append(f"# TYPE {c['name']} counter")
+            typed.add(c["name"])
+        lines.append(f"{c['name']}{_labels(c['labels'])} {_num(c['value'])}")
+    for h in sorted(snap["histograms"], key=lambda h: h["name"]):
+        if h["name"] not in typed:
+            lines.append(f"# TYPE {h['name']} histogram")
+            typed.add(h["name"])
+        for bound, count in h["buckets"].items():
+            lines.append(f"{h['name']}_bucket{_labels(dict(h['labels'], le=bound))} {count}")
+        lines.append(f"{h['name']}_sum{_labels(h['labels'])} {_num(h['sum'])}")
+        lines.append(f"{h['name']}_count{_labels(h['labels'])} {h['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items()))
+    return "{" + body + "}"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _num(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# ------------------- Exporters ------------------- #
+def start_jsonl_exporter(path: str, interval: float = 60.0) -> threading.Thread:
+    """Append one snapshot line to `path` every `interval` seconds."""
+    def run():
+        while True:
+            time.sleep(interval)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(snapshot(), separators=(",", ":")) + "\n")
+
+    thread = threading.Thread(target=run, name="metrics-jsonl", daemon=True)
+    thread.start()
+    return thread
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_http_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Serve prometheus_text() on every GET (e.g. /metrics) from a daemon thread."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+_exporters_started = False
+
+
+def start_exporters_from_env() -> None:
+    """Start the exporters configured by METRICS_PORT / METRICS_JSONL_PATH (once)."""
+    global _exporters_started
+    with _lock:
+        if _exporters_started or not _enabled:
+            return
+        _exporters_started = True
+    if os.getenv("METRICS_PORT"):
+        start_http_server(int(os.environ["METRICS_PORT"]))
+    if os.getenv("METRICS_JSONL_PATH"):
+        start_jsonl_exporter(os.environ["METRICS_JSONL_PATH"],
+                             float(os.getenv("METRICS_JSONL_INTERVAL", "60")))
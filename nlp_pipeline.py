@@ -0,0 +1,63 @@
+# nlp_pipeline.py
+"""
+Process-wide, lazily loaded spaCy pipeline shared by the whole package.
+
+The model is loaded on first use (never at import time) and reused for the
+lifetime of the process. The lemmatizer is excluded at load time because
+nothing consumes lemma output; callers that need even less can pass
+`disable=` per call or use `get_tokenizer()` for tokenizer-only work.
+
+Functions:
+- get_nlp(model="en_core_web_sm") -> Language or None
+- get_tokenizer() -> Language (tokenizer-only callers use .make_doc)
+"""
+
+import threading
+from typing import Optional
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# Components nobody in the package reads from.
+EXCLUDED_COMPONENTS = ["lemmatizer"]
+
+_pipelines = {}
+_lock = threading.Lock()
+
+
+def get_nlp(model: str = DEFAULT_MODEL):
+    """
+    Return the shared pipeline for `model`, loading it on first call.
+    Returns None when spaCy or the model is not installed; that outcome is
+    cached too, so a missing model does not cost a load attempt per request.
+    """
+    if model in _pipelines:
+        return _pipelines[model]
+    with _lock:
+        if model not in _pipelines:
+            _pipelines[model] = _load(model)
+    return _pipelines[model]
+
+
+def get_tokenizer(model: str = DEFAULT_MODEL):
+    """
+    Pipeline to use for tokenizer-only work (`.make_doc(text)`): the shared
+    model when available, otherwise a blank English pipeline.
+    """
+    nlp = get_nlp(model)
+    if nlp is not None:
+        return nlp
+    key = "blank:en"
+    if key not in _pipelines:
+        with _lock:
+            if key not in _pipelines:
+                import spacy
+                _pipelines[key] = spacy.blank("en")
+    return _pipelines[key]
+
+
+def _load(model: str) -> Optional[object]:
+    try:
+        import spacy
+        return spacy.load(model, exclude=EXCLUDED_COMPONENTS)
+    except Exception:
+        return None
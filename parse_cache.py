@@ -0,0 +1,102 @@
+# parse_cache.py
+"""
+Persistent parsed-resume cache keyed by file content hash.
+
+Re-uploads and re-ranks of the same file skip extraction and parsing: the
+SHA-256 of the uploaded bytes (plus the file type, which picks the
+extractor) maps to the extracted text and the normalized resume dict,
+stored as a zlib-compressed JSON blob in SQLite. Every row is tagged with
+resume_paser.PARSER_VERSION; rows from another version are ignored on
+read and can be dropped with purge_stale().
+
+Classes:
+- ParseCache(db_path)
+
+Functions:
+- content_key(file_bytes, filename) -> str
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from resume_paser import PARSER_VERSION
+
+
+def content_key(file_bytes: bytes, filename: str = "") -> str:
+    ext = (filename or "").lower().rsplit(".", 1)[-1] if "." in (filename or "") else ""
+    kind = ext if ext in ("pdf", "docx") else "auto"
+    return f"{kind}:{hashlib.sha256(file_bytes).hexdigest()}"
+
+
+class ParseCache:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")  # bulk workers read/write concurrently
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_resumes ("
+                "key TEXT PRIMARY KEY, parser_version TEXT NOT NULL, "
+                "payload BLOB NOT NULL, created REAL NOT NULL)"
+            )
+
+    def get(self, file_bytes: bytes, filename: str = "") -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(text, parsed) for these bytes, or None if absent or stale."""
+        return self.get_by_key(content_key(file_bytes, filename))
+
+    def get_by_key(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM parsed_resumes WHERE key = ? AND parser_version = ?",
+                (key, PARSER_VERSION),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        try:
+            data = json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        except Exception:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data["text"], data["parsed"]
+
+    def put(self, file_bytes: bytes, filename: str, text: str, parsed: Dict[str, Any]) -> None:
+        self.put_by_key(content_key(file_bytes, filename), text, parsed)
+
+    def put_by_key(self, key: str, text: str, parsed: Dict[str, Any]) -> None:
+        blob = zlib.compress(json.dumps({"text": text, "parsed": parsed},
+                                        ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO parsed_resumes (key, parser_version, payload, created) "
+                "VALUES (?, ?, ?, ?)",
+                (key, PARSER_VERSION, blob, time.time()),
+            )
+
+    def purge_stale(self) -> int:
+        """Delete rows written by other parser versions; returns the count."""
+        with self._connect() as conn:
+            cur = conn.execute("DELETE FROM parsed_resumes WHERE parser_version != ?",
+                               (PARSER_VERSION,))
+            return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM parsed_resumes").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:  # commit / rollback
+                yield conn
+        finally:
+            conn.close()
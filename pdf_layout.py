@@ -0,0 +1,224 @@
+# pdf_layout.py
+"""
+Layout-aware PDF extraction: sections from font styling, columns from geometry.
+
+Text mode (resume_paser.extract_text_auto) flattens each page with
+page.get_text() and _split_into_sections then upper-cases every line to
+guess headings. Here each page is read once with get_text("dict"), which
+keeps every line's font size, weight and position:
+
+- a short line whose text names a section (SECTION_NAMES) is a heading,
+  whatever its styling ("EXPERIENCE", "Experience"), as in text mode; a
+  larger, bold or capitalized heading that is not a known section
+  ("ACHIEVEMENTS", "LANGUAGES") ends the current section instead of
+  leaking into it
+- a two-column page is recognized by a second left edge shared by many
+  lines in the middle of the page and read column by column; lines
+  crossing the gutter (page-wide headings) split the page into bands read
+  top to bottom, and the name / contact header above the columns stays first
+- fragments on the same row (a bullet glyph and its text) are joined
+
+Same text as text mode on single-column PDFs; on two-column PDFs, whose
+content streams often run row by row across both columns, text mode
+interleaves the columns and mixes up sections. The dict output costs a
+little more than plain text (benchmarks/bench_layout.py compares both).
+
+Sections come out directly and are passed to the structure parser, so the
+per-line heading pass is skipped. Callers opt in with
+ingest_resume(..., layout=True), parse_resume_auto(..., layout=True) or
+"layout": true on the API's /parse.
+
+Functions:
+- extract_pdf_layout(source, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS) -> LayoutText
+- parse_resume_layout(source) -> Dict (normalized resume dict)
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+import metrics
+from resume_paser import (PDF_MAX_CHARS, PDF_MAX_PAGES, SECTION_NAMES, _open_pdf,
+                          parse_resume_text, section_heading)
+
+# text only: no images, no per-character data
+_DICT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP
+_BOLD_FLAG = 16
+
+# points above the body size that make a line heading-sized
+HEADING_SIZE_DELTA = 1.0
+# longest line (characters) still considered a heading
+MAX_HEADING_CHARS = 40
+# a second column must start in this horizontal band of the page
+GUTTER_BAND = (0.25, 0.75)
+# lines a column needs (on one page) to count as a column
+MIN_COLUMN_LINES = 3
+
+
+@dataclass
+class LayoutText:
+    text: str
+    lines: List[str] = field(default_factory=list)
+    # section key -> lines; "preamble" holds lines before the first heading
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@metrics.timed("extract_layout")
+def extract_pdf_layout(source, max_pages: Optional[int] = PDF_MAX_PAGES,
+                       max_chars: Optional[int] = PDF_MAX_CHARS) -> LayoutText:
+    """
+    Read a PDF (path, mmap or bytes) into reading-order lines and sections,
+    within the same page / character bounds as resume_paser.iter_pdf_text.
+    """
+    sections: Dict[str, List[str]] = {k: [] for k in SECTION_NAMES}
+    preamble: List[str] = []
+    lines: List[str] = []
+    current: Optional[List[str]] = preamble
+    remaining = max_chars
+    sizes: Counter = Counter()  # char-weighted font sizes seen so far (body size)
+
+    with _open_pdf(source) as pdf:
+        for i, page in enumerate(pdf):
+            if max_pages is not None and i >= max_pages:
+                break
+            page_lines = _page_lines(page, sizes)
+            body_size = sizes.most_common(1)[0][0] if sizes else 0.0
+            for text, size, bold in page_lines:
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+                    text = text[:remaining]
+                    remaining -= len(text) + 1
+                lines.append(text)
+                kind = _heading_kind(text, size, bold, body_size)
+                if kind:
+                    current = sections[kind]
+                elif kind == "" and current is not preamble:
+                    current = None  # unknown section; the name header stays in the preamble
+                elif current is not None:
+                    current.append(text)
+            if remaining is not None and remaining <= 0:
+                break
+
+    sections["preamble"] = preamble
+    return LayoutText(text="\n".join(lines), lines=lines, sections=sections)
+
+
+def parse_resume_layout(source) -> Dict[str, Any]:
+    """Layout-mode counterpart of resume_paser.parse_resume_auto for PDFs."""
+    layout = extract_pdf_layout(source)
+    return parse_resume_text(layout.text, layout.lines, layout.sections)
+
+
+# ------------------- Internals ------------------- #
+def _heading_kind(text: str, size: float, bold: bool, body_size: float) -> Optional[str]:
+    """Section key for a heading, "" for an unknown heading, None for body text."""
+    if len(text) > MAX_HEADING_CHARS:
+        return None
+    key = section_heading(text)
+    if key:
+        return key
+    # a clearly heading-styled line that names no known section
+    larger = size >= body_size + HEADING_SIZE_DELTA
+    if larger and (bold or text.isupper()) and len(text.split()) <= 4 and any(c.isalpha() for c in text):
+        return ""
+    return None
+
+
+class _Line(NamedTuple):
+    x0: float
+    x1: float
+    y0: float
+    y1: float
+    baseline: float
+    text: str
+    size: float
+    bold: bool
+
+
+def _page_lines(page, sizes: Counter) -> List[_Line]:
+    """Visual lines of a page in reading order; counts span sizes into `sizes`."""
+    page_lines = []
+    for block in page.get_text("dict", flags=_DICT_FLAGS)["blocks"]:
+        for line in block.get("lines", ()):
+            text, size, bold = "", 0.0, True
+            for span in line["spans"]:
+                chars = span["text"]
+                text += chars
+                if chars.isspace() or not chars:
+                    continue
+                sizes[span["size"]] += len(chars)
+                size = max(size, span["size"])
+                bold = bold and bool(span["flags"] & _BOLD_FLAG or "Bold" in span["font"])
+            text = text.strip()
+            if text:
+                x0, y0, x1, y1 = line["bbox"]
+                page_lines.append(_Line(x0, x1, y0, y1, line["spans"][0]["origin"][1], text, size, bold))
+    return _join_rows(_reading_order(page_lines, page.rect.width))
+
+
+def _reading_order(lines: List[_Line], page_width: float) -> List[_Line]:
+    """
+    Lines top to bottom; on a two-column page, column by column within the
+    bands separated by lines that cross the gutter (full-width headings).
+    Lines above the columns (name / contact header) keep their position.
+    """
+    lines = sorted(lines, key=lambda ln: (ln.baseline, ln.x0))
+    split = _column_split(lines, page_width)
+    if split is None:
+        return lines
+    out, left, right = [], [], []
+    for ln in lines:
+        if ln.x1 <= split:
+            left.append(ln)
+        elif ln.x0 >= split - 1 and left:
+            right.append(ln)
+        else:  # crosses the gutter, or sits above the left column
+            out += left + right + [ln]
+            left, right = [], []
+    return out + left + right
+
+
+def _column_split(lines: List[_Line], page_width: float) -> Optional[float]:
+    """
+    Left edge of a second column, if the page has one: the most common line
+    start in the middle of the page, with more lines entirely on each side
+    of it than lines crossing it.
+    """
+    lo, hi = page_width * GUTTER_BAND[0], page_width * GUTTER_BAND[1]
+    starts = Counter(round(ln.x0) for ln in lines if lo <= ln.x0 <= hi)
+    if not starts:
+        return None
+    split, count = starts.most_common(1)[0]
+    if count < MIN_COLUMN_LINES:
+        return None
+    left = sum(1 for ln in lines if ln.x1 <= split)
+    right = sum(1 for ln in lines if ln.x0 >= split - 1)
+    crossing = len(lines) - left - right
+    return split if min(left, right) >= MIN_COLUMN_LINES and min(left, right) > crossing else None
+
+
+def _join_rows(lines: List[_Line]) -> List[Tuple[str, float, bool]]:
+    """
+    (text, size, bold) per row: a line continuing the previous one to the
+    right on the same row is appended to it ("•" + "Built APIs"). A bullet
+    glyph set in a smaller font sits off the text baseline, so rows are
+    matched by vertical overlap rather than by baseline.
+    """
+    out: List[Tuple[str, float, bool]] = []
+    prev = None
+    for ln in lines:
+        if prev is not None and ln.x0 >= prev.x1 - 1 and _same_row(prev, ln):
+            text, size, bold = out[-1]
+            out[-1] = (f"{text} {ln.text}", max(size, ln.size), bold and ln.bold)
+        else:
+            out.append((ln.text, ln.size, ln.bold))
+        prev = ln
+    return out
+
+
+def _same_row(a: _Line, b: _Line) -> bool:
+    """True if either line's vertical centre falls inside the other."""
+    return a.y0 <= (b.y0 + b.y1) / 2 <= a.y1 or b.y0 <= (a.y0 + a.y1) / 2 <= b.y1
@@ -0,0 +1,137 @@
+# pdf_renderer.py
+"""
+Native PDF output for normalized resume dicts (no DOCX -> PDF round-trip).
+
+Renders the same layout as template_filler.build_template_resume with
+reportlab's platypus engine. Paragraph styles are built once at import and
+shared by every document; the standard Helvetica faces need no font files
+and reportlab caches their metrics after the first measurement, so
+per-resume cost is only layout and PDF serialization.
+
+Functions:
+- build_pdf_resume(data) -> BytesIO
+- build_pdf_resumes(resumes) -> Iterator[BytesIO]
+"""
+
+from io import BytesIO
+from typing import Any, Dict, Iterable, Iterator
+from xml.sax.saxutils import escape
+
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.platypus import HRFlowable, ListFlowable, ListItem, Paragraph, SimpleDocTemplate
+
+import metrics
+from template_filler import format_projects
+
+MARGIN = 18 * mm
+
+# ---- Shared paragraph styles (mirror docx_template's named styles) ---- #
+_BODY = ParagraphStyle("ResumeBody", fontName="Helvetica", fontSize=10.5, leading=13, spaceAfter=4)
+_NAME = ParagraphStyle("ResumeName", parent=_BODY, fontName="Helvetica-Bold", fontSize=16,
+                       leading=20, alignment=TA_CENTER, spaceAfter=2)
+_CONTACT = ParagraphStyle("ResumeContact", parent=_BODY, alignment=TA_CENTER, spaceAfter=6)
+_HEADING = ParagraphStyle("ResumeHeading", parent=_BODY, fontName="Helvetica-Bold", fontSize=12,
+                          leading=15, spaceBefore=6, spaceAfter=1)
+_ENTRY = ParagraphStyle("ResumeEntry", parent=_BODY, fontName="Helvetica-Bold", spaceAfter=2)
+_EDUCATION = ParagraphStyle("ResumeEducation", parent=_BODY, fontSize=11, leading=14, spaceAfter=1)
+_SMALL = ParagraphStyle("ResumeSmall", parent=_BODY, fontSize=10, leading=12)
+_BULLET = ParagraphStyle("ResumeBullet", parent=_BODY, spaceAfter=1)
+
+
+@metrics.timed("render_pdf")
+def build_pdf_resume(data: Dict[str, Any]) -> BytesIO:
+    """
+    Builds a PDF resume from structured resume data.
+    """
+    story = []
+
+    def para(text, style):
+        story.append(Paragraph(escape(str(text)), style))
+
+    def heading(text):
+        para(text.upper(), _HEADING)
+        story.append(HRFlowable(width="100%", thickness=0.75, color="black",
+                                spaceBefore=0, spaceAfter=4))
+
+    def bullets(items):
+        items = [str(i).strip() for i in items if str(i).strip()]
+        if items:
+            story.append(ListFlowable(
+                [ListItem(Paragraph(escape(i), _BULLET), leftIndent=12) for i in items],
+                bulletType="bullet", start="•", leftIndent=12, bulletFontSize=8,
+            ))
+
+    # ===== NAME / CONTACT =====
+    if data.get("name"):
+        para(data["name"], _NAME)
+    if data.get("contact"):
+        para(data["contact"], _CONTACT)
+
+    # ===== SUMMARY =====
+    if data.get("summary"):
+        heading("SUMMARY")
+        para(data["summary"], _BODY)
+
+    # ===== SKILLS =====
+    if data.get("skills"):
+        skills_str = ", ".join([s for s in data["skills"] if str(s).strip()])
+        if skills_str:
+            heading("SKILLS")
+            para(skills_str, _BODY)
+
+    # ===== EXPERIENCE =====
+    experience_entries = [exp for exp in data.get("experience") or [] if exp.get("role") or exp.get("company")]
+    if experience_entries:
+        heading("EXPERIENCE")
+        for exp in experience_entries:
+            para(f"{exp.get('role', '')} – {exp.get('company', '')} ({exp.get('duration', '')})".strip(), _ENTRY)
+            bullets(exp.get("details", []))
+
+    # ===== PROJECTS =====
+    project_entries = [proj for proj in data.get("projects") or [] if proj.get("name")]
+    if project_entries:
+        heading("PROJECTS")
+        for proj in format_projects(project_entries):
+            para(proj["name"].upper(), _ENTRY)
+            bullets(proj["details"])
+
+    # ===== EDUCATION =====
+    if data.get("education"):
+        heading("EDUCATION")
+        if isinstance(data["education"], list):
+            top_two = [e for e in data["education"] if isinstance(e, dict) and (e.get("degree") or e.get("university"))][:2]
+            for e in top_two:
+                line1 = " — ".join([x for x in [str(e.get("degree", "")).strip(),
+                                                str(e.get("university", "")).strip()] if x])
+                if line1:
+                    para(line1, _EDUCATION)
+                if e.get("start_year") and e.get("end_year"):
+                    para(f"{e['start_year']} – {e['end_year']}", _SMALL)
+        else:
+            edu_text = str(data["education"]).strip()
+            if edu_text:
+                para(edu_text, _BODY)
+
+    # ===== CERTIFICATIONS =====
+    certs = [c for c in data.get("certifications") or [] if str(c).strip()]
+    if certs:
+        heading("CERTIFICATIONS")
+        bullets(certs)
+
+    # ===== SAVE TO BYTES =====
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=MARGIN, rightMargin=MARGIN,
+                            topMargin=MARGIN, bottomMargin=MARGIN,
+                            title=str(data.get("name") or "Resume"))
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+
+def build_pdf_resumes(resumes: Iterable[Dict[str, Any]]) -> Iterator[BytesIO]:
+    """Render many resumes lazily; for parallel/zipped output use bulk_export with renderer="pdf"."""
+    for data in resumes:
+        yield build_pdf_resume(data)
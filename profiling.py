@@ -0,0 +1,139 @@
+# profiling.py
+"""
+Opt-in capture of cProfile profiles for slow requests.
+
+Off unless PROFILE_DIR is set. A profiled block runs under cProfile and,
+if it took at least PROFILE_THRESHOLD seconds, is written to PROFILE_DIR
+as a .prof file (pstats format: snakeviz, flameprof or gprof2dot turn it
+into a flamegraph) plus a .json sidecar with the input fingerprint - file
+and JD SHA-256 prefixes, the stage name and the elapsed time - and a .txt
+top-functions summary. Fast requests are discarded. Only the newest
+PROFILE_MAX_FILES profiles are kept.
+
+PROFILE_SAMPLE_RATE (0..1, default 1) profiles only that fraction of
+requests, bounding cProfile's overhead on busy servers. A block is skipped
+when another profiler is already active on it.
+
+Only the thread that enters the block is profiled. Work it hands to other
+threads shows up as time spent waiting, not as the functions that did it:
+- Groq HTTP calls, run on GroqClient's "groq-client" event-loop thread, appear
+  as future.result() in post_json / stream_chat
+- incremental rewrites (ai_suggester, SECTION_WORKERS), whose per-section
+  LLM calls and merges run in a ThreadPoolExecutor, appear as pool.map()
+Use metrics.py stage timings (llm_request, optimize_round, ...) for those.
+(From Python 3.12 cProfile hooks the whole interpreter, so other threads'
+calls are included, along with those of concurrent requests.)
+
+Functions:
+- profile_request(name, file_bytes=None, job_desc=None, **fingerprint)
+- fingerprint_hash(data) -> str
+"""
+
+import cProfile
+import glob
+import hashlib
+import io
+import json
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Union
+
+PROFILE_DIR = os.getenv("PROFILE_DIR") or None
+PROFILE_THRESHOLD = float(os.getenv("PROFILE_THRESHOLD", "5"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "1"))
+# functions listed in the .txt summary
+SUMMARY_LINES = 40
+
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.\-]+")
+_rotate_lock = threading.Lock()
+_active = threading.local()
+
+
+def fingerprint_hash(data: Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+@contextmanager
+def profile_request(name: str, file_bytes: Optional[bytes] = None,
+                    job_desc: Optional[str] = None, **fingerprint: Any) -> Iterator[None]:
+    """
+    Profile the block; keep the profile only if it ran past the threshold.
+    Extra keyword arguments (filename, ids, ...) go into the sidecar as-is.
+    """
+    if (not PROFILE_DIR or getattr(_active, "on", False)
+            or (PROFILE_SAMPLE_RATE < 1 and random.random() >= PROFILE_SAMPLE_RATE)):
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # another profiler owns this thread/interpreter
+        yield
+        return
+    _active.on = True
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _active.on = False
+        elapsed = time.perf_counter() - start
+        if elapsed >= PROFILE_THRESHOLD:
+            info = {"name": name, "elapsed_s": round(elapsed, 4), "time": time.time(),
+                    "pid": os.getpid(), "threshold_s": PROFILE_THRESHOLD}
+            if file_bytes is not None:
+                info["file_sha256"] = fingerprint_hash(file_bytes)
+                info["file_size"] = len(file_bytes)
+            if job_desc is not None:
+                info["jd_sha256"] = fingerprint_hash(job_desc)
+            info.update({k: v for k, v in fingerprint.items() if v is not None})
+            try:
+                _write_profile(profiler, info)
+            except OSError:
+                pass  # profiling must never fail the request
+
+
+def _write_profile(profiler: cProfile.Profile, info: Dict[str, Any]) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(info["time"]))
+    tag = info.get("file_sha256") or info.get("jd_sha256") or "nofp"
+    base = os.path.join(PROFILE_DIR, _UNSAFE_RE.sub("_", f"{stamp}_{info['name']}_{tag}_{os.getpid()}"
+                                                        f"_{threading.get_ident() % 10000}"))
+    profiler.dump_stats(base + ".prof")
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump(info, f, indent=2, default=str)
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(SUMMARY_LINES)
+    with open(base + ".txt", "w", encoding="utf-8") as f:
+        f.write(summary.getvalue())
+    _rotate()
+    return base + ".prof"
+
+
+def _rotate() -> None:
+    """Drop the oldest profiles (and their sidecars) beyond PROFILE_MAX_FILES."""
+    with _rotate_lock:
+        profiles = sorted(glob.glob(os.path.join(PROFILE_DIR, "*.prof")), key=_mtime)
+        for path in profiles[:max(0, len(profiles) - PROFILE_MAX_FILES)]:
+            stem = path[:-len(".prof")]
+            for ext in (".prof", ".json", ".txt"):
+                try:
+                    os.remove(stem + ext)
+                except OSError:
+                    pass
+
+
+def _mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
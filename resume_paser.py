@@ -1,14 +1,18 @@
 
 # Robust auto parser for PDF/DOCX uploads -> normalized structured resume dict.
 
+import mmap
+import os
 import re
 from io import BytesIO
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 
 # External libs
 import fitz            # PyMuPDF
 import docx            # python-docx
 
+import metrics
+
 # -------- Degree expansion map (extendable) -------- #
 DEGREE_MAP = {
     "MCA": "Master of Computer Applications",
@@ -47,24 +51,95 @@ SECTION_NAMES = {
 
 BULLET_PREFIXES = ("•", "-", "–", "—", "*")
 
+# -------- PDF extraction bounds (per upload) -------- #
+# Pages / characters read from one PDF; the rest of a long portfolio is ignored.
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "30"))
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "300000"))
+# Early stop (opt-in): once all of these headings were seen, read `extra_pages` more and stop.
+STANDARD_SECTIONS = ("summary", "skills", "experience", "projects", "education", "certifications")
+
+# -------- Precompiled patterns & lookup tables (built once at import) -------- #
+# Flat heading table: normalized heading text -> section key.
+_HEADING_LOOKUP = {name: key for key, names in SECTION_NAMES.items() for name in names}
+_NON_HEADING_RE = re.compile(r"[^A-Z ]")
+
+_PHONE_RE = re.compile(r"(\+?\d[\d\s\-]{8,}\d)")
+_CONTACT_RE = re.compile(r"@|(\+?\d[\d\s\-]{8,}\d)")
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_SKILL_SPLIT_RE = re.compile(r"[;,•\u2022]\s*|\s{2,}")
+_CERT_SPLIT_RE = re.compile(r"[\n;,•\u2022]")
+_LIST_SPLIT_RE = re.compile(r"[;,]")
+_ROLE_LINE_RE = re.compile(
+    r"^(?P<role>.+?)\s+[–—-]\s+(?P<company>.+?)\s*\((?P<dur>[^)]+)\)$"
+)
+
+_DEGREE_TOKENS = (r"M\.?C\.?A\.?|MCA|MBA|M\.?Tech|MTECH|B\.?Tech|BTECH|B\.?E\.?|BE|BCA|B\.?Sc|BSc|"
+                  r"B\.?Com|BCom|BBA|B\.?Pharma|BPharma|BA\s*LLB|BALLB|LLB")
+_DEGREE_RE = re.compile(f"({_DEGREE_TOKENS})", re.IGNORECASE)
+_DEGREE_SCAN_RE = re.compile(
+    f"(?P<deg>{_DEGREE_TOKENS})[^,\n]*?(?P<uni>(University|College|Institute|School)[^,\n]*)?"
+    r"(?P<yr>\b(19|20)\d{2}\b)?",
+    re.IGNORECASE
+)
+_MASTER_CA_RE = re.compile(r"MASTER\S+\s+OF\s+COMPUTER\s+APPLICATIONS")
+_BACHELOR_TECH_RE = re.compile(r"BACHELOR\S+\s+OF\s+TECHNOLOGY")
+_UNI_SECTION_RE = re.compile(r"(University|College|Institute|School)[^,|;]*", re.IGNORECASE)
+_UNI_LINE_RE = re.compile(r"(University|College|Institute|School)[^,;\n]*", re.IGNORECASE)
+
+
+# Bump whenever extraction or parsing output changes: cached parses
+# (parse_cache.py) recorded under another version are treated as stale.
+PARSER_VERSION = "3"
+
 
 # --------------------- Public API --------------------- #
-def parse_resume_auto(file_bytes: bytes, filename: str) -> Dict[str, Any]:
+@metrics.timed("parse_resume_auto")
+def parse_resume_auto(file_bytes: bytes, filename: str, early_stop: bool = False,
+                      layout: bool = False) -> Dict[str, Any]:
     """
     Auto-detect PDF/DOCX, parse, and return a normalized resume dict.
+    With `early_stop`, PDF reading ends shortly after every section in
+    STANDARD_SECTIONS has been seen (see extract_text_auto). With `layout`,
+    PDFs are read by pdf_layout (font-based headings, two-column pages).
+    """
+    if layout and (filename or "").lower().endswith(".pdf"):
+        from pdf_layout import parse_resume_layout  # pdf_layout imports this module
+        return parse_resume_layout(file_bytes)
+    return parse_resume_text(extract_text_auto(file_bytes, filename, early_stop=early_stop))
+
+
+@metrics.timed("parse_resume")
+def parse_resume_text(text: str, lines: List[str] = None,
+                      sections: Dict[str, List[str]] = None) -> Dict[str, Any]:
+    """
+    Parse already-extracted resume text into a normalized resume dict.
+    Pass `lines` (stripped, non-empty) when the caller has them already, and
+    `sections` (key -> lines, as from pdf_layout) to skip heading detection.
+    """
+    data = _extract_structured(text, lines, sections)
+    return _normalize_resume_dict(data)
+
+
+@metrics.timed("extract_text")
+def extract_text_auto(file_bytes: bytes, filename: str, early_stop: bool = False) -> str:
+    """
+    Auto-detect PDF/DOCX and return the document's raw text.
+    PDFs are read page by page within PDF_MAX_PAGES / PDF_MAX_CHARS; with
+    `early_stop` reading also ends shortly after the standard sections.
     """
     ext = (filename or "").lower()
     text = ""
 
     try:
         if ext.endswith(".pdf"):
-            text = _extract_text_from_pdf_bytes(file_bytes)
+            text = _extract_text_from_pdf_bytes(file_bytes, early_stop)
         elif ext.endswith(".docx"):
             text = _extract_text_from_docx_bytes(file_bytes)
         else:
             # Try PDF first; if fails, try DOCX; else treat as plain text
             try:
-                text = _extract_text_from_pdf_bytes(file_bytes)
+                text = _extract_text_from_pdf_bytes(file_bytes, early_stop)
             except Exception:
                 try:
                     text = _extract_text_from_docx_bytes(file_bytes)
@@ -74,17 +149,73 @@ def parse_resume_auto(file_bytes: bytes, filename: str) -> Dict[str, Any]:
     except Exception:
         text = file_bytes.decode(errors="ignore")
 
-    data = _extract_structured(text)
-    return _normalize_resume_dict(data)
+    return text
+
+
+def split_lines(text: str) -> List[str]:
+    """Stripped, non-empty lines of `text` (the parser's line model)."""
+    lines = [ln.strip() for ln in text.splitlines()]
+    return [ln for ln in lines if ln]  # remove empty
+
+
+def section_heading(line: str) -> Optional[str]:
+    """Section key if `line` is a recognized heading ("Work Experience" -> "experience")."""
+    return _HEADING_LOOKUP.get(_NON_HEADING_RE.sub("", line.upper()).strip())
+
+
+def iter_pdf_text(source, max_pages: Optional[int] = PDF_MAX_PAGES,
+                  max_chars: Optional[int] = PDF_MAX_CHARS,
+                  stop_sections: Optional[Iterable[str]] = None,
+                  extra_pages: int = 1) -> Iterator[str]:
+    """
+    Yield a PDF's text one page at a time.
+
+    `source` is a file path (pages are read from disk on demand, so the
+    file is never fully loaded), an mmap, or bytes-like data. Reading ends
+    after `max_pages` pages or `max_chars` characters (the last page is
+    truncated), and - when `stop_sections` is given - `extra_pages` pages
+    after the page on which the last of those section headings appeared.
+    """
+    wanted = set(stop_sections or ())
+    found: set = set()
+    stop_at = None
+    remaining = max_chars
+    with _open_pdf(source) as pdf:
+        for i, page in enumerate(pdf):
+            if (max_pages is not None and i >= max_pages) or (stop_at is not None and i >= stop_at):
+                return
+            text = page.get_text()
+            if remaining is not None:
+                if len(text) >= remaining:
+                    if remaining:
+                        yield text[:remaining]
+                    return
+                remaining -= len(text)
+            yield text
+            if wanted and stop_at is None:
+                found.update(filter(None, map(section_heading, text.splitlines())))
+                if wanted <= found:
+                    stop_at = i + 1 + extra_pages
+
+
+def extract_pdf_text(source, early_stop: bool = False, **limits) -> str:
+    """Joined iter_pdf_text(); `early_stop` stops after STANDARD_SECTIONS."""
+    if early_stop:
+        limits.setdefault("stop_sections", STANDARD_SECTIONS)
+    return "".join(iter_pdf_text(source, **limits))
 
 
 # ------------------- Low-level extractors ------------------- #
-def _extract_text_from_pdf_bytes(file_bytes: bytes) -> str:
-    text = ""
-    with fitz.open(stream=file_bytes, filetype="pdf") as pdf:
-        for page in pdf:
-            text += page.get_text()
-    return text
+def _open_pdf(source):
+    if isinstance(source, (str, os.PathLike)):
+        return fitz.open(os.fspath(source), filetype="pdf")
+    if isinstance(source, mmap.mmap):
+        source = memoryview(source)
+    return fitz.open(stream=source, filetype="pdf")
+
+
+def _extract_text_from_pdf_bytes(file_bytes: bytes, early_stop: bool = False) -> str:
+    return extract_pdf_text(file_bytes, early_stop=early_stop)
 
 
 def _extract_text_from_docx_bytes(file_bytes: bytes) -> str:
@@ -93,14 +224,16 @@ def _extract_text_from_docx_bytes(file_bytes: bytes) -> str:
 
 
 # ------------------- Heuristic structure parser ------------------- #
-def _extract_structured(text: str) -> Dict[str, Any]:
-    lines = [ln.strip() for ln in text.splitlines()]
-    lines = [ln for ln in lines if ln]  # remove empty
+def _extract_structured(text: str, lines: List[str] = None,
+                        sections: Dict[str, List[str]] = None) -> Dict[str, Any]:
+    if lines is None:
+        lines = split_lines(text)
 
     name = _guess_name(lines)
     contact = _extract_contact(text)
 
-    sections = _split_into_sections(lines)
+    if sections is None:
+        sections = _split_into_sections(lines)
 
     summary_text = "\n".join(sections.get("summary", []))
     skills_list = _extract_skills(sections.get("skills", []))
@@ -125,19 +258,12 @@ def _split_into_sections(lines: List[str]) -> Dict[str, List[str]]:
     """
     Split by detecting uppercase headings. Keep order; collect lines until next heading.
     """
-    def is_heading(line: str) -> Tuple[str, bool]:
-        up = re.sub(r"[^A-Z ]", "", line.upper()).strip()
-        for key, names in SECTION_NAMES.items():
-            if up in names:
-                return key, True
-        return "", False
-
     sections: Dict[str, List[str]] = {k: [] for k in SECTION_NAMES.keys()}
     current_key = None
 
     for ln in lines:
-        key, is_head = is_heading(ln)
-        if is_head:
+        key = section_heading(ln)
+        if key:
             current_key = key
             continue
         if current_key:
@@ -161,12 +287,12 @@ def _guess_name(lines: List[str]) -> str:
 
 
 def _looks_like_contact(s: str) -> bool:
-    return bool(re.search(r"@|(\+?\d[\d\s\-]{8,}\d)", s))
+    return bool(_CONTACT_RE.search(s))
 
 
 def _extract_contact(text: str) -> str:
-    phone = re.search(r"(\+?\d[\d\s\-]{8,}\d)", text)
-    email = re.search(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}", text)
+    phone = _PHONE_RE.search(text)
+    email = _EMAIL_RE.search(text)
     parts = []
     if phone:
         parts.append(phone.group(1))
@@ -180,7 +306,7 @@ def _extract_skills(skill_lines: List[str]) -> List[str]:
         return []
     joined = " ".join(skill_lines)
     # split by commas/semicolons/bullets
-    items = re.split(r"[;,•\u2022]\s*|\s{2,}", joined)
+    items = _SKILL_SPLIT_RE.split(joined)
     skills = [s.strip(" -•—\t") for s in items if s and len(s) < 50]
     # de-dup while preserving order
     seen = set()
@@ -203,12 +329,11 @@ def _extract_experience(exp_lines: List[str]) -> List[Dict[str, Any]]:
     entries: List[Dict[str, Any]] = []
     current: Dict[str, Any] = {"role": "", "company": "", "duration": "", "details": []}
 
-    role_line_pattern = re.compile(
-        r"^(?P<role>.+?)\s+[–—-]\s+(?P<company>.+?)\s*\((?P<dur>[^)]+)\)$"
-    )
+    role_line_pattern = _ROLE_LINE_RE
 
     for ln in exp_lines:
-        m = role_line_pattern.match(ln)
+        # the pattern ends in "(duration)", so skip the regex for other lines
+        m = role_line_pattern.match(ln) if ln.endswith(")") else None
         if m:
             # start new block
             if current["role"] or current["details"]:
@@ -276,14 +401,14 @@ def _extract_education(edu_lines: List[str], full_text: str) -> List[Dict[str, s
 
     def normalize_degree(text: str) -> str:
         up = text.upper()
-        # find any degree token and map to full
-        for k, v in DEGREE_MAP.items():
-            if k in up:
-                return v
+        # `text` is a token matched by _DEGREE_RE: map it to the full name
+        full = DEGREE_MAP.get(" ".join(up.split()))
+        if full:
+            return full
         # expand common patterns
-        if re.search(r"MASTER\S+\s+OF\s+COMPUTER\s+APPLICATIONS", up):
+        if _MASTER_CA_RE.search(up):
             return "Master of Computer Applications"
-        if re.search(r"BACHELOR\S+\s+OF\s+TECHNOLOGY", up):
+        if _BACHELOR_TECH_RE.search(up):
             return "Bachelor of Technology"
         return text.strip()
 
@@ -294,15 +419,12 @@ def _extract_education(edu_lines: List[str], full_text: str) -> List[Dict[str, s
         university = ""
 
         # degree guess
-        deg_m = re.search(
-            r"(M\.?C\.?A\.?|MCA|MBA|M\.?Tech|MTECH|B\.?Tech|BTECH|B\.?E\.?|BE|BCA|B\.?Sc|BSc|B\.?Com|BCom|BBA|B\.?Pharma|BPharma|BA\s*LLB|BALLB|LLB)",
-            ln, re.IGNORECASE
-        )
+        deg_m = _DEGREE_RE.search(ln)
         if deg_m:
             degree = normalize_degree(deg_m.group(0))
 
         # university/college guess
-        uni_m = re.search(r"(University|College|Institute|School)[^,|;]*", ln, re.IGNORECASE)
+        uni_m = _UNI_SECTION_RE.search(ln)
         if uni_m:
             university = uni_m.group(0).strip()
 
@@ -311,10 +433,7 @@ def _extract_education(edu_lines: List[str], full_text: str) -> List[Dict[str, s
 
     # Fallback: scan full text for degree patterns if nothing found
     if not items:
-        for m in re.finditer(
-            r"(?P<deg>M\.?C\.?A\.?|MCA|MBA|M\.?Tech|MTECH|B\.?Tech|BTECH|B\.?E\.?|BE|BCA|B\.?Sc|BSc|B\.?Com|BCom|BBA|B\.?Pharma|BPharma|BA\s*LLB|BALLB|LLB)[^,\n]*?(?P<uni>(University|College|Institute|School)[^,\n]*)?(?P<yr>\b(19|20)\d{2}\b)?",
-            full_text, re.IGNORECASE
-        ):
+        for m in _DEGREE_SCAN_RE.finditer(full_text):
             degree = normalize_degree(m.group("deg") or "")
             university = (m.group("uni") or "").strip()
             year = (m.group("yr") or "").strip()
@@ -337,7 +456,7 @@ def _extract_education(edu_lines: List[str], full_text: str) -> List[Dict[str, s
 
 
 def _find_year(s: str) -> str:
-    m = re.search(r"\b(19|20)\d{2}\b", s)
+    m = _YEAR_RE.search(s)
     return m.group(0) if m else ""
 
 
@@ -346,7 +465,7 @@ def _extract_certifications(cert_lines: List[str]) -> List[str]:
         return []
     # split bullets/commas
     joined = "\n".join(cert_lines)
-    parts = re.split(r"[\n;,•\u2022]", joined)
+    parts = _CERT_SPLIT_RE.split(joined)
     certs = [p.strip(" -•—\t") for p in parts if p.strip()]
     # de-dup
     seen = set()
@@ -383,7 +502,7 @@ def _normalize_resume_dict(d: Dict[str, Any]) -> Dict[str, Any]:
     # skills
     skills = d.get("skills", [])
     if isinstance(skills, str):
-        skills = [s.strip() for s in re.split(r"[;,]", skills) if s.strip()]
+        skills = [s.strip() for s in _LIST_SPLIT_RE.split(skills) if s.strip()]
     if isinstance(skills, list):
         out["skills"] = [str(s).strip() for s in skills if str(s).strip()]
 
@@ -431,7 +550,7 @@ def _normalize_resume_dict(d: Dict[str, Any]) -> Dict[str, Any]:
     # certifications
     certs = d.get("certifications", [])
     if isinstance(certs, str):
-        certs = [c.strip() for c in re.split(r"[;,]", certs) if c.strip()]
+        certs = [c.strip() for c in _LIST_SPLIT_RE.split(certs) if c.strip()]
     if isinstance(certs, list):
         out["certifications"] = [str(c).strip() for c in certs if str(c).strip()]
 
@@ -452,5 +571,5 @@ def _degree_from_line(line: str) -> str:
 
 
 def _university_from_line(line: str) -> str:
-    m = re.search(r"(University|College|Institute|School)[^,;\n]*", line, re.IGNORECASE)
+    m = _UNI_LINE_RE.search(line)
     return m.group(0).strip() if m else ""
@@ -0,0 +1,259 @@
+# scoring.py
+"""
+Pluggable resume-vs-JD scoring engines over a persistent corpus index.
+
+Unlike matcher.calculate_match_score (raw whitespace-token set overlap),
+text here is normalized first: lowercased, punctuation stripped from token
+edges ("python," == "python", while "c++" / "node.js" survive) and
+stopwords dropped, so they no longer inflate the JD denominator.
+
+CorpusIndex keeps document frequencies and postings (term -> {doc_id: tf})
+for unigrams and word n-grams. It is built once over the resume store,
+updated incrementally with add()/remove(), and saved/loaded as JSON.
+Queries only walk the postings of the JD's own terms, so their cost grows
+with the number of matching documents rather than the corpus size.
+
+Engines:
+- TfidfEngine   - log-tf * idf, length-normalized
+- BM25Engine    - Okapi BM25 (k1, b)
+- PhraseEngine  - idf-weighted coverage of JD unigrams and n-gram phrases
+
+Functions:
+- get_engine(name) -> ScoringEngine
+- rank_corpus(index, job_description, engine="bm25", top_k=10) -> List[dict]
+"""
+
+import json
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from jd_analyzer import STOPWORDS
+
+INDEX_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./\-]*")
+
+
+def normalize_tokens(text: str) -> List[str]:
+    """Lowercased word tokens with edge punctuation and stopwords removed."""
+    out = []
+    for tok in _TOKEN_RE.findall((text or "").lower()):
+        tok = tok.rstrip("./-")
+        if tok and tok not in STOPWORDS:
+            out.append(tok)
+    return out
+
+
+def term_counts(text: str, ngram: int = 2) -> Counter:
+    """Counts of unigrams plus word n-grams (2..ngram) joined by spaces."""
+    tokens = normalize_tokens(text)
+    counts = Counter(tokens)
+    for n in range(2, ngram + 1):
+        for i in range(len(tokens) - n + 1):
+            counts[" ".join(tokens[i:i + n])] += 1
+    return counts
+
+
+# ------------------- Corpus index ------------------- #
+class CorpusIndex:
+    def __init__(self, ngram: int = 2):
+        self.ngram = ngram
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_terms: Dict[str, Dict[str, int]] = {}
+        self.doc_len: Dict[str, int] = {}
+        self.total_len = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def __contains__(self, doc_id) -> bool:
+        return str(doc_id) in self.doc_terms
+
+    @property
+    def avg_len(self) -> float:
+        return self.total_len / len(self.doc_terms) if self.doc_terms else 0.0
+
+    def df(self, term: str) -> int:
+        return len(self.postings.get(term, ()))
+
+    def idf(self, term: str) -> float:
+        # BM25+ style idf: always positive, so common terms never subtract
+        n, df = len(self.doc_terms), self.df(term)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def add(self, doc_id, text: str) -> None:
+        """Index (or re-index) one document; ids are stored as strings."""
+        doc_id = str(doc_id)
+        if doc_id in self.doc_terms:
+            self.remove(doc_id)
+        counts = term_counts(text, self.ngram)
+        self._add_counts(doc_id, dict(counts))
+
+    def add_many(self, docs: Iterable[Tuple[Any, str]]) -> None:
+        for doc_id, text in docs:
+            self.add(doc_id, text)
+
+    def remove(self, doc_id) -> None:
+        doc_id = str(doc_id)
+        counts = self.doc_terms.pop(doc_id, None)
+        if counts is None:
+            return
+        for term in counts:
+            plist = self.postings.get(term)
+            if plist is not None:
+                plist.pop(doc_id, None)
+                if not plist:
+                    del self.postings[term]
+        self.total_len -= self.doc_len.pop(doc_id, 0)
+
+    def save(self, path: str) -> None:
+        data = {"version": INDEX_VERSION, "ngram": self.ngram, "docs": self.doc_terms}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "CorpusIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported corpus index version: {data.get('version')}")
+        index = cls(ngram=data.get("ngram", 2))
+        for doc_id, counts in data.get("docs", {}).items():
+            index._add_counts(doc_id, counts)
+        return index
+
+    def _add_counts(self, doc_id: str, counts: Dict[str, int]) -> None:
+        self.doc_terms[doc_id] = counts
+        length = sum(c for t, c in counts.items() if " " not in t)
+        self.doc_len[doc_id] = length
+        self.total_len += length
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+
+
+# ------------------- Engines ------------------- #
+class ScoringEngine(ABC):
+    """Scores indexed documents against a JD; subclasses define `_score`."""
+
+    name = "base"
+
+    def query_terms(self, index: CorpusIndex, job_description: str) -> List[str]:
+        return list(term_counts(job_description, 1))
+
+    def rank(self, index: CorpusIndex, job_description: str,
+             top_k: Optional[int] = 10) -> List[Dict[str, Any]]:
+        terms = self.query_terms(index, job_description)
+        # computed once per query term, not once per posting or result
+        weights = {term: self._term_weight(index, term) for term in terms}
+        total_weight = sum(weights.values())
+        scores: Dict[str, float] = {}
+        matched: Dict[str, List[str]] = {}
+        for term in terms:
+            plist = index.postings.get(term)
+            if not plist:
+                continue
+            weight = weights[term]
+            for doc_id, tf in plist.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + self._score(index, weight, doc_id, tf)
+                matched.setdefault(doc_id, []).append(term)
+
+        ranked = sorted(scores.items(), key=lambda kv: -kv[1])
+        if top_k is not None:
+            ranked = ranked[:top_k]
+        results = []
+        for doc_id, score in ranked:
+            hit = set(matched[doc_id])
+            results.append({
+                "id": doc_id,
+                "score": round(self._finalize(score, total_weight), 4),
+                "matched": matched[doc_id],
+                "missing": [t for t in terms if t not in hit],
+            })
+        return results
+
+    def score(self, resume_text: str, job_description: str) -> float:
+        """Score a single resume without a prebuilt index."""
+        index = CorpusIndex(ngram=getattr(self, "ngram", 1))
+        index.add("resume", resume_text)
+        ranked = self.rank(index, job_description, top_k=1)
+        return ranked[0]["score"] if ranked else 0.0
+
+    def _term_weight(self, index: CorpusIndex, term: str) -> float:
+        return index.idf(term)
+
+    @abstractmethod
+    def _score(self, index: CorpusIndex, weight: float, doc_id: str, tf: int) -> float:
+        """Contribution of one posting (term `weight`, term frequency `tf`)."""
+
+    def _finalize(self, score: float, total_weight: float) -> float:
+        """Final score from the summed contributions; `total_weight` sums the query's term weights."""
+        return score
+
+
+class TfidfEngine(ScoringEngine):
+    name = "tfidf"
+
+    def _score(self, index, weight, doc_id, tf):
+        return (1 + math.log(tf)) * weight / math.sqrt(max(index.doc_len[doc_id], 1))
+
+
+class BM25Engine(ScoringEngine):
+    name = "bm25"
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def _score(self, index, weight, doc_id, tf):
+        norm = 1 - self.b + self.b * index.doc_len[doc_id] / (index.avg_len or 1)
+        return weight * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+
+class PhraseEngine(ScoringEngine):
+    """
+    Percentage (0-100) of the JD's idf weight covered by the resume, where
+    JD n-gram phrases count `phrase_weight` times as much as single terms.
+    Needs an index built with ngram >= the engine's ngram.
+    """
+
+    name = "phrase"
+
+    def __init__(self, ngram: int = 2, phrase_weight: float = 2.0):
+        self.ngram = ngram
+        self.phrase_weight = phrase_weight
+
+    def query_terms(self, index, job_description):
+        return list(term_counts(job_description, min(self.ngram, index.ngram)))
+
+    def _term_weight(self, index, term):
+        w = index.idf(term)
+        return w * self.phrase_weight if " " in term else w
+
+    def _score(self, index, weight, doc_id, tf):
+        return weight
+
+    def _finalize(self, score, total_weight):
+        return 100 * score / total_weight if total_weight else 0.0
+
+
+ENGINES = {
+    "tfidf": TfidfEngine,
+    "bm25": BM25Engine,
+    "phrase": PhraseEngine,
+}
+
+
+def get_engine(name: str, **kwargs) -> ScoringEngine:
+    try:
+        return ENGINES[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown scoring engine '{name}'. Choose from: {', '.join(ENGINES)}")
+
+
+def rank_corpus(index: CorpusIndex, job_description: str, engine: str = "bm25",
+                top_k: Optional[int] = 10) -> List[Dict[str, Any]]:
+    """Rank every indexed resume for `job_description` with the named engine."""
+    return get_engine(engine).rank(index, job_description, top_k=top_k)
@@ -0,0 +1,215 @@
+# skill_index.py
+"""
+Inverted index from normalized skill / degree / certification terms to
+resume ids, answering "which candidates have X" without re-parsing PDFs.
+
+Terms come from the structured lists resume_paser already extracts and are
+stored per field ("skill:python", "degree:bachelor of technology",
+"cert:aws certified developer"). Degree abbreviations are expanded through
+DEGREE_MAP on both sides, so "B.Tech" finds "Bachelor of Technology".
+
+Queries are boolean expressions:
+    skill:python AND (skill:django OR skill:flask) AND NOT cert:"aws certified developer"
+Adjacent terms are ANDed, a bare term matches any field, and quotes allow
+multi-word terms.
+
+Classes:
+- CandidateIndex() with add(resume_id, parsed) / remove / query / find / save / load
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from resume_paser import DEGREE_MAP
+
+INDEX_VERSION = 1
+FIELDS = ("skill", "degree", "cert")
+
+_QUERY_TOKEN_RE = re.compile(r'\(|\)|(?:\w+:)?"[^"]*"|[^\s()]+')
+
+
+def normalize_term(text: str) -> str:
+    term = re.sub(r"\s+", " ", str(text or "").lower()).strip(" .,;:-•\t")
+    return term
+
+
+def normalize_degree(text: str) -> str:
+    term = normalize_term(text)
+    full = DEGREE_MAP.get(term.upper()) or DEGREE_MAP.get(term.upper().replace(" ", ""))
+    return normalize_term(full) if full else term
+
+
+def resume_terms(parsed: Dict[str, Any]) -> Set[str]:
+    """Field-prefixed terms for one parsed resume dict."""
+    terms: Set[str] = set()
+    for s in parsed.get("skills") or []:
+        t = normalize_term(s)
+        if t:
+            terms.add(f"skill:{t}")
+    for e in parsed.get("education") or []:
+        degree = e.get("degree") if isinstance(e, dict) else e
+        t = normalize_degree(degree)
+        if t:
+            terms.add(f"degree:{t}")
+    for c in parsed.get("certifications") or []:
+        t = normalize_term(c)
+        if t:
+            terms.add(f"cert:{t}")
+    return terms
+
+
+class CandidateIndex:
+    def __init__(self):
+        self.postings: Dict[str, Set[str]] = {}
+        self.doc_terms: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def __contains__(self, resume_id) -> bool:
+        return str(resume_id) in self.doc_terms
+
+    # ------------------- Updates ------------------- #
+    def add(self, resume_id, parsed: Dict[str, Any]) -> None:
+        """Index (or re-index) one parsed resume; ids are stored as strings."""
+        resume_id = str(resume_id)
+        self.remove(resume_id)
+        self._add_terms(resume_id, resume_terms(parsed))
+
+    def add_many(self, items: Iterable) -> None:
+        for resume_id, parsed in items:
+            self.add(resume_id, parsed)
+
+    def remove(self, resume_id) -> None:
+        resume_id = str(resume_id)
+        for term in self.doc_terms.pop(resume_id, ()):
+            ids = self.postings.get(term)
+            if ids is not None:
+                ids.discard(resume_id)
+                if not ids:
+                    del self.postings[term]
+
+    # ------------------- Lookups ------------------- #
+    def lookup(self, term: str) -> Set[str]:
+        """Ids for one term: "field:value", or a bare value matched in any field."""
+        field, _, value = term.partition(":")
+        if value and field in FIELDS:
+            value = value.strip('"')
+            value = normalize_degree(value) if field == "degree" else normalize_term(value)
+            return set(self.postings.get(f"{field}:{value}", ()))
+        value = term.strip('"')
+        out: Set[str] = set()
+        for f in FIELDS:
+            v = normalize_degree(value) if f == "degree" else normalize_term(value)
+            out |= self.postings.get(f"{f}:{v}", set())
+        return out
+
+    def find(self, all_of: Iterable[str] = (), any_of: Iterable[str] = (),
+             none_of: Iterable[str] = ()) -> List[str]:
+        """Structured form of query(): every all_of, at least one any_of, no none_of."""
+        result: Optional[Set[str]] = None
+        for term in all_of:
+            ids = self.lookup(term)
+            result = ids if result is None else result & ids
+        any_of = list(any_of)
+        if any_of:
+            ids = set().union(*(self.lookup(t) for t in any_of))
+            result = ids if result is None else result & ids
+        if result is None:
+            result = set(self.doc_terms)
+        for term in none_of:
+            result -= self.lookup(term)
+        return sorted(result)
+
+    def query(self, expression: str) -> List[str]:
+        """Evaluate an AND / OR / NOT expression (with parentheses); sorted ids."""
+        tokens = _QUERY_TOKEN_RE.findall(expression or "")
+        if not tokens:
+            return []
+        parser = _QueryParser(tokens, self)
+        result = parser.parse()
+        return sorted(result)
+
+    # ------------------- Persistence ------------------- #
+    def save(self, path: str) -> None:
+        data = {"version": INDEX_VERSION,
+                "docs": {rid: sorted(terms) for rid, terms in self.doc_terms.items()}}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "CandidateIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported candidate index version: {data.get('version')}")
+        index = cls()
+        for rid, terms in data.get("docs", {}).items():
+            index._add_terms(rid, set(terms))
+        return index
+
+    def _add_terms(self, resume_id: str, terms: Set[str]) -> None:
+        self.doc_terms[resume_id] = terms
+        for term in terms:
+            self.postings.setdefault(term, set()).add(resume_id)
+
+
+class _QueryParser:
+    """
+    Recursive-descent evaluator:
+        expr := and_expr (OR and_expr)*
+        and_expr := not_expr ([AND] not_expr)*
+        not_expr := NOT not_expr | "(" expr ")" | term
+    """
+
+    def __init__(self, tokens: List[str], index: CandidateIndex):
+        self.tokens = tokens
+        self.pos = 0
+        self.index = index
+
+    def parse(self) -> Set[str]:
+        result = self._expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected token in query: {self.tokens[self.pos]!r}")
+        return result
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> str:
+        tok = self._peek()
+        if tok is None:
+            raise ValueError("Unexpected end of query")
+        self.pos += 1
+        return tok
+
+    def _expr(self) -> Set[str]:
+        result = self._and_expr()
+        while (self._peek() or "").upper() == "OR":
+            self._next()
+            result = result | self._and_expr()
+        return result
+
+    def _and_expr(self) -> Set[str]:
+        result = self._not_expr()
+        while True:
+            tok = self._peek()
+            if tok is None or tok == ")" or tok.upper() == "OR":
+                return result
+            if tok.upper() == "AND":
+                self._next()
+            result = result & self._not_expr()
+
+    def _not_expr(self) -> Set[str]:
+        tok = self._next()
+        if tok.upper() == "NOT":
+            return set(self.index.doc_terms) - self._not_expr()
+        if tok == "(":
+            result = self._expr()
+            if self._next() != ")":
+                raise ValueError("Missing ')' in query")
+            return result
+        if tok == ")" or tok.upper() in ("AND", "OR"):
+            raise ValueError(f"Unexpected token in query: {tok!r}")
+        return self.index.lookup(tok)
@@ -0,0 +1,257 @@
+# spell.py
+"""
+Fast spelling correction for resume text (SymSpell-style).
+
+A symmetric-delete index is precomputed once from TextBlob's own word
+frequency list (en-spelling.txt, already installed with textblob): every
+dictionary word is stored under all of its deletes up to
+`max_edit_distance`. A lookup generates the deletes of the input word and
+only verifies the few candidates sharing one, instead of TextBlob's
+per-word edit search over the whole vocabulary.
+
+Only out-of-vocabulary lower-case words are corrected. A word counts as
+known when it, or its stem without a regular inflection ("teams",
+"leveraged", "optimised" -> "optimized"), is in the dictionary. Tech terms
+(TECH_TERMS), capitalized words (sentence starts, names, places), acronyms,
+camelCase names and tokens with digits or symbols ("C++", "node.js", "S3")
+are never touched, and every correction is cached per token.
+
+TECH_TERMS and RESUME_TERMS are added to the dictionary with a high count,
+so a typo next to both a literary word and a resume word ("enginer":
+engine / engineer) resolves to the resume word.
+
+Building the index takes about 1.5-2 s, once per process, on the first
+get_corrector() / correct_text() call; call get_corrector() at startup to
+keep that off a request.
+
+Functions:
+- get_corrector() -> SpellCorrector (process-wide, built lazily)
+- correct_text(text) -> str
+"""
+
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+
+TECH_TERMS = set("""
+kubernetes k8s pytorch tensorflow keras numpy pandas scipy sklearn scikit matplotlib seaborn
+django flask fastapi streamlit spacy nltk textblob opencv huggingface langchain llm llms
+javascript typescript nodejs reactjs react angular vue nextjs jquery redux webpack vite
+java kotlin scala golang rust ruby rails php laravel swift dart flutter csharp dotnet
+sql mysql postgresql postgres sqlite mongodb redis cassandra dynamodb elasticsearch kafka
+rabbitmq spark hadoop airflow snowflake databricks bigquery redshift tableau powerbi looker
+docker podman terraform ansible jenkins gitlab github bitbucket jira confluence kubectl helm
+aws gcp azure ec2 lambda cloudformation cloudwatch firebase firestore heroku vercel netlify
+linux ubuntu debian centos unix bash zsh powershell git devops mlops sre cicd
+backend frontend fullstack microservice microservices api apis sdk sdks graphql grpc rest
+restful json yaml xml html css scss sass tailwind bootstrap figma
+oauth jwt saml ldap ssl tls http https websocket websockets
+scalable scalability deployable dataset datasets workflow workflows pipeline pipelines
+dashboard dashboards analytics chatbot chatbots startup startups saas paas iaas
+onboarding upskilling stakeholder stakeholders hackathon hackathons internship internships
+btech mtech mca bca bsc msc mba bba
+python excel matlab perl html5 css3 numpy jupyter vscode postman selenium pytest junit
+""".split())
+
+# common resume vocabulary missing from TextBlob's (literary) frequency list
+RESUME_TERMS = set("""
+engineer engineers engineering developer developers development team teams skill skills
+leverage leveraged leveraging optimize optimized optimizing optimization optimise optimised
+collaborate collaborated collaboration collaborative mentor mentored mentoring
+implement implemented implementation deploy deployed deployment automate automated automation
+architect architected architecture integrate integrated integration migrate migrated migration
+analyze analyzed analysis analytical troubleshoot troubleshooting debug debugging
+maintain maintained maintenance streamline streamlined spearhead spearheaded
+coordinate coordinated coordinator initiative initiatives cross functional
+responsibilities responsible achievement achievements certification certifications
+proficient proficiency expertise experience experienced internship intern
+management manager managed project projects product products client clients
+customer customers requirement requirements performance reliability latency throughput
+database databases server servers cloud infrastructure platform platforms application applications
+software hardware framework frameworks library libraries module modules feature features
+testing tested unit regression documentation documented reporting dashboarding
+""".split())
+
+# counted like a common word, so domain terms win ties against rare literary ones
+DOMAIN_WORD_COUNT = 1000
+
+# regular inflections: (suffix, replacements for the stem lookup)
+_INFLECTIONS = (
+    ("ies", ("y",)), ("ied", ("y",)), ("es", ("", "e")), ("s", ("",)),
+    ("ed", ("", "e")), ("d", ("",)), ("ing", ("", "e")),
+    ("isation", ("ization", "ize")), ("ised", ("ized", "ize")), ("ising", ("izing", "ize")),
+    ("ise", ("ize",)), ("ly", ("",)),
+)
+
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'’]*")
+# anything glued to digits or symbols is an identifier, not prose
+_GLUED_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9]*[0-9+#@/_.\-][A-Za-z0-9+#@/_.\-]*|[0-9]+[A-Za-z]+")
+
+
+def _default_dictionary_path() -> Optional[str]:
+    try:
+        import textblob
+    except Exception:
+        return None
+    path = os.path.join(os.path.dirname(textblob.__file__), "en", "en-spelling.txt")
+    return path if os.path.exists(path) else None
+
+
+class SymSpell:
+    def __init__(self, max_edit_distance: int = 2, prefix_length: int = 7):
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.words: Dict[str, int] = {}
+        self.deletes: Dict[str, List[str]] = {}
+
+    def add_word(self, word: str, count: int = 1) -> None:
+        if word in self.words:
+            self.words[word] += count
+            return
+        self.words[word] = count
+        for d in self._edits(word[:self.prefix_length]):
+            self.deletes.setdefault(d, []).append(word)
+
+    def load_frequencies(self, path: str) -> None:
+        """Read "word count" lines (";;;" comments skipped)."""
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(";;;"):
+                    continue
+                parts = line.split()
+                if len(parts) == 2 and parts[1].isdigit():
+                    self.add_word(parts[0].lower(), int(parts[1]))
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Closest dictionary word (smallest distance, then most frequent)."""
+        if word in self.words:
+            return word
+        best, best_key = None, None
+        seen: Set[str] = set()
+        for d in self._edits(word[:self.prefix_length]):
+            for cand in self.deletes.get(d, ()):
+                if cand in seen:
+                    continue
+                seen.add(cand)
+                if abs(len(cand) - len(word)) > self.max_edit_distance:
+                    continue
+                dist = _osa_distance(word, cand, self.max_edit_distance)
+                if dist > self.max_edit_distance:
+                    continue
+                key = (dist, -self.words[cand])
+                if best_key is None or key < best_key:
+                    best, best_key = cand, key
+        return best
+
+    def _edits(self, word: str) -> Set[str]:
+        out = {word}
+        frontier = {word}
+        for _ in range(self.max_edit_distance):
+            nxt = set()
+            for w in frontier:
+                if len(w) <= 1:
+                    continue
+                for i in range(len(w)):
+                    nxt.add(w[:i] + w[i + 1:])
+            nxt -= out
+            out |= nxt
+            frontier = nxt
+        return out
+
+
+def _osa_distance(a: str, b: str, limit: int) -> int:
+    """Optimal-string-alignment distance; returns limit + 1 once exceeded."""
+    if a == b:
+        return 0
+    la, lb = len(a), len(b)
+    prev2: List[int] = []
+    prev = list(range(lb + 1))
+    for i in range(1, la + 1):
+        cur = [i] + [0] * lb
+        row_min = cur[0]
+        for j in range(1, lb + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                v = min(v, prev2[j - 2] + 1)
+            cur[j] = v
+            row_min = min(row_min, v)
+        if row_min > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[lb]
+
+
+class SpellCorrector:
+    def __init__(self, symspell: SymSpell, protected: Iterable[str] = ()):
+        self.symspell = symspell
+        self.protected = {w.lower() for w in TECH_TERMS} | {w.lower() for w in protected}
+        self._correct_word = lru_cache(maxsize=50000)(self._correct_word_uncached)
+
+    def correct_text(self, text: str) -> str:
+        """Correct prose words in `text`, leaving identifiers/spacing intact."""
+        glued = [(m.start(), m.end()) for m in _GLUED_RE.finditer(text)]
+        out, pos, gi = [], 0, 0
+        for m in _WORD_RE.finditer(text):
+            start, end = m.span()
+            while gi < len(glued) and glued[gi][1] <= start:
+                gi += 1
+            if gi < len(glued) and glued[gi][0] <= start < glued[gi][1]:
+                continue  # part of "node.js", "S3", "C++" ...
+            out.append(text[pos:start])
+            out.append(self._correct_word(m.group(0)))
+            pos = end
+        out.append(text[pos:])
+        return "".join(out)
+
+    def is_known(self, word: str) -> bool:
+        """In the dictionary (or protected), directly or as a regular inflection."""
+        low = word.lower().replace("’", "'")
+        if low.endswith("'s"):
+            low = low[:-2]
+        if low in self.protected or low in self.symspell.words:
+            return True
+        for suffix, replacements in _INFLECTIONS:
+            if low.endswith(suffix) and len(low) - len(suffix) >= 2:
+                stem = low[:-len(suffix)]
+                for r in replacements:
+                    if stem + r in self.symspell.words or stem + r in self.protected:
+                        return True
+                # doubled consonant: "planned" -> "plan"
+                if len(stem) > 2 and stem[-1] == stem[-2] and stem[:-1] in self.symspell.words:
+                    return True
+        return False
+
+    def _correct_word_uncached(self, word: str) -> str:
+        # capitalized words are names, places, acronyms or sentence starts
+        # (API, PyTorch, Mumbai, Optimised); only lower-case prose is corrected
+        if len(word) < 3 or not word.islower() or self.is_known(word):
+            return word
+        fixed = self.symspell.lookup(word)
+        return fixed if fixed else word
+
+
+_corrector: Optional[SpellCorrector] = None
+_lock = threading.Lock()
+
+
+def get_corrector() -> SpellCorrector:
+    """Shared corrector; the delete index is built on first use (~1.5-2 s)."""
+    global _corrector
+    if _corrector is None:
+        with _lock:
+            if _corrector is None:
+                symspell = SymSpell()
+                path = _default_dictionary_path()
+                if path:
+                    symspell.load_frequencies(path)
+                for term in TECH_TERMS | RESUME_TERMS:
+                    symspell.add_word(term, DOMAIN_WORD_COUNT)
+                _corrector = SpellCorrector(symspell)
+    return _corrector
+
+
+def correct_text(text: str) -> str:
+    return get_corrector().correct_text(text)
@@ -1,69 +1,72 @@
-from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from io import BytesIO
+import metrics
+from docx_template import (new_resume_document, NAME_STYLE, CONTACT_STYLE, HEADING_STYLE,
+                           BODY_STYLE, ENTRY_STYLE, EDUCATION_STYLE, SMALL_STYLE, BULLET_STYLE)
 
+@metrics.timed("render_docx")
 def build_template_resume(data):
     """
     Builds a DOCX resume from structured resume data.
+    Paragraphs are formatted by style name from the shared base template
+    (docx_template.py), so no per-run fonts or border XML are built here.
     """
-    doc = Document()
+    doc = new_resume_document()
+    # resolve named styles once; passing style objects skips a by-name
+    # search of styles.xml on every add_paragraph
+    styles = {name: doc.styles[name] for name in (NAME_STYLE, CONTACT_STYLE, HEADING_STYLE, BODY_STYLE,
+                                                   ENTRY_STYLE, EDUCATION_STYLE, SMALL_STYLE, BULLET_STYLE)}
 
     # ===== NAME =====
     if data.get("name"):
-        name_para = doc.add_paragraph(data["name"])
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        name_para.runs[0].bold = True
-        name_para.runs[0].font.size = Pt(16)
+        doc.add_paragraph(data["name"], style=styles[NAME_STYLE])
 
     # ===== CONTACT =====
     if data.get("contact"):
-        contact_para = doc.add_paragraph(data["contact"])
-        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        doc.add_paragraph(data["contact"], style=styles[CONTACT_STYLE])
 
     # ===== SUMMARY =====
     if data.get("summary"):
-        add_heading_with_line(doc, "SUMMARY")
-        doc.add_paragraph(data["summary"])
+        add_section_heading(doc, styles, "SUMMARY")
+        doc.add_paragraph(data["summary"], style=styles[BODY_STYLE])
 
     # ===== SKILLS =====
     if data.get("skills"):
-        add_heading_with_line(doc, "SKILLS")
+        add_section_heading(doc, styles, "SKILLS")
         skills_str = ", ".join([s for s in data["skills"] if s.strip()])
         if skills_str:
-            doc.add_paragraph(skills_str)
+            doc.add_paragraph(skills_str, style=styles[BODY_STYLE])
 
     # ===== EXPERIENCE =====
     if data.get("experience"):
         experience_entries = [exp for exp in data["experience"] if exp.get("role") or exp.get("company")]
         if experience_entries:
-            add_heading_with_line(doc, "EXPERIENCE")
+            add_section_heading(doc, styles, "EXPERIENCE")
             for exp in experience_entries:
                 role_line = f"{exp.get('role', '')} – {exp.get('company', '')} ({exp.get('duration', '')})".strip()
                 if role_line:
-                    role_para = doc.add_paragraph(role_line)
-                    role_para.runs[0].bold = True
+                    doc.add_paragraph(role_line, style=styles[ENTRY_STYLE])
                 for d in exp.get("details", []):
                     if d.strip():
-                        doc.add_paragraph(d, style="List Bullet")
+                        doc.add_paragraph(d, style=styles[BULLET_STYLE])
 
     # ===== PROJECTS =====
     if data.get("projects"):
         project_entries = [proj for proj in data["projects"] if proj.get("name")]
         if project_entries:
-            add_heading_with_line(doc, "PROJECTS")
-            for proj in _format_projects(project_entries):
-                proj_para = doc.add_paragraph(proj["name"].upper())
-                proj_para.runs[0].bold = True
+            add_section_heading(doc, styles, "PROJECTS")
+            for proj in format_projects(project_entries):
+                doc.add_paragraph(proj["name"].upper(), style=styles[ENTRY_STYLE])
                 for bullet in proj["details"]:
                     if bullet.strip():
-                        doc.add_paragraph(bullet, style="List Bullet")
+                        doc.add_paragraph(bullet, style=styles[BULLET_STYLE])
 
     # ===== EDUCATION =====
     if data.get("education"):
-        add_heading_with_line(doc, "EDUCATION")
+        add_section_heading(doc, styles, "EDUCATION")
         if isinstance(data["education"], list):
             top_two = [e for e in data["education"] if isinstance(e, dict) and (e.get("degree") or e.get("university"))][:2]
             for e in top_two:
@@ -76,9 +79,7 @@ def build_template_resume(data):
                 # Line 1 → Degree — University
                 line1 = " — ".join([deg for deg in [degree, university] if deg])
                 if line1:
-                    p = doc.add_paragraph(line1)
-                    p.runs[0] = True
-                    p.runs[0].font.size = Pt(11)
+                    doc.add_paragraph(line1, style=styles[EDUCATION_STYLE])
 
                 # Line 2 → Years
                 year_text = ""
@@ -87,20 +88,19 @@ def build_template_resume(data):
                
 
                 if year_text:
-                    p2 = doc.add_paragraph(year_text)
-                    p2.runs[0].font.size = Pt(10)
+                    doc.add_paragraph(year_text, style=styles[SMALL_STYLE])
         else:
             edu_text = str(data["education"]).strip()
             if edu_text:
-                doc.add_paragraph(edu_text)
+                doc.add_paragraph(edu_text, style=styles[BODY_STYLE])
 
     # ===== CERTIFICATIONS =====
     if data.get("certifications"):
         certs = [c for c in data["certifications"] if str(c).strip()]
         if certs:
-            add_heading_with_line(doc, "CERTIFICATIONS")
+            add_section_heading(doc, styles, "CERTIFICATIONS")
             for cert in certs:
-                doc.add_paragraph(str(cert).strip(), style="List Bullet")
+                doc.add_paragraph(str(cert).strip(), style=styles[BULLET_STYLE])
 
     # ===== SAVE TO BYTES =====
     buffer = BytesIO()
@@ -109,6 +109,14 @@ def build_template_resume(data):
     return buffer
 
 
+def add_section_heading(doc, styles, text):
+    """
+    Adds a section heading; bold, size, spacing and the bottom border all
+    come from the template's heading style.
+    """
+    return doc.add_paragraph(text.upper(), style=styles[HEADING_STYLE])
+
+
 def add_heading_with_line(doc, text):
     """
     Adds a heading with an underline/border.
@@ -133,9 +141,10 @@ def add_heading_with_line(doc, text):
     p_pr.append(p_borders)
 
 
-def _format_projects(projects):
+def format_projects(projects):
     """
     Ensure projects have Objective, Tech Stack, Features.
+    Shared with pdf_renderer so both documents list the same bullets.
     """
     formatted = []
     for proj in projects:
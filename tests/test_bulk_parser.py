@@ -0,0 +1,27 @@
+import os
+import time
+
+import bulk_parser
+from bulk_parser import parse_resumes_bulk
+
+
+def _crashing_parse(item):
+    # runs in the (forked) worker; `data` carries the path of a shared log
+    rid, filename, log = item[0], item[1], item[2].decode()
+    if rid == "crash":
+        time.sleep(1.0)  # let the other worker finish the rest first
+        os._exit(1)
+    with open(log, "a") as f:
+        f.write(rid + "\n")
+    return {"id": rid, "filename": filename, "parsed": {}}
+
+
+def test_finished_results_survive_a_broken_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_parser, "_parse_one", _crashing_parse)
+    log = str(tmp_path / "calls.log")
+    items = [(rid, log.encode()) for rid in ("crash", "a", "b", "c")]
+    records = list(parse_resumes_bulk(items, workers=2))
+    assert [r["id"] for r in records] == ["crash", "a", "b", "c"]
+    assert records[0]["error"] == "Worker process crashed while parsing"
+    with open(log) as f:
+        assert sorted(f.read().split()) == ["a", "b", "c"]  # none parsed twice
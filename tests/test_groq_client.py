@@ -0,0 +1,121 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from groq_client import AsyncGroqClient, GroqAPIError, GroqClient, parse_retry_delay  # noqa: E402
+from llm_stub import SUGGESTIONS, start_stub  # noqa: E402
+
+PAYLOAD = {"model": "stub", "messages": [{"role": "user", "content": "hi"}]}
+
+
+@pytest.fixture
+def stub(request):
+    marker = request.node.get_closest_marker("stub")
+    kwargs = dict(marker.kwargs) if marker else {}
+    kwargs.setdefault("latency", 0.0)
+    server = start_stub(**kwargs)
+    yield server
+    server.shutdown()
+
+
+def _client(server, **kwargs):
+    kwargs.setdefault("backoff_base", 0.01)
+    return AsyncGroqClient("key", base_url=f"http://127.0.0.1:{server.server_port}/", **kwargs)
+
+
+def _post(client, **kwargs):
+    async def run():
+        try:
+            return await client.post_json(PAYLOAD, **kwargs)
+        finally:
+            await client.aclose()
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"retry-after": "2"}, 2.0),
+    ({"retry-after": "0.5"}, 0.5),
+    ({"retry-after": "-3"}, 0.0),
+    ({"x-ratelimit-reset-requests": "1m2.5s"}, 62.5),
+    ({"x-ratelimit-reset-tokens": "750ms"}, 0.75),
+    ({"x-ratelimit-reset-requests": "2s", "x-ratelimit-reset-tokens": "1h"}, 3600.0),
+    ({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT", "x-ratelimit-reset-tokens": "3s"}, 3.0),
+    ({"retry-after": "soon"}, None),
+    ({}, None),
+])
+def test_parse_retry_delay(headers, expected):
+    assert parse_retry_delay(headers) == expected
+
+
+@pytest.mark.stub(failures=[(429, {"retry-after": "0.3"})])
+def test_429_waits_for_retry_after(stub):
+    start = time.monotonic()
+    resp = _post(_client(stub))
+    assert resp["choices"][0]["message"]["content"] == SUGGESTIONS
+    assert time.monotonic() - start >= 0.3
+    assert stub.requests == 2
+
+
+@pytest.mark.stub(failures=[(503, {}), (502, {}), (500, {})])
+def test_5xx_backs_off_and_retries(stub):
+    resp = _post(_client(stub, max_retries=4))
+    assert "choices" in resp
+    assert stub.requests == 4
+
+
+@pytest.mark.stub(failures=[(500, {})] * 5)
+def test_retries_are_bounded(stub):
+    resp = _post(_client(stub, max_retries=2))
+    assert resp["error"]["message"] == "Request failed after retries (HTTP 500)"
+    assert stub.requests == 3
+
+
+@pytest.mark.stub(failures=[(400, {})])
+def test_client_errors_are_not_retried(stub):
+    resp = _post(_client(stub))
+    assert resp["error"]["message"] == "stub error 400"
+    assert stub.requests == 1
+
+
+@pytest.mark.stub(failures=[(429, {"retry-after": "5"})] * 3)
+def test_deadline_stops_before_a_long_retry_after(stub):
+    start = time.monotonic()
+    resp = _post(_client(stub), deadline=1.0)
+    assert "error" in resp
+    assert time.monotonic() - start < 1.0
+    assert stub.requests == 1
+
+
+@pytest.mark.stub(latency=2.0)
+def test_deadline_bounds_a_slow_server(stub):
+    start = time.monotonic()
+    resp = _post(_client(stub), deadline=0.3)
+    assert "ReadTimeout" in resp["error"]["message"]
+    assert time.monotonic() - start < 1.0
+
+
+@pytest.mark.stub(failures=[(503, {})])
+def test_stream_chat_assembles_chunks_after_a_retry(stub):
+    client = GroqClient("key", base_url=f"http://127.0.0.1:{stub.server_port}/", backoff_base=0.01)
+    try:
+        deltas = list(client.stream_chat(PAYLOAD))
+    finally:
+        client.close()
+    assert len(deltas) > 1
+    assert "".join(deltas) == SUGGESTIONS
+    assert stub.requests == 2
+
+
+@pytest.mark.stub(failures=[(401, {})])
+def test_stream_chat_raises_on_client_error(stub):
+    client = GroqClient("key", base_url=f"http://127.0.0.1:{stub.server_port}/")
+    try:
+        with pytest.raises(GroqAPIError, match="stub error 401"):
+            list(client.stream_chat(PAYLOAD))
+    finally:
+        client.close()
@@ -0,0 +1,88 @@
+import json
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import jobs
+from jobs import JobQueue
+
+
+@pytest.fixture
+def sleep_handler(monkeypatch):
+    release = threading.Event()
+
+    def run(params, report):
+        release.wait(5)
+        return {"ok": params["n"]}
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "sleep", run)
+    yield release
+    release.set()
+
+
+def _insert(db, job_id, status, heartbeat, owner="dead:1:x"):
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO jobs (id, kind, status, params, progress, created, updated, owner, heartbeat) "
+                     "VALUES (?, 'sleep', ?, ?, '[]', ?, ?, ?, ?)",
+                     (job_id, status, json.dumps({"n": 1}), time.time(), time.time(), owner, heartbeat))
+
+
+def test_live_jobs_are_not_recovered_by_another_queue(tmp_path, sleep_handler):
+    db = str(tmp_path / "jobs.db")
+    first = JobQueue(workers=1, db_path=db, lease_seconds=1)
+    job_id = first.submit("sleep", {"n": 1})
+    time.sleep(0.2)
+    second = JobQueue(workers=1, db_path=db, lease_seconds=1)
+    time.sleep(1.5)  # several lease periods: the first queue keeps renewing
+    assert second.pending() == 0 and job_id not in second._jobs
+    sleep_handler.set()
+    assert first.wait(job_id, timeout=5)["status"] == "done"
+    first.shutdown()
+    second.shutdown()
+
+
+def test_expired_jobs_are_claimed_once(tmp_path, sleep_handler):
+    db = str(tmp_path / "jobs.db")
+    JobQueue(workers=1, db_path=db).shutdown()  # create the table
+    _insert(db, "stale", "running", time.time() - 3600)
+    _insert(db, "fresh", "running", time.time(), owner="alive:2:y")
+    sleep_handler.set()
+    queues = [JobQueue(workers=1, db_path=db, lease_seconds=60) for _ in range(3)]
+    deadline = time.monotonic() + 5
+    while queues[0].get("stale")["status"] != "done" and time.monotonic() < deadline:
+        time.sleep(0.05)  # the lease threads claim on their first beat
+    owners = [q for q in queues if "stale" in q._jobs]
+    assert len(owners) == 1
+    assert owners[0].get("stale")["result"] == {"ok": 1}
+    assert queues[0].get("fresh")["status"] == "running"
+    for q in queues:
+        q.shutdown()
+
+
+def test_instant_jobs_reach_a_final_status_in_the_db(tmp_path, monkeypatch):
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "instant", lambda params, report: {"ok": params["n"]})
+    db = str(tmp_path / "jobs.db")
+    q = JobQueue(workers=4, max_pending=1000, db_path=db)
+    ids = [q.submit("instant", {"n": i}) for i in range(300)]
+    for job_id in ids:
+        assert q.wait(job_id, timeout=5)["status"] == "done"
+    q.shutdown()
+    with sqlite3.connect(db) as conn:
+        statuses = dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+    assert statuses == {"done": 300}
+
+
+def test_full_queue_leaves_no_row(tmp_path, sleep_handler):
+    db = str(tmp_path / "jobs.db")
+    q = JobQueue(workers=1, max_pending=1, db_path=db)
+    q.submit("sleep", {"n": 1})
+    time.sleep(0.1)  # the worker takes the first job; the second fills the queue
+    q.submit("sleep", {"n": 2})
+    with pytest.raises(jobs.JobQueueFull):
+        q.submit("sleep", {"n": 3})
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 2
+    sleep_handler.set()
+    q.shutdown()
@@ -0,0 +1,25 @@
+import time
+
+from llm_cache import LLMCache
+
+PAYLOAD = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+
+
+def test_disk_hit_keeps_original_ttl(tmp_path):
+    db = str(tmp_path / "llm.db")
+    LLMCache(ttl=1, db_path=db).set(PAYLOAD, {"ok": True})
+    time.sleep(0.6)
+    cache = LLMCache(ttl=1, db_path=db)
+    assert cache.get(PAYLOAD) == {"ok": True}  # promoted from SQLite
+    time.sleep(0.6)
+    assert cache.get(PAYLOAD) is None  # 1.2 s after the original store
+
+
+def test_callers_cannot_mutate_cached_responses(tmp_path):
+    for cache in (LLMCache(), LLMCache(db_path=str(tmp_path / "llm.db"))):
+        response = {"choices": [{"message": {"content": "x"}}]}
+        cache.set(PAYLOAD, response)
+        response["choices"].clear()
+        hit = cache.get(PAYLOAD)
+        hit["choices"][0]["message"]["content"] = "edited"
+        assert cache.get(PAYLOAD) == {"choices": [{"message": {"content": "x"}}]}
@@ -0,0 +1,24 @@
+from matcher import calculate_match_score, rank_resumes
+
+JD = "Python developer with Docker Kubernetes AWS and SQL experience"
+# scores 33, 0 and 78: the best resume is neither first nor last
+RESUMES = {
+    "b": "Java developer with Docker",
+    "c": "",
+    "a": "Senior Python developer with SQL and AWS experience",
+}
+
+
+def test_rank_resumes_matches_calculate_match_score():
+    for result in rank_resumes(JD, RESUMES):
+        matched, missing, score = calculate_match_score(RESUMES[result["id"]], JD)
+        assert result["matched"] == matched == sorted(matched)
+        assert result["missing"] == missing
+        assert result["score"] == score
+
+
+def test_rank_resumes_orders_best_first():
+    ranked = rank_resumes(JD, RESUMES)
+    assert [r["id"] for r in ranked] == ["a", "b", "c"]
+    assert ranked[0]["score"] > ranked[1]["score"] > ranked[2]["score"]
+    assert [r["id"] for r in rank_resumes(JD, RESUMES, top_k=2)] == ["a", "b"]
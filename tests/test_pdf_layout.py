@@ -0,0 +1,105 @@
+import os
+import sys
+
+import fitz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from corpus import build_two_column_pdf  # noqa: E402
+from ingest import ingest_resume  # noqa: E402
+from pdf_layout import _Line, _reading_order, extract_pdf_layout  # noqa: E402
+from pdf_renderer import build_pdf_resume  # noqa: E402
+from resume_paser import extract_text_auto, parse_resume_auto, split_lines  # noqa: E402
+
+
+def _pdf(rows):
+    """One-page PDF; rows are (text, fontname, size)."""
+    doc = fitz.open()
+    page = doc.new_page()
+    y = 72
+    for text, font, size in rows:
+        page.insert_text((72, y), text, fontname=font, fontsize=size)
+        y += size + 6
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+RESUME = _pdf([
+    ("Jane Doe", "hebo", 16),
+    ("jane@example.com", "helv", 10),
+    ("Experience", "helv", 10),  # plain title case, same size as the body
+    ("Software Engineer at Acme Corp", "helv", 10),
+    ("Built Python services on AWS", "helv", 10),
+    ("Skills", "helv", 10),
+    ("Python, SQL, Docker", "helv", 10),
+    ("ACHIEVEMENTS", "hebo", 13),
+    ("Won a hackathon", "helv", 10),
+])
+
+
+def test_unstyled_title_case_headings_are_detected():
+    sections = extract_pdf_layout(RESUME).sections
+    assert sections["experience"] == ["Software Engineer at Acme Corp", "Built Python services on AWS"]
+    assert sections["skills"] == ["Python, SQL, Docker"]
+    assert "Won a hackathon" not in sections["skills"]
+    assert sections["preamble"] == ["Jane Doe", "jane@example.com"]
+
+
+def test_layout_flag_on_parse_paths():
+    parsed = parse_resume_auto(RESUME, "cv.pdf", layout=True)
+    assert "Python" in " ".join(map(str, parsed.get("skills", [])))
+    doc = ingest_resume(RESUME, "cv.pdf", layout=True)
+    assert doc.parsed == parsed
+
+
+DATA = {
+    "name": "Jane Doe",
+    "contact": "jane@example.com | +91 98765 43210",
+    "summary": "Backend engineer building data services.",
+    "skills": ["Python", "SQL", "Docker"],
+    "experience": [{"role": "Software Engineer", "company": "Acme Corp", "duration": "2021 - 2024",
+                    "details": ["Built Python services on AWS", "Cut latency by 40%"]}],
+    "projects": [{"name": "Resume Ranker", "details": ["Ranked resumes with FastAPI"]}],
+    "education": [{"degree": "Bachelor of Technology", "university": "IIT",
+                   "start_year": "2017", "end_year": "2021"}],
+    "certifications": ["AWS Certified Developer"],
+}
+
+
+def _line(x0, x1, y, text):
+    return _Line(x0, x1, y - 10, y, y, text, 10.0, False)
+
+
+def test_two_column_page_is_read_column_by_column():
+    # the content stream runs row by row across the sidebar and the main column
+    pdf = build_two_column_pdf(DATA).getvalue()
+    text_mode = split_lines(extract_text_auto(pdf, "cv.pdf"))
+    assert text_mode.index("SUMMARY") < text_mode.index("Python, SQL, Docker")
+
+    sections = extract_pdf_layout(pdf).sections
+    assert sections["preamble"] == ["Jane Doe", "jane@example.com | +91 98765 43210"]
+    assert sections["skills"] == ["Python, SQL, Docker"]
+    assert sections["summary"] == ["Backend engineer building data services."]
+    assert sections["experience"] == ["Software Engineer – Acme Corp (2021 - 2024)",
+                                      "• Built Python services on AWS", "• Cut latency by 40%"]
+    assert sections["education"] == ["Bachelor of Technology — IIT", "2017 – 2021"]
+    assert sections["certifications"] == ["• AWS Certified Developer"]
+
+
+def test_single_column_page_keeps_text_mode_order():
+    pdf = build_pdf_resume(DATA).getvalue()
+    # text mode puts a bullet glyph on its own line; layout mode joins it to its row
+    text_mode = " ".join(split_lines(extract_text_auto(pdf, "cv.pdf")))
+    assert " ".join(extract_pdf_layout(pdf).lines) == text_mode
+
+
+def test_reading_order():
+    single = [_line(50, 400, y, f"line {y}") for y in (100, 120, 140, 160)]
+    assert _reading_order(list(reversed(single)), 600) == single
+
+    header = _line(150, 450, 60, "Jane Doe")
+    left = [_line(40, 200, y, f"left {y}") for y in (100, 120, 140)]
+    right = [_line(250, 560, y, f"right {y}") for y in (100, 120, 140)]
+    rows = [header] + [ln for pair in zip(left, right) for ln in pair]
+    assert _reading_order(rows, 600) == [header] + left + right
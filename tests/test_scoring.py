@@ -0,0 +1,58 @@
+import pytest
+
+from scoring import (BM25Engine, CorpusIndex, PhraseEngine, TfidfEngine, get_engine, normalize_tokens,
+                     rank_corpus)
+
+JD = "Python developer with machine learning, Docker and AWS experience"
+RESUMES = {
+    "partial": "Java developer who used Docker at scale",
+    "none": "Graphic designer skilled in Photoshop and Illustrator",
+    "strong": "Python developer: machine learning models on AWS, shipped with Docker",
+}
+
+
+@pytest.fixture
+def index():
+    index = CorpusIndex(ngram=2)
+    index.add_many(RESUMES.items())
+    return index
+
+
+def test_get_engine():
+    assert isinstance(get_engine("tfidf"), TfidfEngine)
+    assert isinstance(get_engine("bm25", k1=1.2), BM25Engine)
+    assert isinstance(get_engine("phrase"), PhraseEngine)
+    with pytest.raises(ValueError):
+        get_engine("cosine")
+
+
+def test_normalize_tokens_strips_punctuation_and_stopwords():
+    assert normalize_tokens("Python, C++ and Node.js.") == ["python", "c++", "node.js"]
+
+
+@pytest.mark.parametrize("engine", ["tfidf", "bm25", "phrase"])
+def test_engines_rank_the_strongest_match_first(index, engine):
+    ranked = rank_corpus(index, JD, engine=engine, top_k=None)
+    assert [r["id"] for r in ranked] == ["strong", "partial"]  # "none" matches no term
+    assert ranked[0]["score"] > ranked[1]["score"] > 0
+    assert "python" in ranked[0]["matched"] and "python" in ranked[1]["missing"]
+
+
+def test_phrase_scores_are_percentages(index):
+    engine = PhraseEngine()
+    for result in engine.rank(index, JD, top_k=None):
+        assert 0 < result["score"] <= 100
+    assert engine.score(JD, JD) == 100
+    assert engine.score("Photoshop", JD) == 0
+
+
+def test_remove_drops_a_document(index):
+    index.remove("strong")
+    assert "strong" not in index and len(index) == 2
+    assert [r["id"] for r in rank_corpus(index, JD)] == ["partial"]
+
+
+def test_saved_index_ranks_the_same(index, tmp_path):
+    path = str(tmp_path / "index.json")
+    index.save(path)
+    assert rank_corpus(CorpusIndex.load(path), JD) == rank_corpus(index, JD)
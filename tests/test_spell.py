@@ -0,0 +1,32 @@
+import pytest
+
+from spell import correct_text, get_corrector
+
+
+@pytest.fixture(scope="module")
+def corrector():
+    return get_corrector()
+
+
+@pytest.mark.parametrize("word", [
+    "python", "Python", "Pyhton", "teams", "skills", "leveraged", "excel", "Optimised", "optimised",
+    "Mumbai", "Kubernetes", "APIs", "planned", "stakeholders",
+])
+def test_known_and_capitalized_words_are_kept(corrector, word):
+    assert corrector._correct_word(word) == word
+
+
+@pytest.mark.parametrize("typo, fixed", [
+    ("enginer", "engineer"),
+    ("pyhton", "python"),
+    ("recieved", "received"),
+    ("experiance", "experience"),
+    ("managment", "management"),
+])
+def test_lowercase_typos_are_corrected(corrector, typo, fixed):
+    assert corrector._correct_word(typo) == fixed
+
+
+def test_identifiers_and_spacing_are_untouched():
+    text = "Built node.js and C++ services on S3,  recieved awards."
+    assert correct_text(text) == "Built node.js and C++ services on S3,  received awards."